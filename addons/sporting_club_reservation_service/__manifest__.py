@@ -59,13 +59,17 @@
         'views/sport_club_promotion_views.xml',
         'views/sport_club_equipments_view.xml',
         'views/sport_club_reservation_views.xml',
+        'views/sport_club_reservation_series_views.xml',
+        'views/sport_club_reservation_job_views.xml',
         'views/sport_club_trainer_views.xml',
         'views/sport_club_training_session_views.xml',
         'views/sport_club_equipment_booking_views.xml',
         'wizard/generate_calendar_times_view.xml',
+        'wizard/promotion_coupon_generator_view.xml',
         'wizard/reservation_revenue_wizard_view.xml',
         'wizard/sport_club_reports_view.xml',
         'wizard/sport_club_facility_reports_view.xml',
+        'views/sport_club_occupancy_heatmap_views.xml',
 
         'report/report_template_base.xml',
 
@@ -77,8 +81,14 @@
 
         'views/menus.xml',
     ],
+    'assets': {
+        'web.assets_backend': [
+            'sporting_club_reservation_service/static/src/js/occupancy_heatmap.js',
+            'sporting_club_reservation_service/static/src/xml/occupancy_heatmap.xml',
+        ],
+    },
     'external_dependencies': {
-        'python': ['jwt'],
+        'python': ['jwt', 'numpy'],
     },
 
     'application': True,
@@ -7,4 +7,7 @@ from . import promotion_model_api
 from . import trainers_model_api
 from . import calendar_model_api
 from . import reservation_model_api
+from . import availability_model_api
+from . import slot_hold_model_api
+from . import occupancy_heatmap_model_api
 from . import general_apis
\ No newline at end of file
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+from .utils import *
+from odoo import api, models, fields, _
+from odoo.exceptions import ValidationError
+from ..models.sport_club_availability import sweep_overlapping_keys
+
+MAX_AVAILABILITY_RANGE_DAYS = 62
+
+
+class SportClubAvailability(models.AbstractModel):
+    _inherit = "sport.club.availability"
+
+    @api.model
+    def _api_get_availability(self, club_id, date_from, date_to, facility_ids=None, sport_id=None):
+        """
+        Free/busy matrix of several facilities over a date range.
+        Calendar lines, exceptions and reservations are fetched with one query per model.
+        """
+        if not club_id:
+            raise ValidationError(_("Club is required."))
+        date_from = fields.Date.to_date(date_from)
+        date_to = fields.Date.to_date(date_to or date_from)
+        if not date_from:
+            raise ValidationError(_("Start date is required."))
+        if date_to < date_from:
+            raise ValidationError(_("The end date must be later than the start date."))
+        if (date_to - date_from).days >= MAX_AVAILABILITY_RANGE_DAYS:
+            raise ValidationError(_("The date range cannot exceed %s days.") % MAX_AVAILABILITY_RANGE_DAYS)
+
+        facilities = self._get_sport_facilities(int(club_id), sport_id=sport_id and int(sport_id))
+        if facility_ids:
+            facilities = facilities.filtered(lambda f: f.id in facility_ids)
+
+        data = self._load_range_data(int(club_id), facilities.ids, date_from, date_to, sport_id=sport_id and int(sport_id))
+
+        days = [date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1)]
+        matrix = {}
+        for facility in facilities:
+            calendar_id = data['calendars'].get(facility.id)
+            facility_days = {}
+            for day in days:
+                slots = data['slots'].get((calendar_id, day.weekday()), []) if calendar_id else []
+                closed = self._get_closed_slot_keys(calendar_id, day, slots) if slots else set()
+                busy = sweep_overlapping_keys(slots, data['busy'].get((facility.id, day), []))
+                facility_days[str(day)] = [
+                    [
+                        float_to_time_str_24(start),
+                        float_to_time_str_24(end),
+                        'closed' if line_id in closed else 'busy' if line_id in busy else 'free',
+                    ]
+                    for start, end, line_id in slots
+                ]
+            matrix[str(facility.id)] = facility_days
+
+        return {
+            "club_id": int(club_id),
+            "date_from": str(date_from),
+            "date_to": str(date_to),
+            "facilities": [
+                {"id": facility.id, "name": facility.display_name}
+                for facility in facilities
+            ],
+            "matrix": matrix,
+        }
+
+    @api.model
+    def _api_find_next_free_windows(self, club_id, sport_id, duration_minutes, date_from=None, horizon_days=14, limit=5):
+        if not club_id or not sport_id:
+            raise ValidationError(_("Club and sport are required."))
+        if not duration_minutes or int(duration_minutes) <= 0:
+            raise ValidationError(_("Duration must be a positive number of minutes."))
+        if int(horizon_days) > MAX_AVAILABILITY_RANGE_DAYS:
+            raise ValidationError(_("The search horizon cannot exceed %s days.") % MAX_AVAILABILITY_RANGE_DAYS)
+
+        windows = self._find_next_free_windows(
+            int(club_id),
+            int(sport_id),
+            int(duration_minutes) / 60.0,
+            date_from=date_from,
+            horizon_days=int(horizon_days),
+            limit=int(limit),
+        )
+        facilities = {f.id: f for f in self.env['sport.club.facility'].sudo().browse({w[2] for w in windows})}
+        return [
+            {
+                "facility": {
+                    "id": facility_id,
+                    "name": facilities[facility_id].display_name,
+                },
+                "date": str(day),
+                "time_from": hour_from,
+                "time_to": hour_to,
+                "time_from_24": float_to_time_str_24(hour_from),
+                "time_to_24": float_to_time_str_24(hour_to),
+            }
+            for day, hour_from, facility_id, hour_to in windows
+        ]
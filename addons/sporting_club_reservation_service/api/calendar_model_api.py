@@ -113,34 +113,20 @@ class SportClubCalendarModel(models.Model):
                 vals[field] = data[field]
 
         # ------------------------------------------------------------
-        # Club (resolve by ID or name)
+        # Club & Facility (resolve by ID or name, one query per model)
         # ------------------------------------------------------------
-        if 'club_id' in data and data['club_id']:
-            club_val = data['club_id']
-            club_model = self.env['sport.club.model'].sudo()
+        resolver = NameResolver(self.env)
+        resolver.add('sport.club.model', [data.get('club_id')])
+        resolver.add('sport.club.facility', [data.get('facility_id')])
+        resolver.resolve()
 
-            if isinstance(club_val, int):
-                vals['club_id'] = club_val
-            elif isinstance(club_val, str):
-                club = club_model.search([('name', '=', club_val)], limit=1)
-                if not club:
-                    raise ValidationError(_("Sport Club with name '%s' not found.") % club_val)
-                vals['club_id'] = club.id
+        if 'club_id' in data and data['club_id']:
+            vals['club_id'] = resolver.get('sport.club.model', data['club_id'], label=_("Sport Club"))
 
-        # ------------------------------------------------------------
-        # Facility (resolve by ID or name)
-        # ------------------------------------------------------------
         if 'facility_id' in data and data['facility_id']:
-            fac_val = data['facility_id']
-            fac_model = self.env['sport.club.facility'].sudo()
+            vals['facility_id'] = resolver.get('sport.club.facility', data['facility_id'], label=_("Facility"))
 
-            if isinstance(fac_val, int):
-                vals['facility_id'] = fac_val
-            elif isinstance(fac_val, str):
-                facility = fac_model.search([('name', '=', fac_val)], limit=1)
-                if not facility:
-                    raise ValidationError(_("Facility with name '%s' not found.") % fac_val)
-                vals['facility_id'] = facility.id
+        resolver.check()
 
         # ------------------------------------------------------------
         # Availability Lines (One2many)
@@ -149,6 +135,12 @@ class SportClubCalendarModel(models.Model):
         if 'line_ids' in data and isinstance(data['line_ids'], (list, tuple)):
             line_model = self.env['sport.club.calendar.line'].sudo()
             template_id = data.get('id')  # only present on update
+            existing_lines = {
+                (line['day_of_week'], line['start_time'], line['end_time'])
+                for line in line_model.search_read(
+                    [('calendar_template_id', '=', template_id)], ['day_of_week', 'start_time', 'end_time'],
+                )
+            } if template_id else set()
 
             for line in data['line_ids']:
                 if isinstance(line, dict):
@@ -173,15 +165,8 @@ class SportClubCalendarModel(models.Model):
                         raise ValidationError(_("Invalid end_time format: must be string or float."))
 
                     # ✅ Skip duplicates if same combination already exists
-                    if template_id:
-                        existing_line = line_model.search([
-                            ('calendar_template_id', '=', template_id),
-                            ('day_of_week', '=', day_code),
-                            ('start_time', '=', start_time),
-                            ('end_time', '=', end_time),
-                        ], limit=1)
-                        if existing_line:
-                            continue  # skip duplicate
+                    if (day_code, start_time, end_time) in existing_lines:
+                        continue  # skip duplicate
 
                     # Add to creation list
                     line_commands.append((0, 0, {
@@ -203,23 +188,26 @@ class SportClubCalendarModel(models.Model):
         if 'exception_ids' in data and isinstance(data['exception_ids'], (list, tuple)):
             exc_model = self.env['sport.club.calendar.exception'].sudo()
             template_id = data.get('id')
-
+            existing_exceptions = {
+                (fields.Datetime.to_string(exc['date_from']), fields.Datetime.to_string(exc['date_to']))
+                for exc in exc_model.search_read(
+                    [('calendar_template_id', '=', template_id)], ['date_from', 'date_to'],
+                )
+            } if template_id else set()
+
+            # Exception dates are local to the club of the calendar
+            club_id = vals.get('club_id') or (self.sudo().browse(template_id).club_id.id if template_id else False)
+            tz_name = self.env['sport.club.model'].sudo().browse(club_id or [])._get_tz().zone
             for exc in data['exception_ids']:
                 if isinstance(exc, dict):
-                    date_from = convert_to_utc(exc.get('date_from'))
-                    date_to = convert_to_utc(exc.get('date_to'))
+                    date_from = convert_to_utc(exc.get('date_from'), tz_name)
+                    date_to = convert_to_utc(exc.get('date_to'), tz_name)
                     reason = exc.get('reason')
                     is_closed = exc.get('is_closed', True)
 
                     # ✅ Skip duplicates if same date_from/date_to already exists
-                    if template_id:
-                        existing_exc = exc_model.search([
-                            ('calendar_template_id', '=', template_id),
-                            ('date_from', '=', date_from),
-                            ('date_to', '=', date_to),
-                        ], limit=1)
-                        if existing_exc:
-                            continue  # skip duplicate exception
+                    if (date_from, date_to) in existing_exceptions:
+                        continue  # skip duplicate exception
 
                     exc_commands.append((0, 0, {
                         'date_from': date_from,
@@ -237,6 +225,7 @@ class SportClubCalendarModel(models.Model):
         return vals
 
     def _to_api_dict(self):
+        tz_name = self.club_id._get_tz().zone
         return {
             "id": self.id,
             "name": self.name,
@@ -265,8 +254,8 @@ class SportClubCalendarModel(models.Model):
             "exceptions": [
                 {
                     "id": exc.id,
-                    "date_from": convert_utc_to_local(fields.Datetime.to_string(exc.date_from)) if exc.date_from else None,
-                    "date_to": convert_utc_to_local(fields.Datetime.to_string(exc.date_to)) if exc.date_to else None,
+                    "date_from": convert_utc_to_local(fields.Datetime.to_string(exc.date_from), tz_name) if exc.date_from else None,
+                    "date_to": convert_utc_to_local(fields.Datetime.to_string(exc.date_to), tz_name) if exc.date_to else None,
                     "reason": exc.reason or "",
                     "is_closed": exc.is_closed,
                 }
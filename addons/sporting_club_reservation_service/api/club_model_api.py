@@ -109,117 +109,106 @@ class SportClubModel(models.Model):
             if field in data:
                 vals[field] = data[field]
 
+        def item_names(items):
+            return [item if isinstance(item, str) else item.get('name') for item in items or []]
+
+        # --- Names resolved with one query per model ---
+        resolver = NameResolver(self.env)
+        resolver.add('res.users', [data.get('owner_id')])
+        resolver.add('res.country', [data.get('country_id')])
+        resolver.add('res.country.state', [data.get('governorate_id')])
+        resolver.add('sport.club.sports', item_names(data.get('sport_ids')))
+        resolver.add('ir.attachment', item_names(data.get('attachment_ids')))
+        resolver.resolve()
+
         # --- Owner ---
         if 'owner_id' in data:
-            owner_val = data['owner_id']
-            if isinstance(owner_val, int):
-                vals['owner_id'] = owner_val
-            elif isinstance(owner_val, str):
-                owner_rec = self.env['res.users'].search([('name', '=', owner_val)], limit=1)
-                if owner_rec:
-                    vals['owner_id'] = owner_rec.id
+            owner_id = resolver.get('res.users', data['owner_id'])
+            if owner_id:
+                vals['owner_id'] = owner_id
 
         # --- Country ---
         if 'country_id' in data:
             country_val = data['country_id']
-            if isinstance(country_val, int):
-                vals['country_id'] = country_val
-            elif isinstance(country_val, str):
-                country_rec = self.env['res.country'].search([('name', '=', country_val)], limit=1)
-                if not country_rec:
-                    country_rec = self.env['res.country'].create({'name': country_val})
-                vals['country_id'] = country_rec.id
+            country_id = resolver.get('res.country', country_val)
+            if not country_id and isinstance(country_val, str):
+                country_id = self.env['res.country'].create({'name': country_val}).id
+            if country_id:
+                vals['country_id'] = country_id
 
         # --- Governorate ---
         governorate_id = False
         if 'governorate_id' in data:
             gov_val = data['governorate_id']
-            if isinstance(gov_val, int):
-                governorate_id = gov_val
-            elif isinstance(gov_val, str):
-                gov_rec = self.env['res.country.state'].search([('name', '=', gov_val)], limit=1)
-                if not gov_rec:
-                    gov_rec = self.env['res.country.state'].create({
-                        'name': gov_val,
-                        'country_id': vals.get('country_id')
-                    })
-                governorate_id = gov_rec.id
+            governorate_id = resolver.get('res.country.state', gov_val)
+            if not governorate_id and isinstance(gov_val, str):
+                governorate_id = self.env['res.country.state'].create({
+                    'name': gov_val,
+                    'country_id': vals.get('country_id')
+                }).id
             vals['governorate_id'] = governorate_id
 
         # --- City ---
         city_id = False
         if 'city_id' in data:
             city_val = data['city_id']
-            if isinstance(city_val, int):
-                city_id = city_val
-            elif isinstance(city_val, str):
-                domain = [('name_en', '=', city_val)]
-                if governorate_id:
-                    domain.append(('state_id', '=', governorate_id))
-                city_rec = self.env['res.country.state.cities'].search(domain, limit=1)
-                if not city_rec:
-                    city_rec = self.env['res.country.state.cities'].create({
-                        'name_en': city_val,
-                        'name_ar': city_val,
-                        'state_id': governorate_id,
-                    })
-                city_id = city_rec.id
+            domain = [('state_id', '=', governorate_id)] if governorate_id else []
+            city_id = resolver.get('res.country.state.cities', city_val, field='name_en', domain=domain)
+            if not city_id and isinstance(city_val, str):
+                city_id = self.env['res.country.state.cities'].create({
+                    'name_en': city_val,
+                    'name_ar': city_val,
+                    'state_id': governorate_id,
+                }).id
             vals['city_id'] = city_id
 
         # --- Area ---
         if 'area_id' in data:
             area_val = data['area_id']
-            if isinstance(area_val, int):
-                vals['area_id'] = area_val
-            elif isinstance(area_val, str):
-                domain = [('name', '=', area_val)]
-                if governorate_id:
-                    domain.append(('state_id', '=', governorate_id))
-                if city_id:
-                    domain.append(('city_id', '=', city_id))
-                area_rec = self.env['res.country.state.cities.areas'].search(domain, limit=1)
-                if not area_rec:
-                    area_rec = self.env['res.country.state.cities.areas'].create({
-                        'name': area_val,
-                        'state_id': governorate_id,
-                        'city_id': city_id,
-                    })
-                vals['area_id'] = area_rec.id
+            domain = [('state_id', '=', governorate_id)] if governorate_id else []
+            if city_id:
+                domain.append(('city_id', '=', city_id))
+            area_id = resolver.get('res.country.state.cities.areas', area_val, domain=domain)
+            if not area_id and isinstance(area_val, str):
+                area_id = self.env['res.country.state.cities.areas'].create({
+                    'name': area_val,
+                    'state_id': governorate_id,
+                    'city_id': city_id,
+                }).id
+            if area_id:
+                vals['area_id'] = area_id
 
         # --- Many2many: Sports with Code ---
         if 'sport_ids' in data:
             sport_ids = []
-            for item in data['sport_ids']:
-                sport_name = item if isinstance(item, str) else item.get('name')
+            for sport_name in item_names(data['sport_ids']):
                 if not sport_name:
                     continue
-
-                # Generate code: first letter of first word + first letter of last word
-                words = sport_name.strip().split()
-                first_letter = words[0][0].upper() if words else ''
-                last_letter = words[-1][0].upper() if len(words) > 0 else ''
-                sport_code = f"{first_letter}{last_letter}"
-
-                sport_rec = self.env['sport.club.sports'].search([('name', '=', sport_name)], limit=1)
-                if not sport_rec:
-                    sport_rec = self.env['sport.club.sports'].create({
+                sport_id = resolver.get('sport.club.sports', sport_name)
+                if not sport_id:
+                    # Generate code: first letter of first word + first letter of last word
+                    words = sport_name.strip().split()
+                    first_letter = words[0][0].upper() if words else ''
+                    last_letter = words[-1][0].upper() if len(words) > 0 else ''
+                    sport_id = self.env['sport.club.sports'].create({
                         'name': sport_name,
-                        'code': sport_code
-                    })
-                sport_ids.append(sport_rec.id)
+                        'code': f"{first_letter}{last_letter}"
+                    }).id
+                    resolver.remember('sport.club.sports', sport_name, sport_id)
+                sport_ids.append(sport_id)
             vals['sport_ids'] = [(6, 0, sport_ids)]
 
         # --- Many2many: Attachments ---
         if 'attachment_ids' in data:
             attach_ids = []
-            for item in data['attachment_ids']:
-                attach_name = item if isinstance(item, str) else item.get('name')
+            for attach_name in item_names(data['attachment_ids']):
                 if not attach_name:
                     continue
-                attach_rec = self.env['ir.attachment'].search([('name', '=', attach_name)], limit=1)
-                if not attach_rec:
-                    attach_rec = self.env['ir.attachment'].create({'name': attach_name})
-                attach_ids.append(attach_rec.id)
+                attach_id = resolver.get('ir.attachment', attach_name)
+                if not attach_id:
+                    attach_id = self.env['ir.attachment'].create({'name': attach_name}).id
+                    resolver.remember('ir.attachment', attach_name, attach_id)
+                attach_ids.append(attach_id)
             vals['attachment_ids'] = [(6, 0, attach_ids)]
 
         return vals
@@ -75,27 +75,24 @@ class SportClubFacility(models.Model):
             if field in data:
                 vals[field] = data[field]
 
+        resolver = NameResolver(self.env)
+        resolver.add('sport.club.model', [data.get('sport_club_id')])
+        resolver.add('sport.club.sports', [data.get('sport_id')])
+        resolver.resolve()
+
         if 'sport_club_id' in data:
-            club_val = data['sport_club_id']
-            if isinstance(club_val, int):
-                vals['sport_club_id'] = club_val
-            elif isinstance(club_val, str):
-                club_rec = self.env['sport.club.model'].search([('name', '=', club_val)], limit=1)
-                if not club_rec:
-                    raise ValidationError(_("Sport club '%s' not found.") % club_val)
-                vals['sport_club_id'] = club_rec.id
+            vals['sport_club_id'] = resolver.get('sport.club.model', data['sport_club_id'], label=_("Sport club"))
 
         if 'sport_id' in data:
             sport_val = data['sport_id']
-            if isinstance(sport_val, int):
-                vals['sport_id'] = sport_val
-            elif isinstance(sport_val, str):
-                sport_rec = self.env['sport.club.sports'].search([('name', '=', sport_val)], limit=1)
-                if not sport_rec:
-                    words = sport_val.strip().split()
-                    code = (words[0][0] + (words[-1][0] if len(words) > 1 else words[0][0])).upper()
-                    sport_rec = self.env['sport.club.sports'].create({'name': sport_val, 'code': code})
-                vals['sport_id'] = sport_rec.id
+            sport_id = resolver.get('sport.club.sports', sport_val)
+            if not sport_id and isinstance(sport_val, str):
+                words = sport_val.strip().split()
+                code = (words[0][0] + (words[-1][0] if len(words) > 1 else words[0][0])).upper()
+                sport_id = self.env['sport.club.sports'].create({'name': sport_val, 'code': code}).id
+            vals['sport_id'] = sport_id
+
+        resolver.check()
 
         return vals
 
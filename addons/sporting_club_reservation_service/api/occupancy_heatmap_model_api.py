@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+from .utils import *
+from odoo import api, models, _
+from odoo.exceptions import ValidationError
+
+
+class SportClubOccupancyHeatmap(models.AbstractModel):
+    _inherit = "sport.club.occupancy.heatmap"
+
+    @api.model
+    def _api_get_heatmap(self, club_id, date_from, date_to=None, facility_ids=None):
+        """Hour-by-day occupancy percentages of the facilities of a club."""
+        if not club_id:
+            raise ValidationError(_("Club is required."))
+        club = self.env['sport.club.model'].sudo().browse(int(club_id)).exists()
+        if not club:
+            raise ValidationError(_("Club not found."))
+        domain = [('sport_club_id', '=', club.id)]
+        if facility_ids:
+            domain.append(('id', 'in', facility_ids))
+        facilities = self.env['sport.club.facility'].sudo().search(domain, order='name, id')
+        result = self._compute_heatmap(facilities, date_from, date_to)
+        result["club"] = {"id": club.id, "name": club.display_name}
+        return result
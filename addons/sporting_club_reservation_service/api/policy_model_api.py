@@ -83,13 +83,9 @@ class SportClubPolicy(models.Model):
                 vals[field] = data[field]
 
         if 'club_id' in data:
-            club_val = data['club_id']
-            if isinstance(club_val, int):
-                vals['club_id'] = club_val
-            elif isinstance(club_val, str):
-                club = self.env['sport.club.model'].search([('name', '=', club_val)], limit=1)
-                if club:
-                    vals['club_id'] = club.id
+            club_id = NameResolver(self.env).get('sport.club.model', data['club_id'])
+            if club_id:
+                vals['club_id'] = club_id
 
         return vals
 
@@ -135,53 +135,21 @@ class SportClubPricingRule(models.Model):
             if field in data:
                 vals[field] = data[field]
 
-        if 'sport_club_id' in data and data['sport_club_id']:
-            club_val = data['sport_club_id']
-            club_model = self.env['sport.club.model'].sudo()
-
-            if isinstance(club_val, int):
-                vals['sport_club_id'] = club_val
-            elif isinstance(club_val, str):
-                club = club_model.search([('name', '=', club_val)], limit=1)
-                if not club:
-                    raise ValidationError(_("Sport Club with name '%s' not found.") % club_val)
-                vals['sport_club_id'] = club.id
-
-        if 'sport_id' in data and data['sport_id']:
-            sport_val = data['sport_id']
-            sport_model = self.env['sport.club.sports'].sudo()
-
-            if isinstance(sport_val, int):
-                vals['sport_id'] = sport_val
-            elif isinstance(sport_val, str):
-                sport = sport_model.search([('name', '=', sport_val)], limit=1)
-                if not sport:
-                    raise ValidationError(_("Sport with name '%s' not found.") % sport_val)
-                vals['sport_id'] = sport.id
-
-        if 'facility_id' in data and data['facility_id']:
-            fac_val = data['facility_id']
-            fac_model = self.env['sport.club.facility'].sudo()
-
-            if isinstance(fac_val, int):
-                vals['facility_id'] = fac_val
-            elif isinstance(fac_val, str):
-                facility = fac_model.search([('name', '=', fac_val)], limit=1)
-                if not facility:
-                    raise ValidationError(_("Facility with name '%s' not found.") % fac_val)
-                vals['facility_id'] = facility.id
-
-        if 'tax_id' in data and data['tax_id']:
-            tax_val = data['tax_id']
-            tax_model = self.env['account.tax'].sudo()
-
-            if isinstance(tax_val, int):
-                vals['tax_id'] = tax_val
-            elif isinstance(tax_val, str):
-                tax = tax_model.search([('name', '=', tax_val)], limit=1)
-                if not tax:
-                    raise ValidationError(_("Tax with name '%s' not found.") % tax_val)
-                vals['tax_id'] = tax.id
+        resolver = NameResolver(self.env)
+        references = [
+            ('sport_club_id', 'sport.club.model', _("Sport Club")),
+            ('sport_id', 'sport.club.sports', _("Sport")),
+            ('facility_id', 'sport.club.facility', _("Facility")),
+            ('tax_id', 'account.tax', _("Tax")),
+        ]
+        for field, model, _label in references:
+            resolver.add(model, [data.get(field)])
+        resolver.resolve()
+
+        for field, model, label in references:
+            if field in data and data[field]:
+                vals[field] = resolver.get(model, data[field], label=label)
+        resolver.check()
 
         return vals
 
@@ -116,41 +116,22 @@ class SportClubPromotion(models.Model):
             if field in data:
                 vals[field] = data[field]
 
-        if 'club_id' in data and data['club_id']:
-            club_val = data['club_id']
-            club_model = self.env['sport.club.model'].sudo()
+        resolver = NameResolver(self.env)
+        resolver.add('sport.club.model', [data.get('club_id')])
+        resolver.add('sport.club.sports', data.get('sport_ids'))
+        resolver.add('sport.club.facility', data.get('facility_ids'))
+        resolver.resolve()
 
-            if isinstance(club_val, int):
-                vals['club_id'] = club_val
-            elif isinstance(club_val, str):
-                club = club_model.search([('name', '=', club_val)], limit=1)
-                if not club:
-                    raise ValidationError(_("Club with name '%s' not found.") % club_val)
-                vals['club_id'] = club.id
+        if 'club_id' in data and data['club_id']:
+            vals['club_id'] = resolver.get('sport.club.model', data['club_id'], label=_("Club"))
 
         if 'sport_ids' in data and data['sport_ids']:
-            sport_model = self.env['sport.club.sports'].sudo()
-            sport_ids = []
-            for val in data['sport_ids']:
-                if isinstance(val, int):
-                    sport_ids.append(val)
-                elif isinstance(val, str):
-                    sport = sport_model.search([('name', '=', val)], limit=1)
-                    if sport:
-                        sport_ids.append(sport.id)
-            vals['sport_ids'] = [(6, 0, sport_ids)]
+            vals['sport_ids'] = [(6, 0, resolver.get_many('sport.club.sports', data['sport_ids']))]
 
         if 'facility_ids' in data and data['facility_ids']:
-            fac_model = self.env['sport.club.facility'].sudo()
-            fac_ids = []
-            for val in data['facility_ids']:
-                if isinstance(val, int):
-                    fac_ids.append(val)
-                elif isinstance(val, str):
-                    facility = fac_model.search([('name', '=', val)], limit=1)
-                    if facility:
-                        fac_ids.append(facility.id)
-            vals['facility_ids'] = [(6, 0, fac_ids)]
+            vals['facility_ids'] = [(6, 0, resolver.get_many('sport.club.facility', data['facility_ids']))]
+
+        resolver.check()
 
         return vals
 
@@ -1,8 +1,21 @@
 # -*- coding: utf-8 -*-
 from .utils import *
 from odoo import api, models, fields, _
+from ..models.sport_club_availability import find_overlap, local_to_utc
+from ..models.qr_code import qr_etag
 from odoo.exceptions import ValidationError, UserError
 
+MAX_BATCH_SIZE = 500
+
+# Fields copied as-is from a batch item
+BATCH_BASIC_FIELDS = ['state', 'source', 'time_from', 'time_to', 'notes', 'number_of_attandance',
+                      'partner_include_attendance', 'color']
+
+# Optional relations of a batch item still resolved through _from_api_dict
+BATCH_EXTRA_FIELDS = ['trainer_id', 'pricing_rule_id', 'policy_id', 'promotion_id', 'coupon_code',
+                      'attendance_ids', 'equipment_line_ids']
+
+
 class SportClubReservation(models.Model):
     _inherit = "sport.club.reservation"
 
@@ -17,8 +30,162 @@ class SportClubReservation(models.Model):
 
         vals_data = self._from_api_dict(vals)
         resv = Reservation.create(vals_data)
+        # The hold protected the slot until now, the reservation takes over
+        self.env['sport.club.slot.hold']._release(vals.get('hold_token'))
         return resv._to_api_dict()
 
+    # ============================================================
+    # Batch Creation
+    # ============================================================
+    @api.model
+    def _api_create_reservations_batch(self, items):
+        """
+        Create several reservations at once.
+        Clubs, facilities, sports and players are resolved with one search per model,
+        slots and overlaps are validated for the whole batch (against the stored
+        occupancy and between the items themselves) and the valid items are created
+        with a single create(). Errors are reported per item.
+        """
+        if not isinstance(items, list) or not items:
+            raise ValidationError(_("A non-empty list of reservations is required."))
+        if len(items) > MAX_BATCH_SIZE:
+            raise ValidationError(_("A batch cannot contain more than %s reservations.") % MAX_BATCH_SIZE)
+
+        errors = {index: [] for index in range(len(items))}
+        references = self._search_batch_references(items)
+
+        vals_by_index = {}
+        for index, item in enumerate(items):
+            try:
+                vals_by_index[index] = self._batch_item_vals(item, references)
+            except (ValidationError, UserError, ValueError, TypeError) as e:
+                errors[index].append(str(e))
+
+        hold_tokens = [item['hold_token'] for item in items if isinstance(item, dict) and item.get('hold_token')]
+        for index, (_reason, message, _reservation_id) in self._check_slots_batch(vals_by_index, hold_tokens).items():
+            errors[index].append(message)
+
+        valid = [index for index in vals_by_index if not errors[index]]
+        for index in valid:
+            extra = {field: items[index][field] for field in BATCH_EXTRA_FIELDS if items[index].get(field)}
+            if not extra:
+                continue
+            try:
+                extra['club_id'] = vals_by_index[index]['club_id']
+                vals_by_index[index].update(self._from_api_dict(extra))
+            except (ValidationError, UserError) as e:
+                errors[index].append(str(e))
+
+        records = self._create_batch([index for index in valid if not errors[index]], vals_by_index, errors)
+        consumed = [items[index]['hold_token'] for index in records if items[index].get('hold_token')]
+        if consumed:
+            self.env['sport.club.slot.hold'].sudo().search([('token', 'in', consumed)]).unlink()
+
+        results = []
+        for index in range(len(items)):
+            if index in records:
+                results.append({"index": index, "success": True, "reservation": records[index]._to_api_dict()})
+            else:
+                results.append({"index": index, "success": False, "errors": errors[index]})
+        return {
+            "total": len(items),
+            "created": len(records),
+            "failed": len(items) - len(records),
+            "results": results,
+        }
+
+    @api.model
+    def _search_batch_references(self, items):
+        """
+        Resolve every club, facility, sport and player referenced by a batch,
+        by id or by name, with one search per model.
+        """
+        def collect(field):
+            return [item[field] for item in items if isinstance(item, dict) and item.get(field)]
+
+        def search(model, values, fields_list):
+            ids = [value for value in values if isinstance(value, int)]
+            names = [value for value in values if isinstance(value, str)]
+            if not ids and not names:
+                return []
+            return self.env[model].sudo().search_read(
+                ['|', ('id', 'in', ids), ('name', 'in', names)], fields_list
+            )
+
+        references = {}
+        for key, model, field, fields_list in [
+            ('clubs', 'sport.club.model', 'club_id', ['name', 'sport_ids']),
+            ('facilities', 'sport.club.facility', 'facility_id', ['name', 'sport_club_id']),
+            ('sports', 'sport.club.sports', 'sport_id', ['name']),
+            ('players', 'res.partner', 'player_id', ['name']),
+        ]:
+            by_id, by_name = {}, {}
+            for record in search(model, collect(field), fields_list):
+                by_id[record['id']] = record
+                by_name.setdefault(record['name'], record)
+            references[key] = (by_id, by_name)
+
+        # Facility names are unique per club, prefer the facility of the item's club
+        references['club_facilities'] = {
+            (record['sport_club_id'][0], record['name']): record
+            for record in references['facilities'][0].values() if record['sport_club_id']
+        }
+        return references
+
+    @api.model
+    def _batch_item_vals(self, item, references):
+        """Build the create values of one batch item from the pre-resolved references."""
+        if not isinstance(item, dict):
+            raise ValidationError(_("Each reservation must be a JSON object."))
+
+        required = ['club_id', 'facility_id', 'date', 'time_from', 'time_to']
+        missing = [f for f in required if item.get(f) in (None, False, '')]
+        if missing:
+            raise ValidationError(_("Missing required fields: %s") % ', '.join(missing))
+
+        def lookup(key, value):
+            by_id, by_name = references[key]
+            return by_id.get(value) if isinstance(value, int) else by_name.get(value)
+
+        vals = {field: item[field] for field in BATCH_BASIC_FIELDS if field in item}
+        vals['date'] = fields.Date.to_date(item['date'])
+        vals['time_from'] = float(vals['time_from'])
+        vals['time_to'] = float(vals['time_to'])
+        if vals['time_from'] >= vals['time_to']:
+            raise ValidationError(_("Start time must be earlier than end time."))
+
+        club = lookup('clubs', item['club_id'])
+        if not club:
+            raise ValidationError(_("Club '%s' not found.") % item['club_id'])
+        vals['club_id'] = club['id']
+
+        facility_val = item['facility_id']
+        if isinstance(facility_val, str):
+            facility = references['club_facilities'].get((club['id'], facility_val)) or lookup('facilities', facility_val)
+        else:
+            facility = lookup('facilities', facility_val)
+        if not facility:
+            raise ValidationError(_("Facility '%s' not found.") % facility_val)
+        if not facility['sport_club_id'] or facility['sport_club_id'][0] != club['id']:
+            raise ValidationError(_("Facility '%s' does not belong to the selected club.") % facility['name'])
+        vals['facility_id'] = facility['id']
+
+        if item.get('sport_id'):
+            sport = lookup('sports', item['sport_id'])
+            if not sport:
+                raise ValidationError(_("Sport '%s' not found.") % item['sport_id'])
+            if sport['id'] not in club['sport_ids']:
+                raise ValidationError(_("Sport '%s' is not offered by the selected club.") % sport['name'])
+            vals['sport_id'] = sport['id']
+
+        if item.get('player_id'):
+            player = lookup('players', item['player_id'])
+            if not player:
+                raise ValidationError(_("Player '%s' not found.") % item['player_id'])
+            vals['player_id'] = player['id']
+
+        return vals
+
     @api.model
     def _api_search_reservations(self, domain=None, limit=100, offset=0):
         Reservation = self.env['sport.club.reservation'].sudo()
@@ -34,6 +201,21 @@ class SportClubReservation(models.Model):
             raise UserError(_("Reservation not found."))
         return resv._to_api_dict()
 
+    @api.model
+    def _api_get_attendee_qr(self, code, attendee_id):
+        """
+        QR code of an attendee of a confirmed reservation.
+        :return: tuple (etag, png bytes)
+        """
+        resv = self.env['sport.club.reservation'].sudo().search([('code', '=', code)], limit=1)
+        if not resv or resv.state != 'confirmed':
+            raise UserError(_("Reservation not found."))
+        attendee = resv.attendance_ids.filtered(lambda p: p.id == int(attendee_id))
+        if not attendee:
+            raise UserError(_("Attendee not found."))
+        key, png = resv._get_attendee_qr_png(attendee)
+        return qr_etag(key), png
+
     @api.model
     def _api_filter_reservations_with_keyword(self, keyword):
         if not keyword:
@@ -103,88 +285,87 @@ class SportClubReservation(models.Model):
         if data.get('date'):
             vals['date'] = data['date'] if isinstance(data['date'], str) else data['date']
 
+        # Every name of the payload is resolved with one query per model
+        resolver = NameResolver(self.env)
+        resolver.add('sport.club.model', [data.get('club_id')])
+        resolver.add('sport.club.facility', [data.get('facility_id')])
+        resolver.add('sport.club.sports', [data.get('sport_id')])
+        resolver.add('res.partner', [data.get('player_id')])
+        resolver.add('sport.club.trainer', [data.get('trainer_id')], field='partner_id.name')
+        resolver.add('sport.club.pricing.rule', [data.get('pricing_rule_id')])
+        resolver.add('sport.club.promotion', [data.get('promotion_id')])
+        resolver.add('product.product', [
+            eq.get('equipment_product_id') for eq in data.get('equipment_line_ids') or [] if isinstance(eq, dict)
+        ])
+        resolver.resolve()
+
         # Club
         if data.get('club_id'):
-            club_val = data['club_id']
-            Club = self.env['sport.club.model'].sudo()
-            if isinstance(club_val, int):
-                vals['club_id'] = club_val
-            else:
-                club = Club.search([('name', '=', club_val)], limit=1)
-                if not club:
-                    raise ValidationError(_("Club '%s' not found.") % club_val)
-                vals['club_id'] = club.id
+            vals['club_id'] = resolver.get('sport.club.model', data['club_id'], label=_("Club"))
 
         # Facility
         if data.get('facility_id'):
-            fac_val = data['facility_id']
-            Fac = self.env['sport.club.facility'].sudo()
-            if isinstance(fac_val, int):
-                vals['facility_id'] = fac_val
-            else:
-                fac = Fac.search([('name', '=', fac_val)], limit=1)
-                if not fac:
-                    raise ValidationError(_("Facility '%s' not found.") % fac_val)
-                vals['facility_id'] = fac.id
+            vals['facility_id'] = resolver.get('sport.club.facility', data['facility_id'], label=_("Facility"))
 
+        resolver.check()
 
         if vals.get('facility_id') and vals.get('date') and vals.get('time_from') is not None and vals.get('time_to') is not None:
-            weekday_number = fields.Date.from_string(vals['date']).weekday()
-            current_calendar = self.env['sport.club.calendar'].search([
-                ('club_id', '=', vals['club_id']),
-                ('facility_id', '=', vals['facility_id'])
-            ], limit=1)
+            # Serialize with concurrent holds/bookings of the same facility day
+            self.env['sport.club.slot.hold']._lock_facility_day(vals['facility_id'], vals['date'])
+            Availability = self.env['sport.club.availability']
+            current_calendar = Availability._get_calendar(vals['club_id'], vals['facility_id'])
 
             if not current_calendar:
                 raise ValidationError(_("No calendar found for the selected club and facility."))
 
-            slots = self.env['sport.club.calendar.line'].search([
-                ('day_of_week', '=', str(weekday_number)),
-                ('calendar_template_id', '=', current_calendar.id),
-            ])
-
-            valid_slot = False
-            for slot in slots:
-                if vals['time_from'] >= slot.start_time and vals['time_to'] <= slot.end_time:
-                    valid_slot = True
-                    break
-
+            weekday_number = fields.Date.from_string(vals['date']).weekday()
+            valid_slot = self.env['sport.club.calendar']._template_contains(
+                current_calendar.id, weekday_number, vals['time_from'], vals['time_to']
+            )
             if not valid_slot:
                 raise ValidationError(_("Selected time %s-%s does not match any available calendar slot.") %
                                       (vals['time_from'], vals['time_to']))
 
-            reservation_domain = [
-                ('facility_id', '=', vals['facility_id']),
-                ('date', '=', vals['date']),
-                ('state', 'in', ['requested', 'confirmed', 'checked_in']),
-                ('time_from', '<', vals['time_to']),
-                ('time_to', '>', vals['time_from']),
-            ]
-            if vals.get('sport_id'):
-                reservation_domain.append(('sport_id', '=', vals['sport_id']))
-            if data.get('id'):
-                reservation_domain.append(('id', '!=', data['id']))
-
-            overlapping = self.env['sport.club.reservation'].search(reservation_domain, limit=1)
-            if overlapping:
+            if Availability._is_closed(current_calendar.id, fields.Date.to_date(vals['date']), vals['time_from'], vals['time_to']):
+                raise ValidationError(_("The facility is closed on %s between %s and %s.") %
+                                      (vals['date'], vals['time_from'], vals['time_to']))
+
+            date = fields.Date.to_date(vals['date'])
+            tz = Availability._get_tz(vals['club_id'])
+            booked = self.env['sport.club.reservation']._search_booked_intervals(
+                vals['facility_id'],
+                local_to_utc(date, vals['time_from'], tz),
+                local_to_utc(date, vals['time_to'], tz),
+                sport_id=vals.get('sport_id'),
+                exclude_ids=[data['id']] if data.get('id') else None,
+            )
+            if booked:
+                overlapping = self.env['sport.club.reservation'].browse(booked[0][2])
                 raise ValidationError(_(
                     "The selected time overlaps with an existing reservation "
                     "(Reservation: %s, Time: %s-%s)"
                 ) % (overlapping.name, overlapping.time_from, overlapping.time_to))
 
+            holds = self.env['sport.club.slot.hold']._get_active_intervals(
+                [vals['facility_id']],
+                date,
+                exclude_tokens=[data['hold_token']] if data.get('hold_token') else None,
+            )
+            holds = [
+                interval for interval in holds.get((vals['facility_id'], date), [])
+                if interval[3] == (vals.get('sport_id') or False)
+            ]
+            if find_overlap(holds, vals['time_from'], vals['time_to']):
+                raise ValidationError(_("The selected time is currently held by another customer."))
+
         # Sport
         if data.get('sport_id'):
             sport_val = data['sport_id']
             Sport = self.env['sport.club.sports'].sudo()
-            if isinstance(sport_val, int):
-                sport = Sport.browse(sport_val)
-                if not sport.exists():
-                    raise ValidationError(_("Sport with ID %s not found.") % sport_val)
-            else:
-                sport = Sport.search([('name', '=', sport_val)], limit=1)
-                if not sport:
-                    raise ValidationError(_("Sport '%s' not found.") % sport_val)
-            if 'club_id' in vals and vals['club_id']:
+            sport = Sport.browse(resolver.get('sport.club.sports', sport_val, label=_("Sport")))
+            if isinstance(sport_val, int) and not sport.exists():
+                raise ValidationError(_("Sport with ID %s not found.") % sport_val)
+            if sport and 'club_id' in vals and vals['club_id']:
                 if sport.id not in self.env['sport.club.model'].browse(vals['club_id']).sport_ids.ids:
                     raise ValidationError(
                         _("Sport '%s' is not offered by the selected club.") % sport.display_name
@@ -193,41 +374,22 @@ class SportClubReservation(models.Model):
 
         # Player
         if data.get('player_id'):
-            player_val = data['player_id']
-            Partner = self.env['res.partner'].sudo()
-            if isinstance(player_val, int):
-                vals['player_id'] = player_val
-            else:
-                player = Partner.search([('name', '=', player_val)], limit=1)
-                if not player:
-                    raise ValidationError(_("Player '%s' not found.") % player_val)
-                vals['player_id'] = player.id
+            vals['player_id'] = resolver.get('res.partner', data['player_id'], label=_("Player"))
 
         # Trainer
         if data.get('trainer_id'):
-            trainer_val = data['trainer_id']
-            Trainer = self.env['sport.club.trainer'].sudo()
-            if isinstance(trainer_val, int):
-                vals['trainer_id'] = trainer_val
-            else:
-                trainer = Trainer.search([('partner_id.name', '=', trainer_val)], limit=1)
-                if not trainer:
-                    raise ValidationError(_("Trainer '%s' not found.") % trainer_val)
-                vals['trainer_id'] = trainer.id
+            vals['trainer_id'] = resolver.get(
+                'sport.club.trainer', data['trainer_id'], field='partner_id.name', label=_("Trainer")
+            )
 
         # Pricing rule
         if data.get('pricing_rule_id'):
             rule_val = data['pricing_rule_id']
             Rule = self.env['sport.club.pricing.rule'].sudo()
-            if isinstance(rule_val, int):
-                rule = Rule.browse(rule_val)
-                if not rule.exists():
-                    raise ValidationError(_("Pricing Rule with ID %s not found.") % rule_val)
-            else:
-                rule = Rule.search([('name', '=', rule_val)], limit=1)
-                if not rule:
-                    raise ValidationError(_("Pricing Rule '%s' not found.") % rule_val)
-            if rule.state != 'open':
+            rule = Rule.browse(resolver.get('sport.club.pricing.rule', rule_val, label=_("Pricing Rule")))
+            if isinstance(rule_val, int) and not rule.exists():
+                raise ValidationError(_("Pricing Rule with ID %s not found.") % rule_val)
+            if rule and rule.state != 'open':
                 raise ValidationError(
                     _("Pricing Rule '%s' is not open (current state: %s).") % (rule.display_name, rule.state)
                 )
@@ -243,67 +405,45 @@ class SportClubReservation(models.Model):
                     raise ValidationError(_("Policy with ID %s not found.") % policy_val)
                 vals['policy_id'] = policy.id
             else:
-                policy = Policy.search([('club_id', '=', vals['club_id']), ('name', '=', policy_val)], limit=1)
-                if not policy:
-                    raise ValidationError(_("Policy '%s' not found.") % policy_val)
-                vals['policy_id'] = policy.id
+                vals['policy_id'] = resolver.get(
+                    'sport.club.policy', policy_val, domain=[('club_id', '=', vals.get('club_id'))],
+                    label=_("Policy"),
+                )
 
         # Promotion
         if data.get('promotion_id'):
-            promo_val = data['promotion_id']
-            Promo = self.env['sport.club.promotion'].sudo()
-            if isinstance(promo_val, int):
-                vals['promotion_id'] = promo_val
-            else:
-                promo = Promo.search([('name', '=', promo_val)], limit=1)
-                if promo:
-                    vals['promotion_id'] = promo.id
+            promo_id = resolver.get('sport.club.promotion', data['promotion_id'])
+            if promo_id:
+                vals['promotion_id'] = promo_id
+
+        # Coupon (redeemed once the reservation is written)
+        if data.get('coupon_code'):
+            vals['coupon_code'] = str(data['coupon_code']).strip()
 
-        # Attendance
+        # Attendance (matched and created in bulk)
         if data.get('attendance_ids'):
-            Partner = self.env['res.partner'].sudo()
-            partner_ids = []
-            reservation_id = data.get('id', False)
-            for val in data['attendance_ids']:
-                if isinstance(val, dict):
-                    name = val.get('name')
-                    email = val.get('email')
-                    mobile = val.get('mobile')
-                    if not name:
-                        continue
-                    partner = Partner.search([('name', '=', name), ('email', '=', email), ('mobile', '=', mobile)],
-                                             limit=1)
-                    if not partner:
-                        partner = Partner.create({
-                            'name': name,
-                            'email': email,
-                            'mobile': mobile,
-                        })
-                    partner_ids.append(partner.id)
-            vals['attendance_ids'] = [(6, 0, partner_ids)]
+            attendees = [val for val in data['attendance_ids'] if isinstance(val, dict)]
+            partner_ids = self.env['res.partner'].sudo()._match_or_create_attendees(attendees)
+            vals['attendance_ids'] = [(6, 0, list(dict.fromkeys(partner_ids)))]
 
         # Equipment
         if data.get('equipment_line_ids'):
             equip_commands = []
             reservation_id = data.get('id', False)
             Equipment = self.env['sport.club.equipment.booking'].sudo()
-            Product = self.env['product.product'].sudo()
+            # Existing lines of the reservation by product, to update instead of duplicating
+            existing_lines = {
+                line['equipment_product_id'][0]: line['id']
+                for line in Equipment.search_read(
+                    [('reservation_id', '=', reservation_id), ('equipment_product_id', '!=', False)],
+                    ['equipment_product_id'],
+                )
+            } if reservation_id else {}
             for eq in data['equipment_line_ids']:
                 if isinstance(eq, dict):
-                    prod_val = eq.get('equipment_product_id')
-                    if isinstance(prod_val, int):
-                        product_id = prod_val
-                    else:
-                        product = Product.search([('name', '=', prod_val)], limit=1)
-                        if not product:
-                            raise ValidationError(_("Equipment '%s' not found.") % prod_val)
-                        product_id = product.id
-
-                    # Search existing line for this reservation and product
-                    existing_line = Equipment.search([
-                        ('reservation_id', '=', reservation_id),
-                        ('equipment_product_id', '=', product_id)
-                    ], limit=1)
+                    product_id = resolver.get('product.product', eq.get('equipment_product_id'), label=_("Equipment"))
+                    if not product_id:
+                        continue
 
                     line_vals = {
                         'equipment_product_id': product_id,
@@ -311,13 +451,16 @@ class SportClubReservation(models.Model):
                         'hours': eq.get('hours', 1.0),
                     }
 
-                    if existing_line:
-                        equip_commands.append((1, existing_line.id, line_vals))  # update
+                    if product_id in existing_lines:
+                        equip_commands.append((1, existing_lines[product_id], line_vals))  # update
                     else:
                         equip_commands.append((0, 0, line_vals))  # create new
 
             vals['equipment_line_ids'] = equip_commands
 
+        # Unknown names are reported together
+        resolver.check()
+
         return vals
 
     def _to_api_dict(self):
@@ -362,6 +505,7 @@ class SportClubReservation(models.Model):
                 "id": self.promotion_id.id,
                 "name": self.promotion_id.display_name,
             } if self.promotion_id else {},
+            "coupon_code": self.coupon_id.code or None,
             "pricing_rule": {
                 "id": self.pricing_rule_id.id,
                 "name": self.pricing_rule_id.display_name,
@@ -378,7 +522,8 @@ class SportClubReservation(models.Model):
                     "id": p.id,
                     "name": p.name,
                     "email": p.email,
-                    "mobile": getattr(p, 'mobile', False)
+                    "mobile": getattr(p, 'mobile', False),
+                    "qr_url": "/api/reservation/%s/qr/%s.png" % (self.code, p.id) if self.state == 'confirmed' else False,
                 } for p in self.attendance_ids
             ],
             "equipment_lines": [
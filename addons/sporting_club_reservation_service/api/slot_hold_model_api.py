@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from .utils import *
+from odoo import api, models, fields, _
+from odoo.exceptions import ValidationError, UserError
+
+
+class SportClubSlotHold(models.Model):
+    _inherit = "sport.club.slot.hold"
+
+    @api.model
+    def _api_create_hold(self, data):
+        required = ['club_id', 'facility_id', 'date', 'time_from', 'time_to']
+        missing = [f for f in required if data.get(f) in (None, False, '')]
+        if missing:
+            raise ValidationError(_("Missing required fields: %s") % ', '.join(missing))
+
+        hold = self._acquire(
+            int(data['club_id']),
+            int(data['facility_id']),
+            data['date'],
+            data['time_from'],
+            data['time_to'],
+            sport_id=int(data['sport_id']) if data.get('sport_id') else None,
+            partner_id=int(data['player_id']) if data.get('player_id') else None,
+            ttl_minutes=data.get('ttl_minutes'),
+        )
+        return hold._to_api_dict()
+
+    @api.model
+    def _api_release_hold(self, token):
+        if not self._release(token):
+            raise UserError(_("Hold not found or already expired."))
+        return {"released": True, "token": token}
+
+    def _to_api_dict(self):
+        self.ensure_one()
+        return {
+            "token": self.token,
+            "expires_at": fields.Datetime.to_string(self.expires_at),
+            "club": {
+                "id": self.club_id.id,
+                "name": self.club_id.display_name,
+            },
+            "facility": {
+                "id": self.facility_id.id,
+                "name": self.facility_id.display_name,
+            },
+            "sport": {
+                "id": self.sport_id.id,
+                "name": self.sport_id.display_name,
+            } if self.sport_id else {},
+            "date": str(self.date),
+            "time_from_24": float_to_time_str_24(self.time_from),
+            "time_to_24": float_to_time_str_24(self.time_to),
+        }
@@ -106,59 +106,42 @@ class SportClubTrainer(models.Model):
         if 'bio' in data and data['bio']:
             vals['bio'] = _convert_bio(data['bio'],to_html=True)
 
+        resolver = NameResolver(self.env)
+        resolver.add('res.partner', [data.get('name')], domain=[('is_trainer', '=', True)])
+        resolver.add('sport.club.model', [data.get('club_id')])
+        resolver.add('sport.club.calendar', [data.get('calendar_template_id')])
+        resolver.add('sport.club.sports', data.get('sport_ids'))
+        resolver.resolve()
+
         # Partner
         if 'name' in data and data['name']:
             partner_val = data['name']
-            partner_model = self.env['res.partner'].sudo()
-
             if isinstance(partner_val, str):
-                partner = partner_model.search([('name', '=', partner_val), ('is_trainer', '=', True)], limit=1)
-                if not partner:
-                    partner = partner_model.create({
+                partner_id = resolver.get('res.partner', partner_val, domain=[('is_trainer', '=', True)])
+                if not partner_id:
+                    partner_id = self.env['res.partner'].sudo().create({
                         'name': partner_val,
                         'company_id':self.env.company.id,
                         'is_trainer': True,
                         'type': 'contact',
-                    })
-                vals['partner_id'] = partner.id
+                    }).id
+                vals['partner_id'] = partner_id
 
         # Club
         if 'club_id' in data and data['club_id']:
-            club_val = data['club_id']
-            club_model = self.env['sport.club.model'].sudo()
-            if isinstance(club_val, int):
-                vals['club_id'] = club_val
-            elif isinstance(club_val, str):
-                club = club_model.search([('name', '=', club_val)], limit=1)
-                if not club:
-                    raise ValidationError(_("Club with name '%s' not found.") % club_val)
-                vals['club_id'] = club.id
+            vals['club_id'] = resolver.get('sport.club.model', data['club_id'], label=_("Club"))
 
         # calendar
         if 'calendar_template_id' in data and data['calendar_template_id']:
-            calendar_val = data['calendar_template_id']
-            calendar_model = self.env['sport.club.calendar'].sudo()
-            if isinstance(calendar_val, int):
-                vals['calendar_template_id'] = calendar_val
-            elif isinstance(calendar_val, str):
-                calendar = calendar_model.search([('name','=',calendar_val)],limit=1)
-                if not calendar:
-                    raise ValidationError(_("Calendar with name '%s' not found. ") % calendar_val)
-                vals['calendar_template_id'] = calendar.id
+            vals['calendar_template_id'] = resolver.get(
+                'sport.club.calendar', data['calendar_template_id'], label=_("Calendar")
+            )
 
         # Sports (many2many)
         if 'sport_ids' in data and data['sport_ids']:
-            sport_model = self.env['sport.club.sports'].sudo()
-            sport_ids = []
-            for sport_val in data['sport_ids']:
-                if isinstance(sport_val, int):
-                    sport_ids.append(sport_val)
-                elif isinstance(sport_val, str):
-                    sport = sport_model.search([('name', '=', sport_val)], limit=1)
-                    if not sport:
-                        raise ValidationError(_("Sport with name '%s' not found.") % sport_val)
-                    sport_ids.append(sport.id)
-            vals['sport_ids'] = [(6, 0, sport_ids)]
+            vals['sport_ids'] = [(6, 0, resolver.get_many('sport.club.sports', data['sport_ids'], label=_("Sport")))]
+
+        resolver.check()
 
         return vals
 
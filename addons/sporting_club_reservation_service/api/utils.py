@@ -2,6 +2,7 @@
 import pytz
 from datetime import datetime
 from odoo import _
+from odoo.http import request
 from odoo.exceptions import UserError, ValidationError, AccessError, MissingError
 
 
@@ -125,3 +126,110 @@ def time_str_to_float(time_str):
         return hours + minutes / 60.0
     except Exception:
         raise ValueError(f"Invalid time format: {time_str}. Expected 'HH:MM' or 'HH:MM AM/PM'.")
+
+
+class NameResolver:
+    """
+    Resolve the record names of an API payload in bulk.
+
+    Names are registered per comodel with add(), resolve() then runs one
+    search_read per (comodel, name field, domain) and get() returns the ids.
+    Found names are memoized for the whole HTTP request; unknown names are
+    collected and reported together by check().
+    """
+
+    def __init__(self, env):
+        self.env = env
+        self.errors = []
+        self._pending = {}
+        self._missing = set()
+        self._created = {}
+        self._found = self._get_request_cache()
+
+    @staticmethod
+    def _get_request_cache():
+        if not request:
+            return {}
+        cache = getattr(request, '_sport_club_resolved_names', None)
+        if cache is None:
+            cache = request._sport_club_resolved_names = {}
+        return cache
+
+    @staticmethod
+    def _key(model, field, domain):
+        return model, field, tuple(domain or ())
+
+    def _lookup(self, key, name):
+        return self._created.get((key, name)) or self._found.get(key, {}).get(name)
+
+    def add(self, model, values, field='name', domain=None):
+        """Register the string values of `values` to be resolved; ids are ignored."""
+        key = self._key(model, field, domain)
+        for value in values or []:
+            if isinstance(value, dict):
+                value = value.get(field)
+            if isinstance(value, str) and value and not self._lookup(key, value) \
+                    and (key, value) not in self._missing:
+                self._pending.setdefault(key, set()).add(value)
+        return self
+
+    def resolve(self):
+        """Resolve every pending name with one search_read per comodel."""
+        pending, self._pending = self._pending, {}
+        for key, names in pending.items():
+            model, field, domain = key
+            found = self._found.setdefault(key, {})
+            Model = self.env[model].sudo()
+            search_domain = list(domain) + [(field, 'in', list(names))]
+            if '.' in field:
+                # Related name (e.g. partner_id.name): read it through the prefetch
+                for record in Model.search(search_domain):
+                    for name in record.mapped(field):
+                        found.setdefault(name, record.id)
+            else:
+                for row in Model.search_read(search_domain, [field]):
+                    found.setdefault(row[field], row['id'])
+            self._missing.update((key, name) for name in names if name not in found)
+        return self
+
+    def get(self, model, value, field='name', domain=None, label=None):
+        """
+        Id of a record given by id or by name.
+        Unknown names return False and are reported by check() when a label is given.
+        """
+        if isinstance(value, bool) or not value:
+            return False
+        if isinstance(value, int):
+            return value
+        key = self._key(model, field, domain)
+        if not self._lookup(key, value) and (key, value) not in self._missing:
+            self.add(model, [value], field, domain).resolve()
+        record_id = self._lookup(key, value)
+        if not record_id and label:
+            self.errors.append(_("%s '%s' not found.") % (label, value))
+        return record_id or False
+
+    def get_many(self, model, values, field='name', domain=None, label=None):
+        """Ids of several records given by id or by name, skipping the unknown ones."""
+        self.add(model, values, field, domain)
+        ids = []
+        for value in values or []:
+            if isinstance(value, dict):
+                value = value.get(field)
+            record_id = self.get(model, value, field, domain, label)
+            if record_id and record_id not in ids:
+                ids.append(record_id)
+        return ids
+
+    def remember(self, model, value, record_id, field='name', domain=None):
+        """Register a record created for an unknown name so later lookups reuse it."""
+        key = self._key(model, field, domain)
+        self._missing.discard((key, value))
+        self._created[(key, value)] = record_id
+
+    def check(self):
+        """Raise a single ValidationError listing every unknown name."""
+        if self.errors:
+            errors = list(dict.fromkeys(self.errors))
+            self.errors = []
+            raise ValidationError("\n".join(errors))
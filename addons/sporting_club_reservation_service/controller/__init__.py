@@ -9,5 +9,7 @@ from . import sport_club_promotions_model_api
 from . import sport_club_trainers_model_api
 from . import sport_club_calendar_api
 from . import sport_club_reservation_api
+from . import sport_club_availability_api
+from . import sport_club_slot_hold_api
 from . import project_general_apis
 from . import web
\ No newline at end of file
@@ -15,6 +15,7 @@ class GeneralApiController(http.Controller):
         except ValidationError as e:
             return error_response(code=404, message=str(e))
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message="Unexpected error: %s" % str(e))
 
     @http.route('/api/models/all', type='http', auth='public', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -78,4 +79,5 @@ class GeneralApiController(http.Controller):
             return valid_response(code=200, message="Success", body=result)
 
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
\ No newline at end of file
@@ -15,6 +15,7 @@ class SportClubPolicyAPIController(http.Controller):
             result = request.env['sport.club.policy'].sudo()._api_create_policy(data)
             return valid_response(code=200, message="Policy created successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/policy/search/all', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -32,6 +33,7 @@ class SportClubPolicyAPIController(http.Controller):
             policies = request.env['sport.club.policy'].sudo()._api_search_policies(domain=domain, limit=limit, offset=offset)
             return valid_response(code=200, message="Success", body=policies)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/policy/search/one/<int:policy_id>', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -41,6 +43,7 @@ class SportClubPolicyAPIController(http.Controller):
             result = request.env['sport.club.policy'].sudo()._api_get_policy(policy_id)
             return valid_response(code=200, message="Success", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/policy/filter', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -53,6 +56,7 @@ class SportClubPolicyAPIController(http.Controller):
             result = request.env['sport.club.policy'].sudo()._api_filter_policies_with_keyword(keyword)
             return valid_response(code=200, message="Success", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/policy/update/<int:policy_id>', type='http', auth='none', methods=['PUT'], csrf=False, save_session=False, cors="*")
@@ -67,6 +71,7 @@ class SportClubPolicyAPIController(http.Controller):
             result = request.env['sport.club.policy'].sudo()._api_update_policy(data)
             return valid_response(code=200, message="Policy updated successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/policy/delete/<int:policy_id>', type='http', auth='none', methods=['DELETE'], csrf=False, save_session=False, cors="*")
@@ -76,4 +81,5 @@ class SportClubPolicyAPIController(http.Controller):
             result = request.env['sport.club.policy'].sudo()._api_delete_policy(policy_id)
             return valid_response(code=200, message="Policy deleted successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
@@ -16,6 +16,7 @@ class SportClubAPI(http.Controller):
             result = request.env['sport.club.model'].sudo()._api_create_club(data)
             return valid_response(code=200,message="Club created successfully",body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/club/search/all', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -30,6 +31,7 @@ class SportClubAPI(http.Controller):
             clubs = request.env['sport.club.model'].sudo()._api_search_clubs(domain=domain,limit=limit,offset=offset)
             return valid_response(code=200,message="Success",body=clubs)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/club/search/one/<int:club_id>', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -39,6 +41,7 @@ class SportClubAPI(http.Controller):
             result = request.env['sport.club.model'].sudo()._api_get_club(club_id)
             return valid_response(code=200,message="Success",body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/club/filter', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -51,6 +54,7 @@ class SportClubAPI(http.Controller):
             result = request.env['sport.club.model'].sudo()._filter_clubs_with_keywords(keyword)
             return valid_response(code=200,message="Success",body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/club/update/<int:club_id>', type='http', auth='none', methods=['PUT'], csrf=False, save_session=False, cors="*")
@@ -69,6 +73,7 @@ class SportClubAPI(http.Controller):
                 body=result
             )
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/club/delete/<int:club_id>', type='http', auth='none', methods=['DELETE'], csrf=False, save_session=False, cors="*")
@@ -78,4 +83,5 @@ class SportClubAPI(http.Controller):
             result = request.env['sport.club.model'].sudo()._api_delete_club(club_id)
             return valid_response(code=200,message="Club deleted successfully",body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
@@ -46,4 +46,5 @@ class ApiTokenAuthController(http.Controller):
             return valid_response(body=payload, message="User authenticated successfully", code=200)
 
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(message="Failed to authenticate user", body={"error": str(e)}, code=500)
\ No newline at end of file
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+from .utils import *
+from odoo import http
+from odoo.http import request
+
+
+class SportClubAvailabilityAPIController(http.Controller):
+
+    @http.route('/api/availability', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
+    @check_api_key()
+    def get_availability(self, **kwargs):
+        try:
+            club_id = kwargs.get('club_id')
+            date_from = kwargs.get('date_from')
+            if not club_id or not date_from:
+                return invalid_response(message="Missing 'club_id' or 'date_from' query parameter", code=400, body={})
+
+            facility_ids = [int(f) for f in kwargs.get('facility_ids', '').split(',') if f.strip()]
+            result = request.env['sport.club.availability'].sudo()._api_get_availability(
+                club_id=int(club_id),
+                date_from=date_from,
+                date_to=kwargs.get('date_to'),
+                facility_ids=facility_ids or None,
+                sport_id=int(kwargs['sport_id']) if kwargs.get('sport_id') else None,
+            )
+            return valid_response(code=200, message="success", body=result)
+        except Exception as e:
+            reraise_concurrency_error(e)
+            return error_response(code=400, message=str(e))
+
+    @http.route('/api/availability/next', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
+    @check_api_key()
+    def get_next_free_windows(self, **kwargs):
+        try:
+            club_id = kwargs.get('club_id')
+            sport_id = kwargs.get('sport_id')
+            duration = kwargs.get('duration')
+            if not club_id or not sport_id or not duration:
+                return invalid_response(message="Missing 'club_id', 'sport_id' or 'duration' query parameter", code=400, body={})
+
+            result = request.env['sport.club.availability'].sudo()._api_find_next_free_windows(
+                club_id=int(club_id),
+                sport_id=int(sport_id),
+                duration_minutes=int(duration),
+                date_from=kwargs.get('date_from'),
+                horizon_days=int(kwargs.get('horizon', 14)),
+                limit=int(kwargs.get('limit', 5)),
+            )
+            message = "success" if result else "No data found"
+            return valid_response(code=200, message=message, body=result)
+        except Exception as e:
+            reraise_concurrency_error(e)
+            return error_response(code=400, message=str(e))
+
+    @http.route('/api/occupancy/heatmap', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
+    @check_api_key()
+    def get_occupancy_heatmap(self, **kwargs):
+        try:
+            club_id = kwargs.get('club_id')
+            date_from = kwargs.get('date_from')
+            if not club_id or not date_from:
+                return invalid_response(message="Missing 'club_id' or 'date_from' query parameter", code=400, body={})
+
+            facility_ids = [int(f) for f in kwargs.get('facility_ids', '').split(',') if f.strip()]
+            result = request.env['sport.club.occupancy.heatmap'].sudo()._api_get_heatmap(
+                club_id=int(club_id),
+                date_from=date_from,
+                date_to=kwargs.get('date_to'),
+                facility_ids=facility_ids or None,
+            )
+            return valid_response(code=200, message="success", body=result)
+        except Exception as e:
+            reraise_concurrency_error(e)
+            return error_response(code=400, message=str(e))
@@ -17,6 +17,7 @@ class SportClubCalendarAPIController(http.Controller):
             result = request.env['sport.club.calendar'].sudo()._api_create_calendar(data)
             return valid_response(code=200, message="Calendar created successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/calendar/search/all', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -36,6 +37,7 @@ class SportClubCalendarAPIController(http.Controller):
             )
             return valid_response(code=200, message="Success", body=calendars)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/calendar/search/one/<int:calendar_id>', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -45,6 +47,7 @@ class SportClubCalendarAPIController(http.Controller):
             result = request.env['sport.club.calendar'].sudo()._api_get_calendar(calendar_id)
             return valid_response(code=200, message="Success", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/calendar/filter', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -57,6 +60,7 @@ class SportClubCalendarAPIController(http.Controller):
             result = request.env['sport.club.calendar'].sudo()._api_filter_calendars_with_keyword(keyword)
             return valid_response(code=200, message="Success", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/calendar/update/<int:calendar_id>', type='http', auth='none', methods=['PUT'], csrf=False, save_session=False, cors="*")
@@ -71,6 +75,7 @@ class SportClubCalendarAPIController(http.Controller):
             result = request.env['sport.club.calendar'].sudo()._api_update_calendar(data)
             return valid_response(code=200, message="Calendar updated successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/calendar/delete/<int:calendar_id>', type='http', auth='none', methods=['DELETE'], csrf=False, save_session=False, cors="*")
@@ -80,4 +85,5 @@ class SportClubCalendarAPIController(http.Controller):
             result = request.env['sport.club.calendar'].sudo()._api_delete_calendar(calendar_id)
             return valid_response(code=200, message="Calendar deleted successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
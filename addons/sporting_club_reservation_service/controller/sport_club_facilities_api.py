@@ -16,6 +16,7 @@ class SportClubFacilityAPIController(http.Controller):
             result = request.env['sport.club.facility'].sudo()._api_create_facility(data)
             return valid_response(code=200, message="Facility created successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/facility/search/all', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -33,6 +34,7 @@ class SportClubFacilityAPIController(http.Controller):
             facilities = request.env['sport.club.facility'].sudo()._api_search_facilities(domain=domain, limit=limit, offset=offset)
             return valid_response(code=200, message="Success", body=facilities)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/facility/search/one/<int:facility_id>', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -42,6 +44,7 @@ class SportClubFacilityAPIController(http.Controller):
             result = request.env['sport.club.facility'].sudo()._api_get_facility(facility_id)
             return valid_response(code=200, message="Success", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/facility/filter', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -54,6 +57,7 @@ class SportClubFacilityAPIController(http.Controller):
             result = request.env['sport.club.facility'].sudo()._filter_facilities_with_keywords(keyword)
             return valid_response(code=200, message="Success", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/facility/update/<int:facility_id>', type='http', auth='none', methods=['PUT'], csrf=False, save_session=False, cors="*")
@@ -68,6 +72,7 @@ class SportClubFacilityAPIController(http.Controller):
             result = request.env['sport.club.facility'].sudo()._api_update_facility(data)
             return valid_response(code=200, message="Facility updated successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/facility/delete/<int:facility_id>', type='http', auth='none', methods=['DELETE'], csrf=False, save_session=False, cors="*")
@@ -77,4 +82,5 @@ class SportClubFacilityAPIController(http.Controller):
             result = request.env['sport.club.facility'].sudo()._api_delete_facility(facility_id)
             return valid_response(code=200, message="Facility deleted successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
@@ -17,6 +17,7 @@ class SportClubPricingRuleAPIController(http.Controller):
             result = request.env['sport.club.pricing.rule'].sudo()._api_create_pricing_rule(data)
             return valid_response(code=200, message="Pricing rule created successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/pricing/search/all', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -35,6 +36,7 @@ class SportClubPricingRuleAPIController(http.Controller):
             message = "success" if rules and len(rules) > 0 else "There is no data found"
             return valid_response(code=200, message=message, body=rules)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/pricing/search/one/<int:rule_id>', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -45,6 +47,7 @@ class SportClubPricingRuleAPIController(http.Controller):
             message = "success" if result else "There is no data found"
             return valid_response(code=200, message=message, body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/pricing/filter', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -58,6 +61,7 @@ class SportClubPricingRuleAPIController(http.Controller):
             message = "success" if result else "There is no data found"
             return valid_response(code=200, message=message, body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/pricing/update/<int:rule_id>', type='http', auth='none', methods=['PUT'], csrf=False, save_session=False, cors="*")
@@ -72,6 +76,7 @@ class SportClubPricingRuleAPIController(http.Controller):
             result = request.env['sport.club.pricing.rule'].sudo()._api_update_pricing_rule(data)
             return valid_response(code=200, message="Pricing rule updated successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/pricing/delete/<int:rule_id>', type='http', auth='none', methods=['DELETE'], csrf=False, save_session=False, cors="*")
@@ -81,4 +86,5 @@ class SportClubPricingRuleAPIController(http.Controller):
             result = request.env['sport.club.pricing.rule'].sudo()._api_delete_pricing_rule(rule_id)
             return valid_response(code=200, message="Pricing rule deleted successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
\ No newline at end of file
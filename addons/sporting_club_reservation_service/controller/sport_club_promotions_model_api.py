@@ -2,7 +2,7 @@
 import json
 from odoo import http
 from odoo.http import request
-from .utils import check_api_key, valid_response, invalid_response, error_response
+from .utils import check_api_key, valid_response, invalid_response, error_response, reraise_concurrency_error
 
 
 class SportClubPromotionAPIController(http.Controller):
@@ -18,6 +18,7 @@ class SportClubPromotionAPIController(http.Controller):
             result = request.env['sport.club.promotion'].sudo()._api_create_promotion(data)
             return valid_response(code=200, message="Promotion created successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/promotion/search/all', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -36,6 +37,7 @@ class SportClubPromotionAPIController(http.Controller):
             message = "success" if records and len(records) > 0 else "There is no data found"
             return valid_response(code=200, message=message, body=records)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/promotion/search/one/<int:promotion_id>', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -46,6 +48,7 @@ class SportClubPromotionAPIController(http.Controller):
             message = "success" if result else "There is no data found"
             return valid_response(code=200, message=message, body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/promotion/filter', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -59,6 +62,7 @@ class SportClubPromotionAPIController(http.Controller):
             message = "success" if result else "There is no data found"
             return valid_response(code=200, message=message, body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/promotion/update/<int:promotion_id>', type='http', auth='none', methods=['PUT'], csrf=False, save_session=False, cors="*")
@@ -73,6 +77,7 @@ class SportClubPromotionAPIController(http.Controller):
             result = request.env['sport.club.promotion'].sudo()._api_update_promotion(data)
             return valid_response(code=200, message="Promotion updated successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/promotion/delete/<int:promotion_id>', type='http', auth='none', methods=['DELETE'], csrf=False, save_session=False, cors="*")
@@ -82,4 +87,5 @@ class SportClubPromotionAPIController(http.Controller):
             result = request.env['sport.club.promotion'].sudo()._api_delete_promotion(promotion_id)
             return valid_response(code=200, message="Promotion deleted successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
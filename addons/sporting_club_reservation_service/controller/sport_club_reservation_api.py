@@ -3,11 +3,15 @@ from .utils import *
 from odoo import http
 from odoo.http import request
 
+# Browsers may reuse a QR code for a day; the ETag changes whenever the reservation does
+QR_MAX_AGE = 86400
+
 
 class SportClubReservationAPIController(http.Controller):
 
     @http.route('/api/reservation/create', type='http', auth='none', methods=['POST'], csrf=False, save_session=False,cors="*")
     @check_api_key()
+    @idempotent()
     def create_reservation(self):
         try:
             if not request.httprequest.data:
@@ -17,6 +21,25 @@ class SportClubReservationAPIController(http.Controller):
             result = request.env['sport.club.reservation'].sudo()._api_create_reservation(data)
             return valid_response(code=200, message="Reservation created successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
+            return error_response(code=400, message=str(e))
+
+    @http.route('/api/reservation/create/batch', type='http', auth='none', methods=['POST'], csrf=False, save_session=False, cors="*")
+    @check_api_key()
+    @idempotent()
+    def create_reservations_batch(self):
+        try:
+            if not request.httprequest.data:
+                return invalid_response(message="Missing request body", body={}, code=400)
+
+            data = json.loads(request.httprequest.data.decode('utf-8'))
+            items = data.get('reservations') if isinstance(data, dict) else data
+            result = request.env['sport.club.reservation'].sudo()._api_create_reservations_batch(items)
+            message = "Reservations created successfully" if not result['failed'] else \
+                "%s of %s reservations created" % (result['created'], result['total'])
+            return valid_response(code=200, message=message, body=result)
+        except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/reservation/search/all', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -37,6 +60,7 @@ class SportClubReservationAPIController(http.Controller):
             message = "success" if reservations and len(reservations) > 0 else "No data found"
             return valid_response(code=200, message=message, body=reservations)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/reservation/search/one/<int:reservation_id>', type='http', auth='none', methods=['GET'],csrf=False, save_session=False, cors="*")
@@ -47,6 +71,26 @@ class SportClubReservationAPIController(http.Controller):
             message = "success" if result else "No data found"
             return valid_response(code=200, message=message, body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
+            return error_response(code=404, message=str(e))
+
+    @http.route('/api/reservation/<string:code>/qr/<int:attendee_id>.png', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
+    @check_api_key()
+    def get_attendee_qr(self, code, attendee_id):
+        try:
+            etag, png = request.env['sport.club.reservation'].sudo()._api_get_attendee_qr(code, attendee_id)
+            headers = [
+                ('ETag', '"%s"' % etag),
+                ('Cache-Control', 'private, max-age=%s' % QR_MAX_AGE),
+            ]
+            if etag in request.httprequest.if_none_match:
+                return request.make_response(b'', headers=headers, status=304)
+            return request.make_response(png, headers=headers + [
+                ('Content-Type', 'image/png'),
+                ('Content-Length', str(len(png))),
+            ])
+        except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/reservation/filter', type='http', auth='none', methods=['GET'], csrf=False, save_session=False,cors="*")
@@ -60,10 +104,12 @@ class SportClubReservationAPIController(http.Controller):
             message = "success" if result else "No data found"
             return valid_response(code=200, message=message, body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/reservation/update/<int:reservation_id>', type='http', auth='none', methods=['PUT'], csrf=False, save_session=False, cors="*")
     @check_api_key()
+    @idempotent()
     def update_reservation(self, reservation_id):
         try:
             if not request.httprequest.data:
@@ -74,6 +120,7 @@ class SportClubReservationAPIController(http.Controller):
             result = request.env['sport.club.reservation'].sudo()._api_update_reservation(data)
             return valid_response(code=200, message="Reservation updated successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/reservation/delete/<int:reservation_id>', type='http', auth='none', methods=['DELETE'], csrf=False, save_session=False, cors="*")
@@ -83,4 +130,5 @@ class SportClubReservationAPIController(http.Controller):
             result = request.env['sport.club.reservation'].sudo()._api_delete_reservation(reservation_id)
             return valid_response(code=200, message="Reservation deleted successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
\ No newline at end of file
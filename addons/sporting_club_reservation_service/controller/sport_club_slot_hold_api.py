@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from .utils import *
+from odoo import http
+from odoo.http import request
+
+
+class SportClubSlotHoldAPIController(http.Controller):
+
+    @http.route('/api/slot/hold', type='http', auth='none', methods=['POST'], csrf=False, save_session=False, cors="*")
+    @check_api_key()
+    def create_hold(self):
+        try:
+            if not request.httprequest.data:
+                return invalid_response(message="Missing request body", body={}, code=400)
+
+            data = json.loads(request.httprequest.data.decode('utf-8'))
+            result = request.env['sport.club.slot.hold'].sudo()._api_create_hold(data)
+            return valid_response(code=200, message="Slot held successfully", body=result)
+        except Exception as e:
+            reraise_concurrency_error(e)
+            return error_response(code=409, message=str(e))
+
+    @http.route('/api/slot/hold/<string:token>', type='http', auth='none', methods=['DELETE'], csrf=False, save_session=False, cors="*")
+    @check_api_key()
+    def release_hold(self, token):
+        try:
+            result = request.env['sport.club.slot.hold'].sudo()._api_release_hold(token)
+            return valid_response(code=200, message="Slot hold released", body=result)
+        except Exception as e:
+            reraise_concurrency_error(e)
+            return error_response(code=404, message=str(e))
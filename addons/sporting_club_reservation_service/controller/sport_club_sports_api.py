@@ -16,6 +16,7 @@ class SportClubSportsAPIController(http.Controller):
             result = request.env['sport.club.sports'].sudo()._api_create_sport(data)
             return valid_response(code=200, message="Sport created successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/sport/search/all', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -34,6 +35,7 @@ class SportClubSportsAPIController(http.Controller):
             sports = request.env['sport.club.sports'].sudo()._api_search_sports(domain=domain, limit=limit, offset=offset)
             return valid_response(code=200, message="Success", body=sports)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/sport/search/one/<int:sport_id>', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -43,6 +45,7 @@ class SportClubSportsAPIController(http.Controller):
             result = request.env['sport.club.sports'].sudo()._api_get_sport(sport_id)
             return valid_response(code=200, message="Success", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/sport/filter', type='http', auth='none', methods=['GET'], csrf=False, save_session=False, cors="*")
@@ -55,6 +58,7 @@ class SportClubSportsAPIController(http.Controller):
             result = request.env['sport.club.sports'].sudo()._api_filter_sports_with_keyword(keyword)
             return valid_response(code=200, message="Success", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     @http.route('/api/sport/update/<int:sport_id>', type='http', auth='none', methods=['PUT'], csrf=False, save_session=False, cors="*")
@@ -69,6 +73,7 @@ class SportClubSportsAPIController(http.Controller):
             result = request.env['sport.club.sports'].sudo()._api_update_sport(data)
             return valid_response(code=200, message="Sport updated successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     @http.route('/api/sport/delete/<int:sport_id>', type='http', auth='none', methods=['DELETE'], csrf=False, save_session=False, cors="*")
@@ -78,4 +83,5 @@ class SportClubSportsAPIController(http.Controller):
             result = request.env['sport.club.sports'].sudo()._api_delete_sport(sport_id)
             return valid_response(code=200, message="Sport deleted successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
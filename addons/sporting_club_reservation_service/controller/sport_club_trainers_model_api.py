@@ -2,7 +2,7 @@
 import json
 from odoo import http
 from odoo.http import request
-from .utils import check_api_key, valid_response, invalid_response, error_response
+from .utils import check_api_key, valid_response, invalid_response, error_response, reraise_concurrency_error
 
 
 class SportClubTrainerAPIController(http.Controller):
@@ -21,6 +21,7 @@ class SportClubTrainerAPIController(http.Controller):
             result = request.env['sport.club.trainer'].sudo()._api_create_trainer(data)
             return valid_response(code=200, message="Trainer created successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     # -------------------------------------------------------
@@ -42,6 +43,7 @@ class SportClubTrainerAPIController(http.Controller):
             message = "success" if records and len(records) > 0 else "There is no data found"
             return valid_response(code=200, message=message, body=records)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     # -------------------------------------------------------
@@ -55,6 +57,7 @@ class SportClubTrainerAPIController(http.Controller):
             message = "success" if result else "There is no data found"
             return valid_response(code=200, message=message, body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     # -------------------------------------------------------
@@ -71,6 +74,7 @@ class SportClubTrainerAPIController(http.Controller):
             message = "success" if result else "There is no data found"
             return valid_response(code=200, message=message, body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=404, message=str(e))
 
     # -------------------------------------------------------
@@ -88,6 +92,7 @@ class SportClubTrainerAPIController(http.Controller):
             result = request.env['sport.club.trainer'].sudo()._api_update_trainer(data)
             return valid_response(code=200, message="Trainer updated successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
 
     # -------------------------------------------------------
@@ -100,4 +105,5 @@ class SportClubTrainerAPIController(http.Controller):
             result = request.env['sport.club.trainer'].sudo()._api_delete_trainer(trainer_id)
             return valid_response(code=200, message="Trainer deleted successfully", body=result)
         except Exception as e:
+            reraise_concurrency_error(e)
             return error_response(code=400, message=str(e))
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 import json
+import hashlib
 import functools
 import traceback
 import odoo
 from odoo import http
 from odoo.http import request, Response
 from odoo.exceptions import AccessDenied, AccessError, UserError, ValidationError, MissingError
+from odoo.service.model import PG_CONCURRENCY_EXCEPTIONS_TO_RETRY
 import random
 import string
 import os
@@ -56,6 +58,18 @@ def unexpected_error(e):
     return body
 
 
+# ============================================================
+# HELPER: CONCURRENCY ERRORS
+# ============================================================
+def reraise_concurrency_error(e):
+    """
+    Re-raise serialization failures, deadlocks and lock timeouts so Odoo rolls
+    the request back and retries it instead of answering with an error.
+    """
+    if isinstance(e, PG_CONCURRENCY_EXCEPTIONS_TO_RETRY):
+        raise e
+
+
 # ============================================================
 # CENTRALIZED ERROR HANDLER
 # ============================================================
@@ -115,6 +129,8 @@ def check_api_key():
                 request.update_env(user=user)
                 return func(*args, **kwargs)
 
+            except PG_CONCURRENCY_EXCEPTIONS_TO_RETRY:
+                raise
             except Exception as e:
                 return handle_odoo_exception(e)
 
@@ -122,6 +138,66 @@ def check_api_key():
     return decorator
 
 
+# ============================================================
+# DECORATOR FOR IDEMPOTENT MUTATIONS
+# ============================================================
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+
+
+def idempotent(ttl_hours=24):
+    """
+    Replay the stored response of a request already processed with the same
+    Idempotency-Key header. Must be applied below check_api_key so keys are
+    scoped to the authenticated user. Requests without the header run as usual.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = request.httprequest.headers.get(IDEMPOTENCY_HEADER)
+            if not key:
+                return func(*args, **kwargs)
+            key = key.strip()
+            if not key or len(key) > 255:
+                return invalid_response(code=400, message="Invalid Idempotency-Key header", body={})
+
+            route = "%s %s" % (request.httprequest.method, request.httprequest.path)
+            fingerprint = hashlib.sha256(request.httprequest.get_data() or b'').hexdigest()
+            Keys = request.env['sport.club.idempotency.key'].sudo()
+            record, claimed = Keys._claim(key, request.env.uid, route, fingerprint, ttl_hours=ttl_hours)
+
+            if not claimed:
+                if record.route != route or record.request_hash != fingerprint:
+                    return invalid_response(
+                        code=422, status=422,
+                        message="Idempotency-Key was already used with a different request",
+                        body={}
+                    )
+                if record.state != 'done':
+                    return invalid_response(
+                        code=409, status=409,
+                        message="A request with this Idempotency-Key is still being processed",
+                        body={}
+                    )
+                return Response(
+                    record.response_body,
+                    status=record.status_code,
+                    content_type='application/json',
+                    headers={'Idempotent-Replayed': 'true'},
+                )
+
+            # Failed calls are rolled back to here so the cursor is usable again
+            # to release the key; exceptions roll back and propagate.
+            with request.env.cr.savepoint() as savepoint:
+                response = func(*args, **kwargs)
+                if not 200 <= response.status_code < 300:
+                    savepoint.rollback()
+            record._store_response(response.status_code, response.get_data(as_text=True))
+            return response
+
+        return wrapper
+    return decorator
+
+
 # ============================================================
 # STANDARD VALID RESPONSE
 # ============================================================
@@ -9,12 +9,21 @@ from . import sport_club_facility_model
 from . import sport_club_calendar_model
 from . import sport_club_calendar_lines_model
 from . import sport_club_calendar_exceptions_model
+from . import sport_club_availability
+from . import sport_club_slot_occupancy
+from . import sport_club_slot_hold
+from . import sport_club_occupancy_heatmap
 from . import sport_club_equipments
 from . import sport_club_equipments_booking
 from . import sport_club_pricing_rules
 from . import sport_club_reservation
+from . import sport_club_reservation_series
+from . import sport_club_reservation_job
+from . import sport_club_reservation_counter
 from . import sport_club_trainers
 from . import sport_club_training_session
 from . import sport_club_promotions
 from . import access_token
+from . import sport_club_idempotency_key
 from . import sale_order
+from . import ir_config_parameter
@@ -0,0 +1,44 @@
+import random
+import string
+from odoo.tools import SQL
+
+# Characters easy to read back from a screen or a printed voucher
+CODE_ALPHABET = ''.join(c for c in string.ascii_uppercase + string.digits if c not in '01IO')
+
+_random = random.SystemRandom()
+
+
+def generate_unique_codes(model, field_name, count, groups=3, length=5):
+    """
+    Draw `count` random codes in the 'XXXXX-XXXXX-XXXXX' format that are not used yet
+    by `field_name` of `model`. Candidates are drawn in rounds and checked against
+    the (uniquely indexed) column with a single query per round, so generating codes
+    for a whole vals_list costs one query instead of one search per record.
+    """
+    if count <= 0:
+        return []
+    model.flush_model([field_name])
+    codes = []
+    drawn = set()
+    while len(codes) < count:
+        wanted = count - len(codes)
+        candidates = set()
+        # Draw a few spare candidates so a collision rarely costs another round
+        while len(candidates) < wanted + max(8, wanted // 10):
+            code = "-".join(
+                ''.join(_random.choice(CODE_ALPHABET) for _i in range(length))
+                for _j in range(groups)
+            )
+            if code not in drawn:
+                candidates.add(code)
+        drawn |= candidates
+        model.env.cr.execute(SQL(
+            "SELECT %s FROM %s WHERE %s = ANY(%s)",
+            SQL.identifier(field_name),
+            SQL.identifier(model._table),
+            SQL.identifier(field_name),
+            list(candidates),
+        ))
+        taken = {row[0] for row in model.env.cr.fetchall()}
+        codes.extend([code for code in candidates if code not in taken][:wanted])
+    return codes
@@ -0,0 +1,24 @@
+from odoo import api, models
+from odoo.tools import str2bool
+from .sport_club_reservation_counter import USE_COUNTERS_PARAM
+
+
+class IrConfigParameter(models.Model):
+    _inherit = 'ir.config_parameter'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._rebuild_reservation_counters()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'value' in vals or 'key' in vals:
+            self._rebuild_reservation_counters()
+        return res
+
+    def _rebuild_reservation_counters(self):
+        # Counters are not maintained while the flag is off: start from fresh ones when it is switched on
+        if any(param.key == USE_COUNTERS_PARAM and str2bool(param.value or 'False', False) for param in self):
+            self.env['sport.club.reservation.counter']._rebuild_counters()
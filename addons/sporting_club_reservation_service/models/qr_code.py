@@ -0,0 +1,28 @@
+import io
+import hashlib
+import qrcode
+from odoo.tools.lru import LRU
+
+# Rendered PNGs of the current worker, keyed by database, reservation/attendee and their write dates
+QR_CACHE = LRU(2048)
+
+
+def qr_cache_key(reservation, attendee):
+    """Cache key of an attendee QR code; any write on the reservation or the attendee invalidates it."""
+    return (
+        reservation.env.cr.dbname,
+        reservation.id,
+        attendee.id,
+        str(reservation.write_date or ''),
+        str(attendee.write_date or ''),
+    )
+
+
+def qr_etag(key):
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+
+def render_qr_png(text):
+    buffer = io.BytesIO()
+    qrcode.make(text).save(buffer, format='PNG')
+    return buffer.getvalue()
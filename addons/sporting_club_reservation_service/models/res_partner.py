@@ -3,6 +3,7 @@
 # ====================================================================================================
 
 from odoo import models, fields, api, _
+from odoo.tools import create_index, email_normalize
 import re
 # --------------------------------------------------------------------------------
 # models -> Base classes to define models/tables
@@ -39,6 +40,11 @@ from odoo.exceptions import ValidationError, UserError, AccessError, MissingErro
 # --------------------------------------------------------------------------------
 
 
+def normalize_mobile(mobile):
+    """Keep the digits of a phone number so formatting differences still match."""
+    return re.sub(r'\D', '', mobile or '') or False
+
+
 class ResPartner(models.Model):
     # --------------------------------------------------------------------------------
     # _inherit -> Extends an existing model
@@ -83,11 +89,69 @@ class ResPartner(models.Model):
         comodel_name="sport.club.reservation",
         string="Reservation",
     )
-    qr_image = fields.Binary(
-        string="QR Code",
-        attachment=True,
+    # --------------------------------------------------------------------------------
+    # Normalized contact keys used to match reservation attendees in bulk.
+    # email_normalized comes from mail; the mobile is reduced to its digits.
+    # --------------------------------------------------------------------------------
+    mobile_normalized = fields.Char(
+        string="Normalized Mobile",
+        compute="_compute_mobile_normalized",
+        store=True,
+        index=True,
     )
 
+    def init(self):
+        super().init()
+        create_index(
+            self.env.cr,
+            'res_partner_attendee_match_index',
+            self._table,
+            ['email_normalized', 'mobile_normalized'],
+        )
+
+    @api.depends('mobile')
+    def _compute_mobile_normalized(self):
+        for rec in self:
+            rec.mobile_normalized = normalize_mobile(rec.mobile)
+
+    @api.model
+    def _match_or_create_attendees(self, attendees):
+        """
+        Match reservation attendees to partners by (name, email, mobile) with one
+        query on the normalized keys and create the missing ones with one create().
+        :param attendees: list of dicts with name, email and mobile
+        :return: list of partner ids, in the order of the attendees
+        """
+        def match_key(name, email, mobile):
+            return name.strip(), email_normalize(email, strict=False) or False, normalize_mobile(mobile)
+
+        attendees = [att for att in attendees if att.get('name')]
+        keys = [match_key(att['name'], att.get('email'), att.get('mobile')) for att in attendees]
+        if not keys:
+            return []
+
+        matched = {}
+        for partner in self.search_read([
+            ('name', 'in', list({key[0] for key in keys})),
+            ('email_normalized', 'in', list({key[1] for key in keys})),
+            ('mobile_normalized', 'in', list({key[2] for key in keys})),
+        ], ['name', 'email_normalized', 'mobile_normalized'], order='id'):
+            matched.setdefault(match_key(partner['name'], partner['email_normalized'],
+                                         partner['mobile_normalized']), partner['id'])
+
+        missing = {}
+        for key, att in zip(keys, attendees):
+            if key not in matched and key not in missing:
+                missing[key] = {
+                    'name': key[0],
+                    'email': att.get('email'),
+                    'mobile': att.get('mobile'),
+                }
+        if missing:
+            partners = self.create(list(missing.values()))
+            matched.update(zip(missing, partners.ids))
+        return [matched[key] for key in keys]
+
     # @api.constrains("email")
     # def _check_email_format(self):
     #     email_regex = r"^[\w\.-]+@[\w\.-]+\.\w+$"
@@ -0,0 +1,295 @@
+import heapq
+import pytz
+from bisect import bisect_right
+from itertools import islice
+from datetime import datetime, time, timedelta
+from odoo import api, fields, models
+
+ACTIVE_RESERVATION_STATES = ('requested', 'confirmed', 'checked_in')
+DEFAULT_TZ = 'Africa/Cairo'
+
+
+# ============================================================
+# Interval Helpers
+# ============================================================
+def merge_intervals(intervals):
+    """
+    Merge overlapping or touching (start, end) intervals.
+    Returns a list of disjoint intervals sorted by start.
+    """
+    merged = []
+    for start, end in sorted((interval[0], interval[1]) for interval in intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [tuple(interval) for interval in merged]
+
+
+def sweep_overlapping_keys(slots, intervals):
+    """
+    Single sweep over the sorted slots and the merged intervals.
+    :param slots: iterable of (start, end, key) tuples
+    :param intervals: iterable of (start, end, ...) tuples
+    :return: set of the slot keys overlapping at least one interval
+    """
+    merged = merge_intervals(intervals)
+    keys = set()
+    index = 0
+    for slot in sorted(slots, key=lambda s: (s[0], s[1])):
+        start, end = slot[0], slot[1]
+        # Intervals ending before this slot can never overlap a later one
+        while index < len(merged) and merged[index][1] <= start:
+            index += 1
+        if index < len(merged) and merged[index][0] < end:
+            keys.add(slot[2])
+    return keys
+
+
+def sweep_free_slots(slots, busy):
+    """Return the (start, end, key) slots that do not overlap any busy interval, sorted by start."""
+    reserved = sweep_overlapping_keys(slots, busy)
+    return [slot for slot in sorted(slots, key=lambda s: (s[0], s[1])) if slot[2] not in reserved]
+
+
+def index_overlaps(index, start, end):
+    """
+    O(log n) overlap test against a (starts, ends) index of disjoint sorted intervals.
+    """
+    starts, ends = index
+    position = bisect_right(ends, start)
+    return position < len(starts) and starts[position] < end
+
+
+def local_to_utc(day, hour, tz):
+    """Convert a local date and float hour into a naive UTC datetime."""
+    local = datetime.combine(day, time.min) + timedelta(hours=hour)
+    return tz.localize(local).astimezone(pytz.utc).replace(tzinfo=None)
+
+
+def find_overlap(busy, start, end):
+    """Return the first (start, end, ...) busy interval overlapping [start, end), or None."""
+    for interval in busy:
+        if interval[0] < end and interval[1] > start:
+            return interval
+    return None
+
+
+class SportClubAvailability(models.AbstractModel):
+    """
+    Availability engine shared by the reservation smart button and the API.
+    Slots and reservations are loaded once and compared in a single sweep.
+    """
+    _name = "sport.club.availability"
+    _description = "Sport Club Availability Engine"
+
+    # ============================================================
+    # Data Loading
+    # ============================================================
+    @api.model
+    def _get_calendar(self, club_id, facility_id):
+        Calendar = self.env['sport.club.calendar'].sudo()
+        return Calendar.browse(Calendar._get_calendar_id(club_id, facility_id))
+
+    @api.model
+    def _get_day_slots(self, calendar_id, weekday):
+        """Return the calendar slots of a weekday as sorted (start, end, line_id) tuples."""
+        return self.env['sport.club.calendar']._get_template_day_slots(calendar_id, weekday)
+
+    @api.model
+    def _get_busy_intervals(self, facility_id, date, sport_id=None, exclude_ids=None, exclude_hold_tokens=None):
+        """
+        Return the active reservations and slot holds of a facility/day as sorted
+        (from, to, reservation_id) tuples; holds carry False as reservation id.
+        """
+        date = fields.Date.to_date(date)
+        busy = self._get_range_busy([facility_id], date, date, sport_id=sport_id, exclude_ids=exclude_ids,
+                                    exclude_hold_tokens=exclude_hold_tokens)
+        return busy.get((facility_id, date), [])
+
+    @api.model
+    def _get_range_busy(self, facility_ids, date_from, date_to, sport_id=None, exclude_ids=None,
+                        exclude_hold_tokens=None):
+        """
+        Busy intervals of several facilities over a date range: the stored occupancy
+        plus the unexpired slot holds.
+        :return: dict {(facility_id, date): [(time_from, time_to, reservation_id)]} sorted by start
+        """
+        busy = self.env['sport.club.slot.occupancy']._get_busy_intervals(
+            facility_ids, date_from, date_to, sport_id=sport_id, exclude_ids=exclude_ids
+        )
+        holds = self.env['sport.club.slot.hold']._get_active_intervals(
+            facility_ids, date_from, date_to, sport_id=sport_id, exclude_tokens=exclude_hold_tokens
+        )
+        for key, intervals in holds.items():
+            busy[key] = sorted(busy.get(key, []) + [interval[:3] for interval in intervals])
+        return busy
+
+    # ============================================================
+    # Public Engine
+    # ============================================================
+    @api.model
+    def _get_free_slots(self, club_id, facility_id, date, sport_id=None, exclude_ids=None, busy=None):
+        """
+        Compute the free calendar slots of a facility on a given date.
+        :param busy: (from, to, reservation_id) intervals of the day, read from the occupancy when not given
+        :return: list of (start, end, line_id) tuples sorted by start
+        """
+        if not facility_id or not date:
+            return []
+        calendar = self._get_calendar(club_id, facility_id)
+        if not calendar:
+            return []
+        weekday = fields.Date.from_string(date).weekday()
+        slots = self._get_day_slots(calendar.id, weekday)
+        if not slots:
+            return []
+        date = fields.Date.to_date(date)
+        closed = self._get_closed_slot_keys(calendar.id, date, slots)
+        if busy is None:
+            busy = self._get_busy_intervals(facility_id, date, sport_id=sport_id, exclude_ids=exclude_ids)
+        return [slot for slot in sweep_free_slots(slots, busy) if slot[2] not in closed]
+
+    # ============================================================
+    # Calendar Exceptions
+    # ============================================================
+    @api.model
+    def _to_utc(self, day, hour, tz=None):
+        """Convert a local date and float hour into a naive UTC datetime."""
+        return local_to_utc(day, hour, tz or self._get_tz())
+
+    @api.model
+    def _is_closed(self, calendar_id, day, hour_from, hour_to):
+        """Whether a closed calendar exception overlaps the given local interval."""
+        index = self.env['sport.club.calendar.exception']._get_closure_index(calendar_id)
+        if not index[0]:
+            return False
+        tz = self._get_calendar_tz(calendar_id)
+        return index_overlaps(index, self._to_utc(day, hour_from, tz), self._to_utc(day, hour_to, tz))
+
+    @api.model
+    def _get_closed_slot_keys(self, calendar_id, day, slots):
+        """Keys of the (start, end, key) slots falling into a closed calendar exception."""
+        index = self.env['sport.club.calendar.exception']._get_closure_index(calendar_id)
+        if not index[0]:
+            return set()
+        tz = self._get_calendar_tz(calendar_id)
+        return {
+            slot[2] for slot in slots
+            if index_overlaps(index, self._to_utc(day, slot[0], tz), self._to_utc(day, slot[1], tz))
+        }
+
+    # ============================================================
+    # Batched Range Loading
+    # ============================================================
+    @api.model
+    def _get_tz(self, club_id=None):
+        """
+        Timezone of a club. Calendar slots, closures and reservations are all local
+        to the club, whatever the timezone of the calling user.
+        """
+        return self.env['sport.club.model'].sudo().browse(club_id or [])._get_tz()
+
+    @api.model
+    def _get_calendar_tz(self, calendar_id):
+        return self.env['sport.club.calendar'].sudo().browse(calendar_id).club_id._get_tz()
+
+    @api.model
+    def _get_sport_facilities(self, club_id, sport_id=None):
+        """Facilities of a club, optionally restricted to the ones offering a sport."""
+        domain = [('sport_club_id', '=', club_id)]
+        if sport_id:
+            domain += [
+                ('sport_ids', 'in', [sport_id]),
+                '|', ('sport_id', '=', False), ('sport_id', '=', sport_id),
+            ]
+        return self.env['sport.club.facility'].sudo().search(domain)
+
+    @api.model
+    def _load_range_data(self, club_id, facility_ids, date_from, date_to, sport_id=None):
+        """
+        Load everything needed to compute availability for several facilities
+        over a date range: calendar templates come from the compiled cache and
+        the occupancy and holds of the whole range are fetched with one query each.
+        :return: dict with the keys
+            - calendars: {facility_id: calendar_id}
+            - slots: {(calendar_id, weekday): [(start, end, line_id)]}
+            - busy: {(facility_id, date): [(time_from, time_to, reservation_id)]}
+        """
+        Calendar = self.env['sport.club.calendar']
+        calendars = {}
+        for facility_id in facility_ids:
+            calendar_id = Calendar._get_calendar_id(club_id, facility_id)
+            if calendar_id:
+                calendars[facility_id] = calendar_id
+
+        slots = {}
+        for calendar_id in set(calendars.values()):
+            for weekday in range(7):
+                day_slots = Calendar._get_template_day_slots(calendar_id, weekday)
+                if day_slots:
+                    slots[(calendar_id, weekday)] = day_slots
+
+        busy = self._get_range_busy(facility_ids, date_from, date_to, sport_id=sport_id)
+
+        return {
+            'calendars': calendars,
+            'slots': slots,
+            'busy': busy,
+        }
+
+    # ============================================================
+    # Next Free Windows
+    # ============================================================
+    @api.model
+    def _iter_facility_windows(self, facility_id, calendar_id, days, data, duration, not_before=None):
+        """
+        Lazily yield the free windows of one facility in chronological order
+        as (date, hour_from, facility_id, hour_to) tuples. Each window starts
+        at a free slot and fits inside it, as required by the booking checks.
+        """
+        for day in days:
+            slots = data['slots'].get((calendar_id, day.weekday()), [])
+            if not slots:
+                continue
+            closed = self._get_closed_slot_keys(calendar_id, day, slots)
+            free = [
+                slot for slot in sweep_free_slots(slots, data['busy'].get((facility_id, day), []))
+                if slot[2] not in closed
+            ]
+            # A booking must fit inside a single calendar slot, so windows never span two slots
+            last_start = None
+            for start, end, _line_id in free:
+                if start == last_start or start + duration > end:
+                    continue
+                if not_before and (day, start) < not_before:
+                    continue
+                last_start = start
+                yield (day, start, facility_id, start + duration)
+
+    @api.model
+    def _find_next_free_windows(self, club_id, sport_id, duration, date_from=None, horizon_days=14, limit=5):
+        """
+        Earliest free windows of a given duration across every facility of a club
+        offering the sport. Per-facility free lists are merged with a priority queue.
+        :param duration: window length in float hours
+        :return: list of (date, hour_from, facility_id, hour_to) tuples
+        """
+        tz = self._get_tz(club_id)
+        now = datetime.now(pytz.utc).astimezone(tz)
+        date_from = fields.Date.to_date(date_from) or now.date()
+        date_to = date_from + timedelta(days=max(int(horizon_days), 1) - 1)
+        not_before = (now.date(), now.hour + now.minute / 60.0)
+
+        facilities = self._get_sport_facilities(club_id, sport_id=sport_id)
+        if not facilities or duration <= 0:
+            return []
+        data = self._load_range_data(club_id, facilities.ids, date_from, date_to, sport_id=sport_id)
+        days = [date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1)]
+
+        streams = [
+            self._iter_facility_windows(facility_id, calendar_id, days, data, duration, not_before=not_before)
+            for facility_id, calendar_id in data['calendars'].items()
+        ]
+        return list(islice(heapq.merge(*streams), limit))
@@ -1,5 +1,9 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from odoo.exceptions import ValidationError
+from .sport_club_availability import merge_intervals
+
+# Exception fields read by the cached closure index
+CLOSURE_INDEX_FIELDS = ('calendar_template_id', 'date_from', 'date_to', 'is_closed')
 
 
 class CalendarException(models.Model):
@@ -84,3 +88,41 @@ class CalendarException(models.Model):
             "Duplicate exceptions are not allowed for the same calendar template."
         ),
     ]
+
+    # ============================================================
+    # Closure Index
+    # ============================================================
+    @api.model
+    @tools.ormcache('calendar_id')
+    def _get_closure_index(self, calendar_id):
+        """
+        Sorted, merged closed intervals (UTC) of a calendar template.
+        Cached per registry and invalidated whenever an exception changes.
+        :return: tuple (starts, ends) of parallel datetime tuples
+        """
+        exceptions = self.sudo().search_read([
+            ('calendar_template_id', '=', calendar_id),
+            ('is_closed', '=', True),
+        ], ['date_from', 'date_to'])
+        merged = merge_intervals((exc['date_from'], exc['date_to']) for exc in exceptions)
+        return tuple(start for start, _end in merged), tuple(end for _start, end in merged)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        if any(records.mapped('is_closed')):
+            self.env['sport.club.calendar']._clear_calendar_caches()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if any(field in vals for field in CLOSURE_INDEX_FIELDS):
+            self.env['sport.club.calendar']._clear_calendar_caches()
+        return res
+
+    def unlink(self):
+        closed = any(self.mapped('is_closed'))
+        res = super().unlink()
+        if closed:
+            self.env['sport.club.calendar']._clear_calendar_caches()
+        return res
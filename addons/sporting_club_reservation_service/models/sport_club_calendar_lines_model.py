@@ -86,6 +86,28 @@ class CalendarTemplateLine(models.Model):
         ),
     ]
 
+    # ============================================================
+    # Compiled Template Invalidation
+    # ============================================================
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        if records:
+            self.env['sport.club.calendar']._clear_calendar_caches()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if any(field in vals for field in ('calendar_template_id', 'day_of_week', 'start_time', 'end_time')):
+            self.env['sport.club.calendar']._clear_calendar_caches()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        if self:
+            self.env['sport.club.calendar']._clear_calendar_caches()
+        return res
+
     def add_reservation_slot(self):
         current_reservation_id = self.env['sport.club.reservation'].browse(self._context.get('current_reservation'))
 
@@ -1,4 +1,18 @@
-from odoo import models, fields
+from bisect import bisect_right
+from odoo import api, models, fields, tools
+
+# Calendar fields read by the cached calendar lookup
+CALENDAR_CACHE_FIELDS = ('club_id', 'facility_id', 'active')
+
+
+def template_day_contains(day_template, start, end):
+    """
+    Whether [start, end] fits inside one slot of a compiled template day.
+    Bisects the sorted starts and uses the running maximum of the ends.
+    """
+    starts, _ends, max_ends, _line_ids = day_template
+    position = bisect_right(starts, start) - 1
+    return position >= 0 and max_ends[position] >= end
 
 
 class SportClubCalendarModel(models.Model):
@@ -78,4 +92,85 @@ class SportClubCalendarModel(models.Model):
             'context': {
                 'default_calendar_id': self.id,
             },
-        }
\ No newline at end of file
+        }
+
+    # ============================================================
+    # Compiled Templates
+    # ============================================================
+    @api.model
+    @tools.ormcache('club_id', 'facility_id')
+    def _get_calendar_id(self, club_id, facility_id):
+        """Id of the calendar template used by a club facility (cached)."""
+        calendar = self.sudo().search([
+            ('club_id', '=', club_id),
+            ('facility_id', '=', facility_id),
+        ], limit=1)
+        return calendar.id or False
+
+    @api.model
+    @tools.ormcache('calendar_id')
+    def _get_compiled_template(self, calendar_id):
+        """
+        In-process representation of a calendar template, cached per registry
+        and invalidated on any write to the template or its lines.
+        :return: tuple indexed by weekday (0 = Monday) of
+                 (starts, ends, max_ends, line_ids) tuples sorted by start
+        """
+        days = [[] for _day in range(7)]
+        for line in self.env['sport.club.calendar.line'].sudo().search_read([
+            ('calendar_template_id', '=', calendar_id),
+        ], ['day_of_week', 'start_time', 'end_time'], order='start_time, end_time'):
+            days[int(line['day_of_week'])].append((line['start_time'], line['end_time'], line['id']))
+
+        compiled = []
+        for slots in days:
+            max_ends = []
+            for _start, end, _line_id in slots:
+                max_ends.append(max(end, max_ends[-1]) if max_ends else end)
+            compiled.append((
+                tuple(slot[0] for slot in slots),
+                tuple(slot[1] for slot in slots),
+                tuple(max_ends),
+                tuple(slot[2] for slot in slots),
+            ))
+        return tuple(compiled)
+
+    @api.model
+    def _get_template_day_slots(self, calendar_id, weekday):
+        """Slots of a weekday as sorted (start, end, line_id) tuples."""
+        starts, ends, _max_ends, line_ids = self._get_compiled_template(calendar_id)[int(weekday)]
+        return list(zip(starts, ends, line_ids))
+
+    @api.model
+    def _template_contains(self, calendar_id, weekday, start, end):
+        """Whether [start, end] fits inside one slot of the template weekday."""
+        return template_day_contains(self._get_compiled_template(calendar_id)[int(weekday)], start, end)
+
+    @api.model
+    def _clear_calendar_caches(self):
+        """
+        Drop the cached calendar ids, compiled templates and closure indexes.
+        Bulk updates pass `defer_calendar_cache_clear` and call this once at the end.
+        """
+        if not self.env.context.get('defer_calendar_cache_clear'):
+            self.env.registry.clear_cache()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        # Lines clear the compiled templates themselves; only the calendar lookup changes here
+        if any(vals.get('club_id') or vals.get('facility_id') for vals in vals_list):
+            self._clear_calendar_caches()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if any(field in vals for field in CALENDAR_CACHE_FIELDS):
+            self._clear_calendar_caches()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        if self:
+            self._clear_calendar_caches()
+        return res
@@ -1,4 +1,9 @@
-from odoo import models, fields
+from odoo import api, models, fields, tools
+
+# Internal references of the service products invoiced on reservations
+SERVICE_PRODUCT_CODES = frozenset({'trainer_00_trainer', 'club_00_club', 'promotion_00_promotion'})
+# Fields whose change can alter which service product a default_code resolves to
+SERVICE_PRODUCT_FIELDS = ('default_code', 'type', 'company_id', 'active', 'product_tmpl_id')
 
 
 class SportClubEquipmentProduct(models.Model):
@@ -41,3 +46,72 @@ class SportClubEquipmentProduct(models.Model):
         currency_field='currency_id',
         help="Rental price per hour for this equipment.",
     )
+
+    # ============================================================
+    # Service Products (invoice lines of reservations)
+    # ============================================================
+    @api.model
+    @tools.ormcache('default_code', 'company_id')
+    def _get_service_product_id(self, default_code, company_id):
+        """Id of the service product with this internal reference (cached per registry)."""
+        product = self.sudo().search([
+            ('default_code', '=', default_code),
+            ('type', '=', 'service'),
+            ('company_id', 'in', [company_id, False]),
+        ], order='company_id, id', limit=1)
+        return product.id or False
+
+    @api.model
+    def _get_service_product(self, default_code, values):
+        """Service product of a default_code, created from `values` the first time."""
+        product_id = self._get_service_product_id(default_code, self.env.company.id)
+        if product_id:
+            return self.sudo().browse(product_id)
+        return self.sudo().create(dict(values, default_code=default_code, type='service'))
+
+    @api.model
+    def _clear_service_product_cache(self, default_codes):
+        """Drop the cached service product ids when one of `default_codes` is a service product code."""
+        if SERVICE_PRODUCT_CODES.intersection(default_codes):
+            self.env.registry.clear_cache()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self._clear_service_product_cache([vals.get('default_code') for vals in vals_list])
+        return records
+
+    def write(self, vals):
+        service_fields = any(field in vals for field in SERVICE_PRODUCT_FIELDS)
+        default_codes = self.mapped('default_code') if service_fields else []
+        res = super().write(vals)
+        if service_fields:
+            self._clear_service_product_cache(default_codes + [vals.get('default_code')])
+        return res
+
+    def unlink(self):
+        default_codes = self.mapped('default_code')
+        res = super().unlink()
+        self.env['product.product']._clear_service_product_cache(default_codes)
+        return res
+
+
+class ProductTemplate(models.Model):
+    _inherit = "product.template"
+
+    def _get_variant_default_codes(self):
+        return self.with_context(active_test=False).product_variant_ids.mapped('default_code')
+
+    def write(self, vals):
+        service_fields = any(field in vals for field in SERVICE_PRODUCT_FIELDS)
+        default_codes = self._get_variant_default_codes() if service_fields else []
+        res = super().write(vals)
+        if service_fields:
+            self.env['product.product']._clear_service_product_cache(default_codes + [vals.get('default_code')])
+        return res
+
+    def unlink(self):
+        default_codes = self._get_variant_default_codes()
+        res = super().unlink()
+        self.env['product.product']._clear_service_product_cache(default_codes)
+        return res
@@ -0,0 +1,118 @@
+import logging
+from datetime import timedelta
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_IDEMPOTENCY_TTL_HOURS = 24
+
+
+class SportClubIdempotencyKey(models.Model):
+    """
+    Model: Idempotency Key
+    ----------------------
+    Response cache of mutating API calls sent with an `Idempotency-Key` header.
+    A retried request with the same key replays the stored response instead of
+    running the call again. Rows expire after a TTL and are purged by a cron.
+    """
+    _name = "sport.club.idempotency.key"
+    _description = "API Idempotency Key"
+    _log_access = False
+
+    key = fields.Char(
+        string="Key",
+        required=True,
+    )
+    user_id = fields.Many2one(
+        comodel_name="res.users",
+        string="User",
+        required=True,
+        ondelete="cascade",
+    )
+    route = fields.Char(
+        string="Route",
+        required=True,
+        help="HTTP method and path of the original request."
+    )
+    request_hash = fields.Char(
+        string="Request Fingerprint",
+        help="SHA-256 of the original request body."
+    )
+    state = fields.Selection(
+        selection=[
+            ("processing", "Processing"),
+            ("done", "Done"),
+        ],
+        string="Status",
+        required=True,
+        default="processing",
+    )
+    status_code = fields.Integer(
+        string="HTTP Status",
+    )
+    response_body = fields.Text(
+        string="Response Body",
+    )
+    expires_at = fields.Datetime(
+        string="Expires At",
+        required=True,
+        index=True,
+    )
+
+    _sql_constraints = [
+        (
+            "unique_user_key",
+            "unique(user_id, key)",
+            "An idempotency key can only be used once per user.",
+        ),
+    ]
+
+    @api.model
+    def _claim(self, key, user_id, route, request_hash, ttl_hours=DEFAULT_IDEMPOTENCY_TTL_HOURS):
+        """
+        Register a key for the current request.
+        A concurrent request with the same key blocks on the unique index until the
+        first one commits and then fails with a serialization error: request
+        cursors run in REPEATABLE READ. The API routes let that error through so
+        Odoo retries the request, and the retry sees the committed key.
+        :return: (record, claimed) where claimed is False if the key was already known
+        """
+        now = fields.Datetime.now()
+        self.env.cr.execute(
+            "DELETE FROM sport_club_idempotency_key WHERE user_id = %s AND key = %s AND expires_at <= %s",
+            (user_id, key, now),
+        )
+        self.env.cr.execute("""
+            INSERT INTO sport_club_idempotency_key (key, user_id, route, request_hash, state, expires_at)
+            VALUES (%s, %s, %s, %s, 'processing', %s)
+            ON CONFLICT (user_id, key) DO NOTHING
+            RETURNING id
+        """, (key, user_id, route, request_hash, now + timedelta(hours=ttl_hours)))
+        row = self.env.cr.fetchone()
+        if row:
+            return self.browse(row[0]), True
+        self.invalidate_model()
+        return self.search([('user_id', '=', user_id), ('key', '=', key)], limit=1), False
+
+    def _store_response(self, status_code, body):
+        """Keep successful responses for replay; forget the key otherwise so the client can retry."""
+        if 200 <= status_code < 300:
+            self.write({
+                'state': 'done',
+                'status_code': status_code,
+                'response_body': body,
+            })
+        else:
+            self.unlink()
+
+    @api.model
+    def _cron_purge_expired_keys(self):
+        """Delete every expired key with a single statement."""
+        self.env.cr.execute(
+            "DELETE FROM sport_club_idempotency_key WHERE expires_at <= %s",
+            (fields.Datetime.now(),),
+        )
+        purged = self.env.cr.rowcount
+        self.invalidate_model()
+        _logger.info("Idempotency keys: %s expired keys purged.", purged)
+        return purged
@@ -1,5 +1,8 @@
+import pytz
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError,UserError
+from odoo.addons.base.models.res_partner import _tz_get
+from .sport_club_availability import DEFAULT_TZ
 
 class SportClubModel(models.Model):
     _name = "sport.club.model"
@@ -82,6 +85,13 @@ class SportClubModel(models.Model):
         required=True,
         tracking=True
     )
+    tz = fields.Selection(
+        selection=_tz_get,
+        string="Timezone",
+        default=DEFAULT_TZ,
+        tracking=True,
+        help="Local timezone of the club, used to store reservation times in UTC."
+    )
     attachment_ids = fields.Many2many(
         comodel_name="ir.attachment",
         string="Attachments",
@@ -101,31 +111,31 @@ class SportClubModel(models.Model):
     )
     facilities_count = fields.Integer(
         string="Facilities Count",
-        compute='_calculate_facilities_count'
+        compute='_compute_counters'
     )
     calendar_schedual_count = fields.Integer(
         string="Calendar Schedual Count",
-        compute='_calculate_calendar_schedual_count'
+        compute='_compute_counters'
     )
     pricing_rule_count = fields.Integer(
         string="Pricing Rule Count",
-        compute='_calculate_pricing_rule_count'
+        compute='_compute_counters'
     )
     promotions_count = fields.Integer(
         string="Promotions Count",
-        compute='_calculate_promotions_count'
+        compute='_compute_counters'
     )
     reservations_count = fields.Integer(
         string="Reservations Count",
-        compute='_calculate_reservations_count'
+        compute='_compute_counters'
     )
     trainers_count = fields.Integer(
         string="Trainers Count",
-        compute='_calculate_trainers_count'
+        compute='_compute_counters'
     )
     trainers_sessions_count = fields.Integer(
         string="Trainers Sessions Count",
-        compute='_calculate_trainers_sessions_count'
+        compute='_compute_counters'
     )
     partner_address_id = fields.Many2one(
         comodel_name='res.partner',
@@ -180,36 +190,55 @@ class SportClubModel(models.Model):
         self._sync_partner_address()
         return res
 
-    def _calculate_facilities_count(self):
-        for rec in self:
-            rec.facilities_count = self.env['sport.club.facility'].search_count([('sport_club_id','=',rec.id)])
-
-    def _calculate_calendar_schedual_count(self):
-        for rec in self:
-            club_facilities = self.env['sport.club.facility'].search([('sport_club_id', '=', rec.id)])
-            rec.calendar_schedual_count = 0
-            if club_facilities:
-                rec.calendar_schedual_count = self.env['sport.club.calendar'].search_count([('facility_id','in',club_facilities.ids)])
-
-    def _calculate_pricing_rule_count(self):
-        for rec in self:
-            rec.pricing_rule_count = self.env['sport.club.pricing.rule'].search_count([('sport_club_id', '=', rec.id)])
+    def _get_tz(self):
+        """Local timezone of the club; the default one for an empty recordset."""
+        return pytz.timezone(self[:1].tz or DEFAULT_TZ)
 
-    def _calculate_promotions_count(self):
-        for rec in self:
-            rec.promotions_count = self.env['sport.club.promotion'].search_count([('club_id', '=', rec.id)])
+    def _count_per_club(self, model, club_field):
+        """Number of `model` records per club, with a single grouped query."""
+        return {
+            club.id: count
+            for club, count in self.env[model]._read_group(
+                [(club_field, 'in', self.ids)], [club_field], ['__count'],
+            )
+        }
 
-    def _calculate_reservations_count(self):
-        for rec in self:
-            rec.reservations_count = self.env['sport.club.reservation'].search_count([('club_id', '=', rec.id)])
+    def _compute_counters(self):
+        """Every smart-button counter of the recordset, with one query per comodel."""
+        facility_club = {
+            facility['id']: facility['sport_club_id'][0]
+            for facility in self.env['sport.club.facility'].search_read(
+                [('sport_club_id', 'in', self.ids)], ['sport_club_id'],
+            )
+        }
+        calendars = {}
+        for facility, count in self.env['sport.club.calendar']._read_group(
+            [('facility_id', 'in', list(facility_club))], ['facility_id'], ['__count'],
+        ):
+            club_id = facility_club[facility.id]
+            calendars[club_id] = calendars.get(club_id, 0) + count
+        facilities = {}
+        for club_id in facility_club.values():
+            facilities[club_id] = facilities.get(club_id, 0) + 1
 
-    def _calculate_trainers_count(self):
-        for rec in self:
-            rec.trainers_count = self.env['sport.club.trainer'].search_count([('club_id', '=', rec.id)])
+        ClubCounter = self.env['sport.club.reservation.counter']
+        if ClubCounter._is_enabled():
+            reservations = ClubCounter._get_counts(self.ids)
+        else:
+            reservations = self._count_per_club('sport.club.reservation', 'club_id')
+        pricing_rules = self._count_per_club('sport.club.pricing.rule', 'sport_club_id')
+        promotions = self._count_per_club('sport.club.promotion', 'club_id')
+        trainers = self._count_per_club('sport.club.trainer', 'club_id')
+        sessions = self._count_per_club('sport.club.training.session', 'club_id')
 
-    def _calculate_trainers_sessions_count(self):
         for rec in self:
-            rec.trainers_sessions_count = self.env['sport.club.training.session'].search_count([('club_id', '=', rec.id)])
+            rec.facilities_count = facilities.get(rec.id, 0)
+            rec.calendar_schedual_count = calendars.get(rec.id, 0)
+            rec.pricing_rule_count = pricing_rules.get(rec.id, 0)
+            rec.promotions_count = promotions.get(rec.id, 0)
+            rec.reservations_count = reservations.get(rec.id, 0)
+            rec.trainers_count = trainers.get(rec.id, 0)
+            rec.trainers_sessions_count = sessions.get(rec.id, 0)
 
     # --------------------------------------
     # VALIDATIONS
@@ -0,0 +1,109 @@
+import numpy as np
+from datetime import timedelta
+from odoo import api, fields, models, _
+from odoo.exceptions import AccessError, ValidationError
+from .sport_club_availability import ACTIVE_RESERVATION_STATES
+
+# 5-minute resolution used to rasterize reservations before aggregating per hour
+BUCKETS_PER_HOUR = 12
+MAX_HEATMAP_RANGE_DAYS = 62
+
+
+def rasterize_occupancy(facility_idx, day_idx, time_from, time_to, facility_count, day_count,
+                        buckets_per_hour=BUCKETS_PER_HOUR):
+    """
+    Rasterize reservations into a facility x day x hour occupancy array.
+    Each reservation adds +1 at its first bucket and -1 after its last one; a
+    cumulative sum over the bucket axis then marks every busy bucket at once.
+    :return: float array of shape (facility_count, day_count, 24) in percent
+    """
+    buckets = 24 * buckets_per_hour
+    grid = np.zeros((facility_count, day_count, buckets + 1), dtype=np.int32)
+    start = np.clip(np.floor(time_from * buckets_per_hour + 1e-9), 0, buckets).astype(np.intp)
+    end = np.clip(np.ceil(time_to * buckets_per_hour - 1e-9), 0, buckets).astype(np.intp)
+    valid = end > start
+    np.add.at(grid, (facility_idx[valid], day_idx[valid], start[valid]), 1)
+    np.add.at(grid, (facility_idx[valid], day_idx[valid], end[valid]), -1)
+    busy = np.cumsum(grid, axis=2)[:, :, :buckets] > 0
+    return busy.reshape(facility_count, day_count, 24, buckets_per_hour).mean(axis=3) * 100.0
+
+
+class SportClubOccupancyHeatmap(models.AbstractModel):
+    """
+    Hour-by-day occupancy heatmap of the facilities of a club.
+    Reservations are loaded with a single query and rasterized with NumPy.
+    """
+    _name = "sport.club.occupancy.heatmap"
+    _description = "Facility Occupancy Heatmap"
+
+    @api.model
+    def _load_reservation_columns(self, facility_ids, date_from, date_to):
+        """Fetch (facility_id, date, time_from, time_to) of the active reservations in one query."""
+        self.env['sport.club.reservation'].flush_model(['facility_id', 'date', 'time_from', 'time_to', 'state', 'active'])
+        self.env.cr.execute("""
+            SELECT facility_id, date, time_from, time_to
+              FROM sport_club_reservation
+             WHERE facility_id = ANY(%s)
+               AND date BETWEEN %s AND %s
+               AND active
+               AND time_from < time_to
+               AND state IN %s
+        """, (list(facility_ids), date_from, date_to, tuple(ACTIVE_RESERVATION_STATES)))
+        return self.env.cr.fetchall()
+
+    @api.model
+    def _compute_heatmap(self, facilities, date_from, date_to):
+        """
+        :return: dict with the facilities, the days and, per facility, a
+                 day x hour matrix of occupancy percentages
+        """
+        date_from = fields.Date.to_date(date_from)
+        date_to = fields.Date.to_date(date_to or date_from)
+        if not date_from:
+            raise ValidationError(_("Start date is required."))
+        if date_to < date_from:
+            raise ValidationError(_("The end date must be later than the start date."))
+        day_count = (date_to - date_from).days + 1
+        if day_count > MAX_HEATMAP_RANGE_DAYS:
+            raise ValidationError(_("The date range cannot exceed %s days.") % MAX_HEATMAP_RANGE_DAYS)
+
+        facility_index = {facility.id: index for index, facility in enumerate(facilities)}
+        rows = self._load_reservation_columns(facilities.ids, date_from, date_to) if facilities else []
+
+        heatmap = rasterize_occupancy(
+            np.array([facility_index[row[0]] for row in rows], dtype=np.intp),
+            np.array([(row[1] - date_from).days for row in rows], dtype=np.intp),
+            np.array([row[2] for row in rows], dtype=float),
+            np.array([row[3] for row in rows], dtype=float),
+            len(facility_index),
+            day_count,
+        )
+
+        return {
+            "date_from": str(date_from),
+            "date_to": str(date_to),
+            "days": [str(date_from + timedelta(days=offset)) for offset in range(day_count)],
+            "hours": list(range(24)),
+            "facilities": [
+                {
+                    "id": facility.id,
+                    "name": facility.display_name,
+                    "occupancy": round(float(heatmap[index].mean()), 2),
+                    "matrix": np.round(heatmap[index], 2).tolist(),
+                }
+                for index, facility in enumerate(facilities)
+            ],
+        }
+
+    @api.model
+    def get_heatmap_data(self, club_id, date_from, date_to, facility_ids=None):
+        """Heatmap of the facilities of a club the current user can see (backend client action)."""
+        if not self.env.user.has_group('sporting_club_reservation_service.sport_club_reservations_user'):
+            raise AccessError(_("You are not allowed to view the occupancy heatmap."))
+        if not club_id:
+            raise ValidationError(_("Club is required."))
+        domain = [('sport_club_id', '=', int(club_id))]
+        if facility_ids:
+            domain.append(('id', 'in', [int(f) for f in facility_ids]))
+        facilities = self.env['sport.club.facility'].search(domain, order='name, id')
+        return self._compute_heatmap(facilities, date_from, date_to)
@@ -1,8 +1,7 @@
-import random
-import string
 from datetime import datetime, date
-from odoo import models, fields, api
+from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
+from .code_generator import generate_unique_codes
 
 
 class SportClubPromotion(models.Model):
@@ -113,6 +112,22 @@ class SportClubPromotion(models.Model):
         help="Used to assign a color for this calendar template in views "
              "(e.g., calendar or kanban)."
     )
+    coupon_ids = fields.One2many(
+        comodel_name="sport.club.promotion.coupon",
+        inverse_name="promotion_id",
+        string="Coupons",
+    )
+    coupon_count = fields.Integer(
+        compute="_compute_coupon_count",
+    )
+
+    def _compute_coupon_count(self):
+        counts = dict(self.env['sport.club.promotion.coupon']._read_group(
+            [('promotion_id', 'in', self.ids)], ['promotion_id'], ['__count'],
+        ))
+        for rec in self:
+            rec.coupon_count = counts.get(rec, 0)
+
     # ============================================================
     # Constraints / Validations
     # ============================================================
@@ -140,30 +155,51 @@ class SportClubPromotion(models.Model):
             if rec.usage_limit and rec.usage_count > rec.usage_limit:
                 raise ValidationError("Promotion Usage count cannot exceed usage limit.")
 
-    @api.constrains("code")
-    def _check_code_unique(self):
-        for rec in self:
-            if rec.code and rec.code != 'New':
-                existing = self.search([("code", "=", rec.code), ("id", "!=", rec.id)], limit=1)
-                if existing:
-                    raise ValidationError("Promo Code must be unique.")
+    _sql_constraints = [
+        (
+            "unique_code",
+            "unique(code)",
+            "Promo Code must be unique.",
+        ),
+    ]
 
     # ============================================================
     # Helpers
     # ============================================================
-    def _generate_coupon_code(self):
-        """Generates a random, unique coupon code in the format 'XXXX-XXXX-XXXX'."""
-        length = 4
-        characters = string.ascii_uppercase + string.digits
-        characters = ''.join(c for c in characters if c not in '01IO')
+    def _generate_coupon_codes(self, count):
+        """Unique promo codes in the format 'XXXX-XXXX-XXXX' for a whole batch, checked with one query."""
+        return generate_unique_codes(self, 'code', count, groups=3, length=4)
+
+    def _generate_coupons(self, quantity):
+        """Create `quantity` single-use coupons for the promotion in one batch."""
+        self.ensure_one()
+        Coupon = self.env['sport.club.promotion.coupon']
+        codes = generate_unique_codes(Coupon, 'code', quantity, groups=3, length=4)
+        return Coupon.create([{'promotion_id': self.id, 'code': code} for code in codes])
 
-        while True:
-            code = "-".join(
-                ''.join(random.choice(characters) for _ in range(length))
-                for _ in range(3)
-            )
-            if not self.search([('code', '=', code)]):
-                return code
+    def action_open_coupon_generator(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Generate Coupons'),
+            'res_model': 'sport.club.promotion.coupon.generator',
+            'view_mode': 'form',
+            'target': 'new',
+            'context': {
+                'default_promotion_id': self.id,
+            },
+        }
+
+    def action_view_coupons(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Coupons'),
+            'res_model': 'sport.club.promotion.coupon',
+            'view_mode': 'list',
+            'domain': [('promotion_id', '=', self.id)],
+            'context': {'default_promotion_id': self.id},
+        }
 
     def is_valid(self):
         """Check if promotion is currently valid"""
@@ -195,13 +231,105 @@ class SportClubPromotion(models.Model):
     # ============================================================
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            if vals.get('code', 'New') == 'New':
-                vals['code'] = self._generate_coupon_code()
+        pending = [vals for vals in vals_list if vals.get('code', 'New') == 'New']
+        for vals, code in zip(pending, self._generate_coupon_codes(len(pending))):
+            vals['code'] = code
         return super(SportClubPromotion, self).create(vals_list)
 
     def write(self, vals):
         """Prevent manual overwrite of code unless regenerating."""
         if "code" in vals and vals["code"] != self.code:
             raise ValidationError("Promo Code cannot be changed once generated.")
-        return super(SportClubPromotion, self).write(vals)
\ No newline at end of file
+        return super(SportClubPromotion, self).write(vals)
+
+
+class SportClubPromotionCoupon(models.Model):
+    """
+    Model: Promotion Coupon
+    -----------------------
+    Single-use code attached to a promotion, generated in bulk for marketing campaigns.
+    """
+    _name = "sport.club.promotion.coupon"
+    _description = "Sport Club Promotion Coupon"
+    _order = "id desc"
+    _rec_name = "code"
+
+    code = fields.Char(
+        string="Coupon Code",
+        required=True,
+        readonly=True,
+        copy=False,
+        index=True,
+    )
+    promotion_id = fields.Many2one(
+        comodel_name="sport.club.promotion",
+        string="Promotion",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    club_id = fields.Many2one(
+        related="promotion_id.club_id",
+        store=True,
+    )
+    reservation_id = fields.Many2one(
+        comodel_name="sport.club.reservation",
+        string="Used On",
+        readonly=True,
+        copy=False,
+    )
+    used = fields.Boolean(
+        string="Used",
+        compute="_compute_used",
+        store=True,
+    )
+
+    _sql_constraints = [
+        (
+            "unique_code",
+            "unique(code)",
+            "Coupon Code must be unique.",
+        ),
+    ]
+
+    @api.depends('reservation_id')
+    def _compute_used(self):
+        for rec in self:
+            rec.used = bool(rec.reservation_id)
+
+    @api.model
+    def _redeem(self, code, reservation):
+        """
+        Use a coupon on a reservation and apply its promotion.
+        The coupon is claimed with a conditional UPDATE, so two concurrent
+        bookings can never redeem the same code.
+        """
+        reservation.ensure_one()
+        coupon = self.sudo().search([('code', '=', code)], limit=1)
+        if not coupon:
+            raise ValidationError(_("Coupon '%s' not found.") % code)
+        promotion = coupon.promotion_id
+        if promotion.club_id != reservation.club_id:
+            raise ValidationError(_("Coupon '%s' is not valid for this club.") % code)
+        if promotion.facility_ids and reservation.facility_id not in promotion.facility_ids:
+            raise ValidationError(_("Coupon '%s' is not valid for this facility.") % code)
+        if promotion.sport_ids and reservation.sport_id not in promotion.sport_ids:
+            raise ValidationError(_("Coupon '%s' is not valid for this sport.") % code)
+        if not promotion.is_valid():
+            raise ValidationError(_("The promotion of coupon '%s' is not active anymore.") % code)
+
+        self.flush_model(['reservation_id', 'used'])
+        self.env.cr.execute("""
+            UPDATE sport_club_promotion_coupon
+               SET reservation_id = %s,
+                   used = TRUE,
+                   write_uid = %s,
+                   write_date = %s
+             WHERE id = %s
+               AND reservation_id IS NULL
+        """, (reservation.id, self.env.uid, fields.Datetime.now(), coupon.id))
+        if not self.env.cr.rowcount:
+            raise ValidationError(_("Coupon '%s' has already been used.") % code)
+        coupon.invalidate_recordset(['reservation_id', 'used', 'write_uid', 'write_date'])
+        reservation.write({'coupon_id': coupon.id, 'promotion_id': promotion.id})
+        return coupon
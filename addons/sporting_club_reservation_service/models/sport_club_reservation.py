@@ -1,11 +1,23 @@
-import io
-import random
-import string
-import base64
-import qrcode
+import logging
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError,UserError
+from odoo.tools import create_index
 from markupsafe import Markup,escape
+from .sport_club_availability import ACTIVE_RESERVATION_STATES, find_overlap, local_to_utc
+from .sport_club_slot_occupancy import OCCUPANCY_FIELDS
+from .sport_club_reservation_counter import COUNTER_FIELDS
+from .code_generator import generate_unique_codes
+from .qr_code import QR_CACHE, qr_cache_key, render_qr_png
+
+_logger = logging.getLogger(__name__)
+
+# Reservation payment state of each invoice payment state (anything else is unpaid)
+INVOICE_PAYMENT_STATES = {
+    'paid': 'paid',
+    'partial': 'partial',
+    'reversed': 'refunded',
+}
+
 
 class Reservation(models.Model):
     _name = "sport.club.reservation"
@@ -118,6 +130,18 @@ class Reservation(models.Model):
         store=True,
         help="Automatically calculated as End - Start in hours.",
     )
+    start_at = fields.Datetime(
+        string="Starts At",
+        compute="_compute_interval_bounds",
+        store=True,
+        help="Start of the booked interval in UTC, derived from the date, the times and the club timezone.",
+    )
+    end_at = fields.Datetime(
+        string="Ends At",
+        compute="_compute_interval_bounds",
+        store=True,
+        help="End of the booked interval in UTC, derived from the date, the times and the club timezone.",
+    )
 
     # ============================================================
     # Financials
@@ -151,6 +175,19 @@ class Reservation(models.Model):
         comodel_name="sport.club.promotion",
         string="Promotion Applied",
     )
+    coupon_id = fields.Many2one(
+        comodel_name="sport.club.promotion.coupon",
+        string="Coupon",
+        readonly=True,
+        copy=False,
+        tracking=True,
+    )
+    coupon_code = fields.Char(
+        string="Coupon Code",
+        compute="_compute_coupon_code",
+        inverse="_inverse_coupon_code",
+        help="Single-use coupon code; redeeming it applies the promotion of the coupon.",
+    )
     tax_id = fields.Many2one(
         comodel_name="account.tax",
         string="Taxes",
@@ -188,9 +225,12 @@ class Reservation(models.Model):
             ("paid", "Paid"),
             ("refunded", "Refunded"),
         ],
-        compute='_compute_payment_state',
         string="Payment Status",
-        default="unpaid",
+        compute="_compute_payment_state",
+        store=True,
+        copy=False,
+        index=True,
+        help="Payment state of the invoice, recomputed whenever the invoice payment state changes.",
     )
     payment_ids = fields.Many2many(
         comodel_name="account.payment",
@@ -199,12 +239,8 @@ class Reservation(models.Model):
     )
 
     # ============================================================
-    # QR / Tracking
+    # Tracking
     # ============================================================
-    qr_image = fields.Binary(
-        string="QR Code",
-        attachment=True,
-    )
     notes = fields.Text(
         string="Notes",
         tracking=True
@@ -228,6 +264,14 @@ class Reservation(models.Model):
         string="Cancellation Policy",
         tracking=True
     )
+    series_id = fields.Many2one(
+        comodel_name="sport.club.reservation.series",
+        string="Series",
+        index=True,
+        copy=False,
+        ondelete="set null",
+        help="Recurring series this reservation was generated from."
+    )
 
     # ============================================================
     # Check-in/out
@@ -283,7 +327,8 @@ class Reservation(models.Model):
     invoice_id = fields.Many2one(
         comodel_name="account.move",
         string="Invoice",
-        copy=False
+        copy=False,
+        index=True,
     )
     payment_count = fields.Integer(
         compute='_compute_payment_count'
@@ -296,35 +341,143 @@ class Reservation(models.Model):
         compute="_compute_training_session_count",
     )
 
+    # ============================================================
+    # Post-booking Pipeline
+    # ============================================================
+    job_ids = fields.One2many(
+        comodel_name="sport.club.reservation.job",
+        inverse_name="reservation_id",
+        string="Processing Steps",
+    )
+    job_state = fields.Selection(
+        selection=[
+            ("pending", "Processing"),
+            ("failed", "Failed"),
+            ("done", "Done"),
+        ],
+        string="Processing",
+        compute="_compute_job_state",
+        store=True,
+    )
+
+    # Overlapping active reservations are rejected atomically by PostgreSQL.
+    # The booked range is derived from the stored date/time columns so there is
+    # nothing extra to keep in sync; reservations without a sport collide with each
+    # other, as in _find_overlapping_reservations. Requires btree_gist (see _auto_init).
+    _sql_constraints = [
+        (
+            "no_overlapping_reservation",
+            "EXCLUDE USING gist ("
+            "facility_id WITH =, (COALESCE(sport_id, 0)) WITH =, date WITH =, "
+            "numrange(time_from::numeric, time_to::numeric) WITH &&"
+            ") WHERE (active AND time_from < time_to AND state IN ('requested', 'confirmed', 'checked_in'))",
+            "The selected time slot overlaps with an existing reservation for the same facility and sport.",
+        ),
+        (
+            "unique_code",
+            "unique(code)",
+            "The reservation code must be unique.",
+        ),
+    ]
+
+    def _auto_init(self):
+        # btree_gist provides the '=' operator class for integer/date columns in GiST indexes;
+        # it must exist before _sql_constraints are added, which happens before init()
+        self.env.cr.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        return super()._auto_init()
+
+    def init(self):
+        # Interval lookups only ever target the active reservations of a facility
+        create_index(
+            self.env.cr,
+            'sport_club_reservation_interval_index',
+            self._table,
+            ['facility_id', 'sport_id', 'start_at', 'end_at'],
+            where="active AND state IN (%s)" % ", ".join("'%s'" % state for state in ACTIVE_RESERVATION_STATES),
+        )
+
     # ============================================================
     # Compute Methods
     # ============================================================
 
+    @api.depends('date', 'time_from', 'time_to', 'club_id.tz')
+    def _compute_interval_bounds(self):
+        for rec in self:
+            if not rec.date:
+                rec.start_at = rec.end_at = False
+                continue
+            tz = rec.club_id._get_tz()
+            rec.start_at = local_to_utc(rec.date, rec.time_from, tz)
+            rec.end_at = local_to_utc(rec.date, rec.time_to, tz)
+
+    @api.depends('coupon_id')
+    def _compute_coupon_code(self):
+        for rec in self:
+            rec.coupon_code = rec.coupon_id.code
+
+    def _inverse_coupon_code(self):
+        Coupon = self.env['sport.club.promotion.coupon']
+        for rec in self:
+            code = (rec.coupon_code or '').strip()
+            if code and code != rec.coupon_id.code:
+                Coupon._redeem(code, rec)
+
+    @api.depends('job_ids.state')
+    def _compute_job_state(self):
+        for rec in self:
+            states = set(rec.job_ids.mapped('state'))
+            if 'failed' in states:
+                rec.job_state = 'failed'
+            elif 'pending' in states:
+                rec.job_state = 'pending'
+            else:
+                rec.job_state = 'done' if states else False
+
     def _compute_training_session_count(self):
         TrainingSession = self.env['sport.club.training.session']
         for rec in self:
             rec.training_session_count = TrainingSession.search_count([('reservation_id', '=', rec.id)])
 
+    def _get_payment_ids_by_reservation(self):
+        """
+        Payments of the invoices and credit notes of the whole recordset, fetched
+        with one query for the credit notes and one grouped query for the payments.
+        :return: dict {reservation_id: [payment_ids]}
+        """
+        moves_by_invoice = {}
+        for rec in self:
+            if rec.invoice_id:
+                moves_by_invoice.setdefault(rec.invoice_id.id, {rec.invoice_id.id})
+        if not moves_by_invoice:
+            return {}
+
+        # Include credit notes (refunds) linked to the invoices
+        for credit_note in self.env['account.move'].search_read([
+            ('reversed_entry_id', 'in', list(moves_by_invoice)),
+            ('move_type', '=', 'out_refund'),
+        ], ['reversed_entry_id']):
+            moves_by_invoice[credit_note['reversed_entry_id'][0]].add(credit_note['id'])
+
+        all_move_ids = set().union(*moves_by_invoice.values())
+        payments_by_move = {
+            move.id: payment_ids
+            for move, payment_ids in self.env['account.payment']._read_group(
+                [('invoice_ids', 'in', list(all_move_ids))], ['invoice_ids'], ['id:array_agg'],
+            )
+        }
+        result = {}
+        for rec in self:
+            payment_ids = set()
+            for move_id in moves_by_invoice.get(rec.invoice_id.id, ()):
+                payment_ids.update(payments_by_move.get(move_id, ()))
+            result[rec.id] = sorted(payment_ids)
+        return result
+
     @api.depends('invoice_id')
     def _compute_payment_count(self):
+        payments = self._get_payment_ids_by_reservation()
         for rec in self:
-            move_ids = []
-            if rec.invoice_id:
-                move_ids.append(rec.invoice_id.id)
-
-                # Include credit notes (refunds) linked to this invoice
-                credit_notes = self.env['account.move'].search([
-                    ('reversed_entry_id', '=', rec.invoice_id.id),
-                    ('move_type', '=', 'out_refund'),
-                ])
-                move_ids += credit_notes.ids
-
-            if move_ids:
-                rec.payment_count = self.env['account.payment'].search_count([
-                    ('invoice_ids', 'in', move_ids)
-                ])
-            else:
-                rec.payment_count = 0
+            rec.payment_count = len(payments.get(rec.id, []))
 
     @api.depends('invoice_id')
     def _check_invoice_is_full_paid(self):
@@ -333,32 +486,49 @@ class Reservation(models.Model):
 
     @api.depends('invoice_id')
     def _get_all_payments(self):
+        payments = self._get_payment_ids_by_reservation()
         for rec in self:
-            move_ids = [self.invoice_id.id]
+            rec.payment_ids = [(6, 0, payments.get(rec.id, []))]
 
-            # Add credit note(s) created from refund
-            credit_notes = self.env['account.move'].search([
-                ('reversed_entry_id', '=', self.invoice_id.id),
-                ('move_type', '=', 'out_refund'),
-            ])
-            move_ids += credit_notes.ids
-            all_payments = self.env['account.payment'].search([('invoice_ids','in',move_ids)])
-            rec.payment_ids = [(6,0,all_payments.ids)]
-
-    @api.depends('invoice_id', 'invoice_id.payment_state')
+    @api.depends('invoice_id.payment_state')
     def _compute_payment_state(self):
         for rec in self:
-            if rec.invoice_id:
-                if rec.invoice_id.payment_state == 'paid':
-                    rec.payment_state = 'paid'
-                elif rec.invoice_id.payment_state == 'partial':
-                    rec.payment_state = 'partial'
-                elif rec.invoice_id.payment_state == 'reversed':
-                    rec.payment_state = 'refunded'
-                else:
-                    rec.payment_state = 'unpaid'
-            else:
-                rec.payment_state = 'unpaid'
+            rec.payment_state = INVOICE_PAYMENT_STATES.get(rec.invoice_id.payment_state, 'unpaid')
+
+    @api.model
+    def _backfill_payment_state(self, batch_size=50000):
+        """
+        Recompute the stored payment state of every reservation from the invoices,
+        in id windows of `batch_size` rows so large tables are not locked at once.
+        """
+        self.flush_model(['invoice_id', 'payment_state'])
+        self.env['account.move'].flush_model(['payment_state'])
+        self.env.cr.execute("SELECT coalesce(min(id), 0), coalesce(max(id), 0) FROM sport_club_reservation")
+        min_id, max_id = self.env.cr.fetchone()
+        updated = 0
+        for start in range(min_id, max_id + 1, batch_size):
+            self.env.cr.execute("""
+                UPDATE sport_club_reservation r
+                   SET payment_state = v.payment_state
+                  FROM (
+                        SELECT s.id,
+                               CASE m.payment_state
+                                   WHEN 'paid' THEN 'paid'
+                                   WHEN 'partial' THEN 'partial'
+                                   WHEN 'reversed' THEN 'refunded'
+                                   ELSE 'unpaid'
+                               END AS payment_state
+                          FROM sport_club_reservation s
+                     LEFT JOIN account_move m ON m.id = s.invoice_id
+                         WHERE s.id >= %s AND s.id < %s
+                       ) v
+                 WHERE r.id = v.id
+                   AND r.payment_state IS DISTINCT FROM v.payment_state
+            """, (start, start + batch_size))
+            updated += self.env.cr.rowcount
+        self.invalidate_model(['payment_state'])
+        _logger.info("Reservation payment states backfilled: %s rows updated.", updated)
+        return updated
 
     @api.depends("time_from", "time_to")
     def _compute_duration(self):
@@ -414,44 +584,216 @@ class Reservation(models.Model):
                             "The fixed discount (%s) for promotion '%s' cannot be greater than or equal to the total amount (%s)."
                         ) % (promotion.discount_value, promotion.name, rec.amount_total))
 
-    @api.constrains('date', 'time_from', 'time_to', 'facility_id', 'sport_id')
+    @api.constrains('date', 'time_from', 'time_to', 'club_id', 'facility_id', 'sport_id')
     def _check_reservation_availablaty(self):
         for rec in self:
             if not rec.facility_id or not rec.date:
                 continue
-
             if rec.time_from != 0.0 and rec.time_to != 0.0 and rec.time_from >= rec.time_to:
                 raise ValidationError(_("The 'From Time' must be earlier than the 'To Time'."))
 
-            overlapping_reservations = self.search([
-                ('id', '!=', rec.id),
-                ('facility_id', '=', rec.facility_id.id),
-                ('sport_id', '=', rec.sport_id.id),
-                ('date', '=', rec.date),
-                ('state', 'in', ['requested', 'confirmed','checked_in']),
-                '|',
-                '&', ('time_from', '<', rec.time_to), ('time_to', '>', rec.time_from),
-                '&', ('time_from', '<', rec.time_from), ('time_to', '>', rec.time_from),
-            ], limit=1)
+        conflicts = self._find_overlapping_reservations()
+        if conflicts:
+            rec_id, other_id = conflicts[0]
+            rec, other = self.browse(rec_id), self.browse(other_id)
+            raise ValidationError(_(
+                "The selected time slot overlaps with an existing reservation "
+                "for the same facility and sport on %s between %.2f and %.2f."
+            ) % (rec.date, other.time_from, other.time_to))
 
-            if overlapping_reservations:
-                raise ValidationError(_(
-                    "The selected time slot overlaps with an existing reservation "
-                    "for the same facility and sport on %s between %.2f and %.2f."
-                ) % (rec.date, overlapping_reservations.time_from, overlapping_reservations.time_to))
-
-    def _generate_reservation_code(self):
-        length = 5
-        characters = string.ascii_uppercase + string.digits
-        characters = ''.join(c for c in characters if c not in '01IO')
-
-        while True:
-            code = "-".join(
-                ''.join(random.choice(characters) for _ in range(length))
-                for _ in range(3)
+    def _find_overlapping_reservations(self):
+        """
+        Set-based overlap detection for a batch of reservations.
+        The batch is joined against the stored reservations in a single query
+        (VALUES list) served by the interval index, and checked against itself
+        with an in-memory sweep.
+        :return: list of (reservation_id, conflicting_reservation_id) pairs
+        """
+        records = self.filtered(lambda r: r.facility_id and r.start_at)
+        if not records:
+            return []
+        self.flush_model(['facility_id', 'sport_id', 'start_at', 'end_at', 'state', 'active'])
+
+        rows = [
+            (rec.id, rec.facility_id.id, rec.sport_id.id or None, rec.start_at, rec.end_at)
+            for rec in records
+        ]
+        values_sql = ", ".join(["(%s::int, %s::int, %s::int, %s::timestamp, %s::timestamp)"] * len(rows))
+        query = """
+            SELECT v.id, r.id
+              FROM (VALUES """ + values_sql + """) AS v(id, facility_id, sport_id, start_at, end_at)
+              JOIN sport_club_reservation r
+                ON r.facility_id = v.facility_id
+               AND r.sport_id IS NOT DISTINCT FROM v.sport_id
+               AND r.start_at < v.end_at
+               AND r.end_at > v.start_at
+             WHERE r.active
+               AND r.state IN %s
+               AND r.id NOT IN %s
+             ORDER BY v.id, r.start_at
+        """
+        params = [value for row in rows for value in row]
+        params += [ACTIVE_RESERVATION_STATES, tuple(records.ids)]
+        self.env.cr.execute(query, params)
+        conflicts = self.env.cr.fetchall()
+
+        # Conflicts inside the batch itself
+        groups = {}
+        for rec in records:
+            groups.setdefault((rec.facility_id.id, rec.sport_id.id), []).append(rec)
+        for group in groups.values():
+            active_end, active_id = None, None
+            any_end, any_id = None, None
+            for rec in sorted(group, key=lambda r: (r.start_at, r.end_at)):
+                is_active = rec.active and rec.state in ACTIVE_RESERVATION_STATES
+                if active_end is not None and active_end > rec.start_at:
+                    conflicts.append((rec.id, active_id))
+                elif is_active and any_end is not None and any_end > rec.start_at:
+                    conflicts.append((any_id, rec.id))
+                if is_active and (active_end is None or rec.end_at > active_end):
+                    active_end, active_id = rec.end_at, rec.id
+                if any_end is None or rec.end_at > any_end:
+                    any_end, any_id = rec.end_at, rec.id
+        return conflicts
+
+    @api.model
+    def _search_booked_intervals(self, facility_id, start_at, end_at, sport_id=None, exclude_ids=None):
+        """
+        Active reservations of a facility overlapping a UTC interval, read through
+        the interval index.
+        :return: list of (time_from, time_to, reservation_id) tuples sorted by start
+        """
+        self.flush_model(['facility_id', 'sport_id', 'start_at', 'end_at', 'state', 'active'])
+        query = """
+            SELECT time_from, time_to, id
+              FROM sport_club_reservation
+             WHERE facility_id = %s
+               AND start_at < %s
+               AND end_at > %s
+               AND active
+               AND state IN %s
+        """
+        params = [facility_id, end_at, start_at, ACTIVE_RESERVATION_STATES]
+        if sport_id:
+            query += " AND sport_id = %s"
+            params.append(sport_id)
+        if exclude_ids:
+            query += " AND id NOT IN %s"
+            params.append(tuple(exclude_ids))
+        self.env.cr.execute(query + " ORDER BY start_at, end_at, id", params)
+        return self.env.cr.fetchall()
+
+    # ============================================================
+    # Batch Validation / Creation
+    # ============================================================
+    @api.model
+    def _check_slots_batch(self, vals_by_index, hold_tokens=None):
+        """
+        Check calendar slots, closures, holds and overlaps of a whole batch of reservation
+        values. Every facility day involved is locked for the rest of the transaction and
+        its occupancy is read with one query;
+        items are then checked in order against it and against the items
+        already accepted in the batch.
+        :param vals_by_index: dict {index: vals} with club_id, facility_id, date (date),
+                              time_from, time_to and optionally sport_id
+        :param hold_tokens: slot holds owned by the caller, ignored in the checks
+        :return: dict {index: (reason, message, reservation_id)} of the rejected items,
+                 reason being one of 'calendar', 'slot', 'closed', 'booked', 'held' or 'batch'
+        """
+        conflicts = {}
+        if not vals_by_index:
+            return conflicts
+        Calendar = self.env['sport.club.calendar']
+        Availability = self.env['sport.club.availability']
+        dates = [vals['date'] for vals in vals_by_index.values()]
+        facility_ids = {vals['facility_id'] for vals in vals_by_index.values()}
+        # Serialize with concurrent holds and bookings of the same facility days
+        Hold = self.env['sport.club.slot.hold']
+        Hold._lock_facility_days([(vals['facility_id'], vals['date']) for vals in vals_by_index.values()])
+        stored = self.env['sport.club.slot.occupancy']._get_stored_intervals(facility_ids, min(dates), max(dates))
+        holds = Hold._get_active_intervals(
+            facility_ids, min(dates), max(dates), exclude_tokens=hold_tokens
+        )
+
+        accepted = {}
+        for index in sorted(vals_by_index):
+            vals = vals_by_index[index]
+            date, time_from, time_to = vals['date'], vals['time_from'], vals['time_to']
+            sport_id = vals.get('sport_id')
+
+            calendar_id = Calendar._get_calendar_id(vals['club_id'], vals['facility_id'])
+            if not calendar_id:
+                conflicts[index] = ('calendar', _("No calendar found for the selected club and facility."), False)
+                continue
+            if not Calendar._template_contains(calendar_id, date.weekday(), time_from, time_to):
+                conflicts[index] = ('slot', _("Selected time %s-%s does not match any available calendar slot.") %
+                                    (time_from, time_to), False)
+                continue
+            if Availability._is_closed(calendar_id, date, time_from, time_to):
+                conflicts[index] = ('closed', _("The facility is closed on %s between %s and %s.") %
+                                    (date, time_from, time_to), False)
+                continue
+
+            key = (vals['facility_id'], date)
+            overlap = find_overlap(
+                [interval for interval in stored.get(key, []) if not sport_id or interval[3] == sport_id],
+                time_from, time_to,
             )
-            if not self.search([('code', '=', code)]):
-                return code
+            if overlap:
+                overlapping = self.sudo().browse(overlap[2])
+                conflicts[index] = ('booked', _(
+                    "The selected time overlaps with an existing reservation "
+                    "(Reservation: %s, Time: %s-%s)"
+                ) % (overlapping.name, overlapping.time_from, overlapping.time_to), overlapping.id)
+                continue
+
+            if find_overlap(
+                [interval for interval in holds.get(key, []) if interval[3] == (sport_id or False)],
+                time_from, time_to,
+            ):
+                conflicts[index] = ('held', _("The selected time is currently held by another customer."), False)
+                continue
+
+            overlap = find_overlap(
+                [interval for interval in accepted.get(key, []) if not sport_id or interval[3] == sport_id],
+                time_from, time_to,
+            )
+            if overlap:
+                conflicts[index] = ('batch', _("The selected time overlaps with item %s of this batch.") % overlap[2], False)
+                continue
+            accepted.setdefault(key, []).append((time_from, time_to, index, sport_id))
+        return conflicts
+
+    @api.model
+    def _create_batch(self, indexes, vals_by_index, errors):
+        """
+        Create the validated items with one create(). If the database rejects the
+        batch (e.g. a concurrent booking took a slot), fall back to one savepoint
+        per item so the failing ones can be reported.
+        :return: dict {index: reservation}
+        """
+        if not indexes:
+            return {}
+        Reservation = self.env['sport.club.reservation'].sudo()
+        try:
+            with self.env.cr.savepoint():
+                records = Reservation.create([vals_by_index[index] for index in indexes])
+            return dict(zip(indexes, records))
+        except Exception:
+            self.env.invalidate_all()
+            created = {}
+            for index in indexes:
+                try:
+                    with self.env.cr.savepoint():
+                        created[index] = Reservation.create(vals_by_index[index])
+                except Exception as e:
+                    self.env.invalidate_all()
+                    errors[index].append(str(e))
+            return created
+
+    def _generate_reservation_codes(self, count):
+        """Unique reservation codes for a whole batch, checked with one query."""
+        return generate_unique_codes(self, 'code', count, groups=3, length=5)
 
     def _remove_all_attendees_after_checking_out(self):
         for rec in self:
@@ -479,16 +821,14 @@ class Reservation(models.Model):
             )
         return text
 
-    def _create_attendance_qr_code(self):
-        for rec in self:
-            for att in rec.attendance_ids:
-                txt = rec._prepare_qr_content(att)
-                qr = qrcode.make(txt)
-                buffer = io.BytesIO()
-                qr.save(buffer, format='PNG')
-                qr_bytes = buffer.getvalue()
-                qr_base64 = base64.b64encode(qr_bytes).decode('utf-8')
-                att.qr_image = qr_base64
+    def _get_attendee_qr_png(self, attendee):
+        """PNG of an attendee QR code, rendered on first use and cached per write date."""
+        self.ensure_one()
+        key = qr_cache_key(self, attendee)
+        png = QR_CACHE.get(key)
+        if png is None:
+            png = QR_CACHE[key] = render_qr_png(self._prepare_qr_content(attendee))
+        return key, png
 
     @api.model_create_multi
     def create(self, vals_list):
@@ -496,18 +836,48 @@ class Reservation(models.Model):
             if vals.get('name', _('New')) == _('New'):
                 vals['name'] = self.env['ir.sequence'].next_by_code('sport.club.reservation.seq')
 
-            if vals.get('code', 'New') == 'New':
-                vals['code'] = self._generate_reservation_code()
-        return super().create(vals_list)
-
-    def _generate_qr_code(self):
-        for record in self:
-            if not record.code:
-                record.qr_image = False
-                continue
-            if not record.attendance_ids or record.state != 'confirmed':
-                continue
-            record._create_attendance_qr_code()
+        pending = [vals for vals in vals_list if vals.get('code', 'New') == 'New']
+        for vals, code in zip(pending, self._generate_reservation_codes(len(pending))):
+            vals['code'] = code
+        records = super().create(vals_list)
+        records._refresh_slot_occupancy(records._get_occupancy_keys())
+        ClubCounter = self.env['sport.club.reservation.counter']
+        if ClubCounter._is_enabled():
+            ClubCounter._apply_deltas(ClubCounter._count_by_club(records))
+        return records
+
+    def write(self, vals):
+        ClubCounter = self.env['sport.club.reservation.counter']
+        counters = None
+        if any(field in vals for field in COUNTER_FIELDS) and ClubCounter._is_enabled():
+            counters = ClubCounter._count_by_club(self)
+        if not any(field in vals for field in OCCUPANCY_FIELDS):
+            res = super().write(vals)
+        else:
+            keys = self._get_occupancy_keys()
+            res = super().write(vals)
+            self._refresh_slot_occupancy(keys | self._get_occupancy_keys())
+        if counters is not None:
+            deltas = ClubCounter._count_by_club(self)
+            deltas.subtract(counters)
+            ClubCounter._apply_deltas(deltas)
+        return res
+
+    def unlink(self):
+        keys = self._get_occupancy_keys()
+        ClubCounter = self.env['sport.club.reservation.counter']
+        counters = ClubCounter._count_by_club(self) if ClubCounter._is_enabled() else {}
+        res = super().unlink()
+        self._refresh_slot_occupancy(keys)
+        ClubCounter._apply_deltas({club_id: -count for club_id, count in counters.items()})
+        return res
+
+    def _get_occupancy_keys(self):
+        return {(rec.facility_id.id, rec.date) for rec in self if rec.facility_id and rec.date}
+
+    def _refresh_slot_occupancy(self, keys):
+        if keys:
+            self.env['sport.club.slot.occupancy']._refresh(keys)
 
     def action_refund(self):
         """Refund the reservation by creating and reconciling a credit note for the invoice."""
@@ -557,49 +927,25 @@ class Reservation(models.Model):
             rec.write({'state': 'refunded'})
 
     def _find_or_create_traniner_fees_product(self):
-        product_model = self.env['product.product']
-        domain = [('default_code','=','trainer_00_trainer'),('type','=','service'),('name','ilike','Traner Fees')]
-        product = product_model.sudo().search(domain,limit=1)
-        if not product:
-            values = {
-                'name':'Traner Fees',
-                'default_code':'trainer_00_trainer',
-                'type':'service',
-                'sale_ok':True,
-                'description_sale':'Generic Trainer Fees On reservation service'
-            }
-            product = product_model.sudo().create(values)
-        return product
+        return self.env['product.product']._get_service_product('trainer_00_trainer', {
+            'name': 'Traner Fees',
+            'sale_ok': True,
+            'description_sale': 'Generic Trainer Fees On reservation service'
+        })
 
     def _find_or_create_reservation_product(self):
-        product_model = self.env['product.product']
-        domain = [('default_code','=','club_00_club'),('type','=','service'),('name','ilike','Club Reservation')]
-        product = product_model.sudo().search(domain,limit=1)
-        if not product:
-            values = {
-                'name':'Club Reservation',
-                'default_code':'club_00_club',
-                'type':'service',
-                'sale_ok':True,
-                'description_sale':'Generic club reservation service'
-            }
-            product = product_model.sudo().create(values)
-        return product
+        return self.env['product.product']._get_service_product('club_00_club', {
+            'name': 'Club Reservation',
+            'sale_ok': True,
+            'description_sale': 'Generic club reservation service'
+        })
 
     def _find_or_create_promotion_product(self):
-        product_model = self.env['product.product']
-        domain = [('default_code','=','promotion_00_promotion'),('type','=','service'),('name','ilike',self.promotion_id.name)]
-        product = product_model.sudo().search(domain,limit=1)
-        if not product:
-            values = {
-                'name':self.promotion_id.name,
-                'default_code':'promotion_00_promotion',
-                'type':'service',
-                'sale_ok':True,
-                'description_sale':'Generic Promotion Discount'
-            }
-            product = product_model.sudo().create(values)
-        return product
+        return self.env['product.product']._get_service_product('promotion_00_promotion', {
+            'name': 'Promotion Discount',
+            'sale_ok': True,
+            'description_sale': 'Generic Promotion Discount'
+        })
 
     def _prepare_dicount_proccess(self):
         for rec in self:
@@ -607,7 +953,7 @@ class Reservation(models.Model):
                 promotion_product_id = rec._find_or_create_promotion_product()
                 return [(0, 0, {
                     "product_id": promotion_product_id.id,
-                    "name": promotion_product_id.description_sale or "Promotions",
+                    "name": rec.promotion_id.name or promotion_product_id.description_sale or "Promotions",
                     "product_uom_qty": 1.0,
                     "price_unit": -1 * self.promotion_id.discount_value,
                     "tax_id": [(6, 0, [])],
@@ -757,10 +1103,19 @@ class Reservation(models.Model):
         self.write({"state": "draft"})
 
     def action_request(self):
-        self._create_sale_order()
-        self.promotion_id.usage_count += 1
+        # Everything that can refuse the request runs here; only side effects are queued
+        missing_player = self.filtered(lambda r: not r.player_id)
+        if missing_player:
+            raise UserError(_("A player is required to request reservation(s) %s.")
+                            % ", ".join(missing_player.mapped('name')))
+        self._count_promotion_usage()
         self.write({"state": "requested"})
-        self._create_activity_for_owner()
+        self.env['sport.club.reservation.job']._enqueue(self, ['sale_order', 'owner_activity'])
+
+    def _count_promotion_usage(self):
+        """Count the promotion usages; the promotion usage limit constraint rejects the request when exceeded."""
+        for promotion in self.promotion_id:
+            promotion.usage_count += len(self.filtered(lambda r: r.promotion_id == promotion))
 
     def _create_activity_for_owner(self):
         for rec in self:
@@ -816,18 +1171,63 @@ class Reservation(models.Model):
             })
 
     def action_confirm(self):
-        for rec in self:
-            sale_order = rec.sale_order_id
-            sale_order.action_confirm()
-            invoices = sale_order._create_invoices()
-            if not invoices:
-                raise UserError("Failed to generate invoice from sale order.")
-
-            invoice = invoices[0]
-            invoice.action_post()
-            rec.invoice_id = invoice.id
-            rec.write({"state": "confirmed"})
-            rec._generate_qr_code()
+        self.write({"state": "confirmed"})
+        self.env['sport.club.reservation.job']._enqueue(self, ['invoice'])
+
+    # --------------------------------------------------
+    # Post-booking Jobs (run by sport.club.reservation.job)
+    # --------------------------------------------------
+
+    def _job_create_sale_order(self):
+        for rec in self.filtered(lambda r: not r.sale_order_id):
+            rec._create_sale_order()
+
+    def _job_notify_owner(self):
+        self._create_activity_for_owner()
+
+    def _job_invoice(self):
+        # Reservations reverted meanwhile are confirmed (and invoiced) again from scratch
+        self.filtered(lambda r: r.state == 'confirmed')._confirm_and_invoice()
+
+    def _job_invoice_failed(self, error):
+        """The invoice could not be created: the confirmation is reverted so it can be done again."""
+        reverted = self.filtered(lambda r: r.state == 'confirmed' and not r.invoice_id)
+        reverted.write({"state": "requested"})
+        for rec in reverted:
+            rec.message_post(body=_("The confirmation was reverted because the invoice could not be created: %s")
+                                  % error)
+
+    def _confirm_and_invoice(self):
+        """
+        Bulk confirmation: the sale orders of all the reservations are confirmed as
+        one recordset, invoiced with a single _create_invoices() call (one invoice
+        per order) and posted together; invoices are then mapped back through
+        their sale lines. QR codes are rendered on demand by the API route.
+        """
+        todo = self.filtered(lambda r: not r.invoice_id)
+        if not todo:
+            return
+        missing = todo.filtered(lambda r: not r.sale_order_id)
+        if missing:
+            raise UserError(_("The sale order of reservation(s) %s has not been created yet.")
+                            % ", ".join(missing.mapped('name')))
+
+        orders = todo.sale_order_id
+        orders.filtered(lambda o: o.state in ('draft', 'sent')).action_confirm()
+        invoices = orders._create_invoices(grouped=True)
+        if not invoices:
+            raise UserError("Failed to generate invoice from sale order.")
+        invoices.action_post()
+
+        invoice_by_order = {}
+        for invoice in invoices:
+            for order in invoice.invoice_line_ids.sale_line_ids.order_id:
+                invoice_by_order.setdefault(order.id, invoice.id)
+        for rec in todo:
+            invoice_id = invoice_by_order.get(rec.sale_order_id.id)
+            if not invoice_id:
+                raise UserError(_("No invoice was generated for reservation %s.") % rec.name)
+            rec.invoice_id = invoice_id
 
     def action_register_payment(self):
         self.ensure_one()
@@ -990,49 +1390,25 @@ class Reservation(models.Model):
         if not self.date or not self.facility_id:
             return [('id', '=', False)]
 
-        weekday_number = fields.Date.from_string(self.date).weekday()
-
-        current_calendar = self.env['sport.club.calendar'].search([
-            ('club_id', '=', self.club_id.id),
-            ('facility_id', '=', self.facility_id.id)
-        ], limit=1)
-
-        if not current_calendar:
-            return [('id', '=', False)]
-
-        # Base domain to fetch slots for the selected day
-        domain = [
-            ('day_of_week', '=', str(weekday_number)),
-            ('calendar_template_id', '=', current_calendar.id),
-        ]
-
-        # Search all slots for that day
-        all_slots = self.env['sport.club.calendar.line'].search(domain)
-
-        # Find reservations that occupy some slots for the same date + facility + sport
-        reservation_domain = [
-            ('facility_id', '=', self.facility_id.id),
-            ('date', '=', self.date),
-            ('state', 'in', ['requested', 'confirmed','checked_in']),
-        ]
-        if self.sport_id:
-            reservation_domain.append(('sport_id', '=', self.sport_id.id))
-
-        existing_reservations = self.env['sport.club.reservation'].search(reservation_domain)
-
-        # Exclude any slots that overlap with existing reservations
-        reserved_slot_ids = set()
-        for slot in all_slots:
-            for res in existing_reservations:
-                # Overlap check: slot_from < res_to AND slot_to > res_from
-                if slot.start_time < res.time_to and slot.end_time > res.time_from:
-                    reserved_slot_ids.add(slot.id)
-
-        # Final domain excludes reserved slots
-        if reserved_slot_ids:
-            domain.append(('id', 'not in', list(reserved_slot_ids)))
-
-        return domain
+        tz = self.club_id._get_tz()
+        busy = self._search_booked_intervals(
+            self.facility_id.id,
+            local_to_utc(self.date, 0.0, tz),
+            local_to_utc(self.date, 24.0, tz),
+            sport_id=self.sport_id.id,
+        )
+        holds = self.env['sport.club.slot.hold']._get_active_intervals(
+            [self.facility_id.id], self.date, sport_id=self.sport_id.id
+        )
+        busy += [interval[:3] for interval in holds.get((self.facility_id.id, self.date), [])]
+        free_slots = self.env['sport.club.availability']._get_free_slots(
+            self.club_id.id,
+            self.facility_id.id,
+            self.date,
+            sport_id=self.sport_id.id,
+            busy=sorted(busy),
+        )
+        return [('id', 'in', [slot[2] for slot in free_slots])]
 
     # ============================================================
     # Smart Button / Action
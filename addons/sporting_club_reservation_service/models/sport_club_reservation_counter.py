@@ -0,0 +1,93 @@
+import logging
+from collections import Counter
+from odoo import api, fields, models
+from odoo.tools import str2bool
+
+_logger = logging.getLogger(__name__)
+
+# Reservation fields that move a booking from one club counter to another
+COUNTER_FIELDS = ('club_id', 'active')
+
+# When set, the counters are maintained and club smart buttons read them instead of counting rows
+USE_COUNTERS_PARAM = 'sporting_club_reservation_service.use_reservation_counters'
+
+
+class SportClubReservationCounter(models.Model):
+    """
+    Model: Reservation Counter
+    --------------------------
+    Number of active reservations per club, maintained incrementally by
+    sport.club.reservation with one upsert per create/write/unlink while the
+    USE_COUNTERS_PARAM parameter is set, and rebuilt when it is switched on.
+    Without the parameter nothing is written and clubs count their rows.
+    """
+    _name = "sport.club.reservation.counter"
+    _description = "Club Reservation Counter"
+    _log_access = False
+
+    club_id = fields.Many2one(
+        comodel_name="sport.club.model",
+        string="Club",
+        required=True,
+        ondelete="cascade",
+    )
+    reservation_count = fields.Integer(
+        string="Reservations",
+        default=0,
+    )
+
+    _sql_constraints = [
+        (
+            "unique_club",
+            "unique(club_id)",
+            "There is only one reservation counter per club.",
+        ),
+    ]
+
+    @api.model
+    def _is_enabled(self):
+        return str2bool(self.env['ir.config_parameter'].sudo().get_param(USE_COUNTERS_PARAM, 'False'), False)
+
+    @api.model
+    def _count_by_club(self, reservations):
+        """Counter deltas of the active reservations of a recordset."""
+        return Counter(rec.club_id.id for rec in reservations if rec.active and rec.club_id)
+
+    @api.model
+    def _apply_deltas(self, deltas):
+        """Add {club_id: delta} to the counters with a single upsert."""
+        deltas = {club_id: delta for club_id, delta in deltas.items() if club_id and delta}
+        if not deltas:
+            return
+        self.env.cr.execute("""
+            INSERT INTO sport_club_reservation_counter (club_id, reservation_count)
+            SELECT club_id, delta
+              FROM unnest(%s::int[], %s::int[]) AS d(club_id, delta)
+            ON CONFLICT (club_id)
+            DO UPDATE SET reservation_count = sport_club_reservation_counter.reservation_count + EXCLUDED.reservation_count
+        """, (list(deltas), list(deltas.values())))
+        self.invalidate_model(['reservation_count'])
+
+    @api.model
+    def _get_counts(self, club_ids):
+        return {
+            row['club_id'][0]: row['reservation_count']
+            for row in self.sudo().search_read([('club_id', 'in', list(club_ids))], ['club_id', 'reservation_count'])
+        }
+
+    @api.model
+    def _rebuild_counters(self):
+        """Recompute every counter from the reservations with one statement."""
+        self.env['sport.club.reservation'].flush_model(['club_id', 'active'])
+        self.env.cr.execute("DELETE FROM sport_club_reservation_counter")
+        self.env.cr.execute("""
+            INSERT INTO sport_club_reservation_counter (club_id, reservation_count)
+            SELECT club_id, count(*)
+              FROM sport_club_reservation
+             WHERE active AND club_id IS NOT NULL
+             GROUP BY club_id
+        """)
+        count = self.env.cr.rowcount
+        self.invalidate_model()
+        _logger.info("Reservation counters rebuilt for %s clubs.", count)
+        return count
@@ -0,0 +1,220 @@
+import logging
+from datetime import timedelta
+from odoo import api, fields, models, _
+
+_logger = logging.getLogger(__name__)
+
+# Post-booking steps, in execution order, and the reservation method running them
+JOB_STEPS = [
+    ("sale_order", "Create Sale Order", "_job_create_sale_order"),
+    ("owner_activity", "Notify Club Owner", "_job_notify_owner"),
+    ("invoice", "Confirm & Invoice", "_job_invoice"),
+]
+JOB_METHODS = {step: method for step, _label, method in JOB_STEPS}
+JOB_SEQUENCE = {step: sequence for sequence, (step, _label, _method) in enumerate(JOB_STEPS)}
+# Reservation method called with the error once a step has run out of attempts
+JOB_FAILURE_METHODS = {
+    "invoice": "_job_invoice_failed",
+}
+
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_BASE_SECONDS = 60
+JOB_RETRY_MAX_SECONDS = 3600
+JOB_BATCH_SIZE = 200
+JOB_RETENTION_DAYS = 30
+
+
+class SportClubReservationJob(models.Model):
+    """
+    Model: Reservation Job
+    ----------------------
+    Persistent queue of the post-booking side effects of a reservation (sale
+    order, owner activity, invoicing); validations stay in the
+    booking transaction. Jobs are processed by a cron worker, grouped per step,
+    and failing jobs are retried with an exponential backoff until they run out
+    of attempts, after which the step's failure handler is called.
+    """
+    _name = "sport.club.reservation.job"
+    _description = "Reservation Job"
+    _order = "next_run_at, id"
+
+    reservation_id = fields.Many2one(
+        comodel_name="sport.club.reservation",
+        string="Reservation",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    step = fields.Selection(
+        selection=[(step, label) for step, label, _method in JOB_STEPS],
+        string="Step",
+        required=True,
+    )
+    state = fields.Selection(
+        selection=[
+            ("pending", "Pending"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        string="Status",
+        default="pending",
+        required=True,
+        index=True,
+    )
+    attempts = fields.Integer(
+        string="Attempts",
+        default=0,
+        readonly=True,
+    )
+    next_run_at = fields.Datetime(
+        string="Next Run",
+        default=fields.Datetime.now,
+        required=True,
+        index=True,
+    )
+    done_at = fields.Datetime(
+        string="Done At",
+        readonly=True,
+    )
+    last_error = fields.Text(
+        string="Last Error",
+        readonly=True,
+    )
+    club_id = fields.Many2one(
+        related="reservation_id.club_id",
+        store=True,
+    )
+
+    # ============================================================
+    # Queue
+    # ============================================================
+    @api.model
+    def _enqueue(self, reservations, steps):
+        """Queue `steps` for every reservation and wake the worker up."""
+        jobs = self.sudo().create([
+            {'reservation_id': reservation.id, 'step': step}
+            for reservation in reservations for step in steps
+        ])
+        self._trigger_worker()
+        return jobs
+
+    @api.model
+    def _trigger_worker(self):
+        cron = self.env.ref('sporting_club_reservation_service.ir_cron_process_reservation_jobs',
+                            raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+
+    @api.model
+    def _get_retry_delay(self, attempts):
+        return timedelta(seconds=min(JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), JOB_RETRY_MAX_SECONDS))
+
+    @api.model
+    def _fetch_due_jobs(self, limit=JOB_BATCH_SIZE):
+        """
+        Lock a batch of due jobs. Rows locked by another worker are skipped,
+        so several cron workers can drain the queue concurrently.
+        """
+        self.flush_model(['state', 'next_run_at'])
+        self.env.cr.execute("""
+            SELECT id
+              FROM sport_club_reservation_job
+             WHERE state = 'pending'
+               AND next_run_at <= %s
+             ORDER BY next_run_at, id
+             LIMIT %s
+               FOR UPDATE SKIP LOCKED
+        """, (fields.Datetime.now(), limit))
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _run_step(self, step):
+        """
+        Run the jobs of one step: first as a single batch, then one by one
+        when the batch fails so a single bad reservation cannot block the others.
+        """
+        method = JOB_METHODS[step]
+        try:
+            with self.env.cr.savepoint():
+                getattr(self.reservation_id, method)()
+            self._mark_done()
+            return
+        except Exception:
+            self.env.invalidate_all()
+            if len(self) == 1:
+                raise
+        for job in self:
+            try:
+                with self.env.cr.savepoint():
+                    getattr(job.reservation_id, method)()
+                job._mark_done()
+            except Exception as e:
+                self.env.invalidate_all()
+                job._mark_failed(e)
+
+    def _mark_done(self):
+        self.write({
+            'state': 'done',
+            'attempts': 0,
+            'done_at': fields.Datetime.now(),
+            'last_error': False,
+        })
+
+    def _mark_failed(self, error):
+        for job in self:
+            attempts = job.attempts + 1
+            _logger.warning("Reservation job %s (%s) failed, attempt %s: %s", job.id, job.step, attempts, error)
+            job.write({
+                'attempts': attempts,
+                'last_error': str(error),
+                'state': 'failed' if attempts >= JOB_MAX_ATTEMPTS else 'pending',
+                'next_run_at': fields.Datetime.now() + self._get_retry_delay(attempts),
+            })
+        exhausted = self.filtered(lambda job: job.state == 'failed' and job.step in JOB_FAILURE_METHODS)
+        for step in set(exhausted.mapped('step')):
+            reservations = exhausted.filtered(lambda job: job.step == step).reservation_id
+            getattr(reservations, JOB_FAILURE_METHODS[step])(error)
+
+    def _process(self):
+        """Run the jobs grouped per step, in the order of the pipeline."""
+        for step in sorted(set(self.mapped('step')), key=JOB_SEQUENCE.get):
+            jobs = self.filtered(lambda job: job.step == step)
+            try:
+                jobs._run_step(step)
+            except Exception as e:
+                jobs._mark_failed(e)
+
+    # ============================================================
+    # Cron
+    # ============================================================
+    @api.model
+    def _cron_process_jobs(self):
+        jobs = self._fetch_due_jobs()
+        jobs._process()
+        self.env.cr.execute("""
+            SELECT count(*)
+              FROM sport_club_reservation_job
+             WHERE state = 'pending'
+               AND next_run_at <= %s
+        """, (fields.Datetime.now(),))
+        remaining = self.env.cr.fetchone()[0]
+        self.env['ir.cron']._notify_progress(done=len(jobs), remaining=remaining)
+        _logger.info("Reservation jobs: %s processed, %s remaining.", len(jobs), remaining)
+        return len(jobs)
+
+    @api.model
+    def _cron_purge_done_jobs(self):
+        self.search([
+            ('state', '=', 'done'),
+            ('done_at', '<', fields.Datetime.now() - timedelta(days=JOB_RETENTION_DAYS)),
+        ]).unlink()
+
+    # ============================================================
+    # Actions
+    # ============================================================
+    def action_retry(self):
+        self.filtered(lambda job: job.state != 'done').write({
+            'state': 'pending',
+            'attempts': 0,
+            'next_run_at': fields.Datetime.now(),
+        })
+        self._trigger_worker()
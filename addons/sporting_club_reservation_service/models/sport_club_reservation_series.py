@@ -0,0 +1,377 @@
+import logging
+from datetime import timedelta
+from odoo import api, fields, models, _
+from odoo.exceptions import ValidationError, UserError
+
+_logger = logging.getLogger(__name__)
+
+# Number of days ahead occurrences are materialized by the cron
+DEFAULT_SERIES_HORIZON_DAYS = 28
+
+
+class SportClubReservationSeries(models.Model):
+    """
+    Model: Reservation Series
+    -------------------------
+    Recurring booking of a facility (e.g. every Tuesday 19:00–20:30 for 6 months).
+    The series only stores the recurrence rule; occurrences are materialized as
+    sport.club.reservation records in a rolling window by a cron. Occurrences
+    that collide with bookings, closures or the calendar are written to the
+    conflict report instead of failing the whole series.
+    """
+    _name = "sport.club.reservation.series"
+    _description = "Reservation Series"
+    _inherit = ["mail.thread", "mail.activity.mixin"]
+    _order = "date_start desc, id desc"
+
+    # ============================================================
+    # Basic Information
+    # ============================================================
+    name = fields.Char(
+        string="Series Name",
+        required=True,
+        tracking=True,
+    )
+    active = fields.Boolean(
+        string="Active",
+        default=True
+    )
+    state = fields.Selection(
+        selection=[
+            ("draft", "Draft"),
+            ("running", "Running"),
+            ("done", "Done"),
+            ("cancelled", "Cancelled"),
+        ],
+        string="Status",
+        default="draft",
+        tracking=True,
+    )
+
+    # ============================================================
+    # Player & Club
+    # ============================================================
+    player_id = fields.Many2one(
+        comodel_name="res.partner",
+        string="Player",
+        required=True,
+        tracking=True,
+    )
+    club_id = fields.Many2one(
+        comodel_name="sport.club.model",
+        string="Club",
+        required=True,
+        tracking=True,
+    )
+    facility_id = fields.Many2one(
+        comodel_name="sport.club.facility",
+        string="Facility",
+        required=True,
+        tracking=True,
+        domain="[('sport_club_id', '=', club_id)]",
+    )
+    sport_id = fields.Many2one(
+        comodel_name="sport.club.sports",
+        string="Sport",
+        tracking=True,
+    )
+
+    # ============================================================
+    # Recurrence Rule
+    # ============================================================
+    day_of_week = fields.Selection(
+        selection=[
+            ("0", "Monday"),
+            ("1", "Tuesday"),
+            ("2", "Wednesday"),
+            ("3", "Thursday"),
+            ("4", "Friday"),
+            ("5", "Saturday"),
+            ("6", "Sunday"),
+        ],
+        string="Day of Week",
+        required=True,
+        tracking=True,
+    )
+    interval = fields.Integer(
+        string="Repeat Every (Weeks)",
+        default=1,
+        required=True,
+        tracking=True,
+    )
+    time_from = fields.Float(
+        string="From",
+        required=True,
+        tracking=True,
+    )
+    time_to = fields.Float(
+        string="To",
+        required=True,
+        tracking=True,
+    )
+    date_start = fields.Date(
+        string="Start Date",
+        required=True,
+        default=fields.Date.context_today,
+        tracking=True,
+    )
+    date_end = fields.Date(
+        string="End Date",
+        required=True,
+        tracking=True,
+    )
+    horizon_days = fields.Integer(
+        string="Booking Horizon (Days)",
+        default=DEFAULT_SERIES_HORIZON_DAYS,
+        help="Occurrences are created this many days ahead of today."
+    )
+    generated_until = fields.Date(
+        string="Generated Until",
+        readonly=True,
+        copy=False,
+        help="Last date up to which occurrences have been materialized."
+    )
+
+    # ============================================================
+    # Occurrences
+    # ============================================================
+    reservation_ids = fields.One2many(
+        comodel_name="sport.club.reservation",
+        inverse_name="series_id",
+        string="Reservations",
+    )
+    conflict_ids = fields.One2many(
+        comodel_name="sport.club.reservation.series.conflict",
+        inverse_name="series_id",
+        string="Conflicts",
+    )
+    reservation_count = fields.Integer(
+        compute="_compute_counts",
+    )
+    conflict_count = fields.Integer(
+        compute="_compute_counts",
+    )
+    company_id = fields.Many2one(
+        comodel_name="res.company",
+        string="Company",
+        default=lambda self: self.env.company,
+    )
+
+    # ============================================================
+    # Compute Methods
+    # ============================================================
+    def _compute_counts(self):
+        reservations = dict(self.env['sport.club.reservation']._read_group(
+            [('series_id', 'in', self.ids)], ['series_id'], ['__count'],
+        ))
+        conflicts = dict(self.env['sport.club.reservation.series.conflict']._read_group(
+            [('series_id', 'in', self.ids)], ['series_id'], ['__count'],
+        ))
+        for rec in self:
+            rec.reservation_count = reservations.get(rec, 0)
+            rec.conflict_count = conflicts.get(rec, 0)
+
+    # ============================================================
+    # Constraints
+    # ============================================================
+    @api.constrains('time_from', 'time_to', 'date_start', 'date_end', 'interval')
+    def _check_recurrence(self):
+        for rec in self:
+            if rec.time_from >= rec.time_to:
+                raise ValidationError(_("The 'From Time' must be earlier than the 'To Time'."))
+            if rec.date_end < rec.date_start:
+                raise ValidationError(_("The end date must be later than the start date."))
+            if rec.interval < 1:
+                raise ValidationError(_("The repeat interval must be at least one week."))
+
+    # ============================================================
+    # Recurrence Expansion
+    # ============================================================
+    def _iter_occurrence_dates(self, date_from, date_to):
+        """Dates of the series falling within [date_from, date_to], in order."""
+        self.ensure_one()
+        step = timedelta(weeks=self.interval)
+        first = self.date_start + timedelta(days=(int(self.day_of_week) - self.date_start.weekday()) % 7)
+        if first < date_from:
+            # Jump straight to the first occurrence on or after date_from
+            periods = -(-(date_from - first).days // step.days)
+            first += step * periods
+        current = first
+        while current <= min(date_to, self.date_end):
+            yield current
+            current += step
+
+    def _prepare_occurrence_vals(self, date):
+        self.ensure_one()
+        return {
+            'series_id': self.id,
+            'club_id': self.club_id.id,
+            'facility_id': self.facility_id.id,
+            'sport_id': self.sport_id.id,
+            'player_id': self.player_id.id,
+            'date': date,
+            'time_from': self.time_from,
+            'time_to': self.time_to,
+            'state': 'draft',
+            'company_id': self.company_id.id,
+        }
+
+    def _materialize_occurrences(self, until=None):
+        """
+        Create the occurrences of the series up to `until` (default: today + horizon).
+        All occurrences of all series are validated together: one occupancy query
+        for every facility day involved, cached closure indexes and compiled calendar
+        templates. Colliding occurrences are recorded as conflicts and skipped.
+        :return: number of reservations created
+        """
+        today = fields.Date.context_today(self)
+        vals_by_index = {}
+        occurrence_series = {}
+        for series in self.filtered(lambda s: s.state == 'running'):
+            date_from = max(series.date_start, series.generated_until + timedelta(days=1)
+                            if series.generated_until else today)
+            date_to = until or (today + timedelta(days=series.horizon_days or DEFAULT_SERIES_HORIZON_DAYS))
+            for date in series._iter_occurrence_dates(date_from, date_to):
+                index = len(vals_by_index)
+                vals_by_index[index] = series._prepare_occurrence_vals(date)
+                occurrence_series[index] = series
+            generated_until = min(date_to, series.date_end)
+            if not series.generated_until or generated_until > series.generated_until:
+                series.generated_until = generated_until
+
+        Reservation = self.env['sport.club.reservation']
+        conflicts = Reservation._check_slots_batch(vals_by_index)
+        errors = {index: [] for index in vals_by_index}
+        records = Reservation._create_batch(
+            [index for index in vals_by_index if index not in conflicts], vals_by_index, errors
+        )
+
+        conflict_vals = [
+            {
+                'series_id': occurrence_series[index].id,
+                'date': vals_by_index[index]['date'],
+                'reason': reason,
+                'message': message,
+                'reservation_id': reservation_id,
+            }
+            for index, (reason, message, reservation_id) in conflicts.items()
+        ]
+        conflict_vals += [
+            {
+                'series_id': occurrence_series[index].id,
+                'date': vals_by_index[index]['date'],
+                'reason': 'error',
+                'message': "\n".join(messages),
+            }
+            for index, messages in errors.items() if messages
+        ]
+        self.env['sport.club.reservation.series.conflict'].create(conflict_vals)
+        if records:
+            # Requested like single bookings: same checks, same queued jobs
+            Reservation.browse([record.id for record in records.values()]).action_request()
+
+        self.filtered(lambda s: s.state == 'running' and s.generated_until and s.generated_until >= s.date_end).write({
+            'state': 'done',
+        })
+        return len(records)
+
+    @api.model
+    def _cron_materialize_occurrences(self):
+        series = self.search([('state', '=', 'running')])
+        created = series._materialize_occurrences()
+        _logger.info("Reservation series: %s occurrences created for %s series.", created, len(series))
+        return created
+
+    # ============================================================
+    # Actions
+    # ============================================================
+    def action_start(self):
+        for rec in self:
+            if rec.state != 'draft':
+                raise UserError(_("Only draft series can be started."))
+        self.write({'state': 'running'})
+        self._materialize_occurrences()
+
+    def action_cancel(self):
+        """Cancel the series and its upcoming occurrences."""
+        today = fields.Date.context_today(self)
+        self.reservation_ids.filtered(
+            lambda r: r.date and r.date >= today and r.state in ('draft', 'requested', 'confirmed')
+        ).write({'state': 'cancelled'})
+        self.write({'state': 'cancelled'})
+
+    def action_draft(self):
+        self.write({'state': 'draft'})
+
+    def action_view_reservations(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Reservations'),
+            'res_model': 'sport.club.reservation',
+            'view_mode': 'list,form',
+            'domain': [('series_id', '=', self.id)],
+            'context': {'default_series_id': self.id},
+        }
+
+    def action_view_conflicts(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Conflicts'),
+            'res_model': 'sport.club.reservation.series.conflict',
+            'view_mode': 'list',
+            'domain': [('series_id', '=', self.id)],
+        }
+
+
+class SportClubReservationSeriesConflict(models.Model):
+    """
+    Model: Reservation Series Conflict
+    ----------------------------------
+    Occurrence of a series that could not be booked, with the reason.
+    """
+    _name = "sport.club.reservation.series.conflict"
+    _description = "Reservation Series Conflict"
+    _order = "date, id"
+
+    series_id = fields.Many2one(
+        comodel_name="sport.club.reservation.series",
+        string="Series",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    date = fields.Date(
+        string="Date",
+        required=True,
+    )
+    reason = fields.Selection(
+        selection=[
+            ("calendar", "No Calendar"),
+            ("slot", "Outside Calendar Slots"),
+            ("closed", "Facility Closed"),
+            ("booked", "Already Booked"),
+            ("held", "Held At Checkout"),
+            ("batch", "Overlapping Series"),
+            ("error", "Error"),
+        ],
+        string="Reason",
+        required=True,
+    )
+    message = fields.Text(
+        string="Details",
+    )
+    reservation_id = fields.Many2one(
+        comodel_name="sport.club.reservation",
+        string="Conflicting Reservation",
+        ondelete="set null",
+    )
+    facility_id = fields.Many2one(
+        related="series_id.facility_id",
+        store=True,
+    )
+    club_id = fields.Many2one(
+        related="series_id.club_id",
+        store=True,
+    )
@@ -0,0 +1,228 @@
+import logging
+import secrets
+from datetime import timedelta
+from psycopg2 import errors
+from odoo import api, fields, models, _
+from odoo.exceptions import ValidationError
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_HOLD_TTL_MINUTES = 10
+MAX_HOLD_TTL_MINUTES = 60
+
+
+class SportClubSlotHold(models.Model):
+    """
+    Model: Slot Hold
+    ----------------
+    Short-lived reservation of a facility interval taken between slot selection
+    and checkout. Active holds count as busy in every availability check until
+    they expire, are released or are consumed by the reservation they protect.
+    Like reservations, holds only block bookings and holds of the same sport
+    (holds without a sport only block each other).
+    Holds of a facility day are serialized with a PostgreSQL advisory lock and
+    overlapping holds are rejected by an exclusion constraint: the lock is taken
+    after the transaction snapshot, so a waiting request may not see the hold
+    that was just committed.
+    """
+    _name = "sport.club.slot.hold"
+    _description = "Facility Slot Hold"
+    _order = "expires_at"
+
+    token = fields.Char(
+        string="Token",
+        required=True,
+        readonly=True,
+        copy=False,
+        index=True,
+        default=lambda self: secrets.token_urlsafe(24),
+    )
+    club_id = fields.Many2one(
+        comodel_name="sport.club.model",
+        string="Club",
+        required=True,
+        ondelete="cascade",
+    )
+    facility_id = fields.Many2one(
+        comodel_name="sport.club.facility",
+        string="Facility",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    sport_id = fields.Many2one(
+        comodel_name="sport.club.sports",
+        string="Sport",
+    )
+    partner_id = fields.Many2one(
+        comodel_name="res.partner",
+        string="Customer",
+        ondelete="cascade",
+    )
+    date = fields.Date(
+        string="Date",
+        required=True,
+        index=True,
+    )
+    time_from = fields.Float(
+        string="From",
+        required=True,
+    )
+    time_to = fields.Float(
+        string="To",
+        required=True,
+    )
+    expires_at = fields.Datetime(
+        string="Expires At",
+        required=True,
+        index=True,
+    )
+
+    _sql_constraints = [
+        (
+            "no_overlapping_hold",
+            "EXCLUDE USING gist ("
+            "facility_id WITH =, (COALESCE(sport_id, 0)) WITH =, date WITH =, "
+            "numrange(time_from::numeric, time_to::numeric) WITH &&"
+            ")",
+            "The selected time is currently held by another customer.",
+        ),
+        (
+            "unique_token",
+            "unique(token)",
+            "The hold token must be unique.",
+        ),
+    ]
+
+    def _auto_init(self):
+        # btree_gist provides the '=' operator class of the exclusion constraint
+        self.env.cr.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        return super()._auto_init()
+
+    # ============================================================
+    # Locking
+    # ============================================================
+    @api.model
+    def _lock_facility_day(self, facility_id, date):
+        """Serialize holds and bookings of one facility day until the end of the transaction."""
+        self._lock_facility_days([(facility_id, date)])
+
+    @api.model
+    def _lock_facility_days(self, keys):
+        """
+        Take the advisory locks of several (facility_id, date) keys with one statement.
+        Keys are locked in a stable order so concurrent batches cannot deadlock.
+        """
+        lock_keys = sorted({
+            "sport.club.slot.hold:%s:%s" % (facility_id, fields.Date.to_string(fields.Date.to_date(date)))
+            for facility_id, date in keys
+        })
+        if lock_keys:
+            self.env.cr.execute("""
+                SELECT pg_advisory_xact_lock(hashtextextended(lock_key, 0))
+                  FROM unnest(%s::text[]) WITH ORDINALITY AS k(lock_key, position)
+                 ORDER BY position
+            """, (lock_keys,))
+
+    # ============================================================
+    # Lookup
+    # ============================================================
+    @api.model
+    def _get_active_intervals(self, facility_ids, date_from, date_to=None, sport_id=None, exclude_tokens=None):
+        """
+        Unexpired holds of several facilities over a date range.
+        :return: dict {(facility_id, date): [(time_from, time_to, False, sport_id)]}
+        """
+        domain = [
+            ('facility_id', 'in', list(facility_ids)),
+            ('date', '>=', date_from),
+            ('date', '<=', date_to or date_from),
+            ('expires_at', '>', fields.Datetime.now()),
+        ]
+        if exclude_tokens:
+            domain.append(('token', 'not in', list(exclude_tokens)))
+        if sport_id:
+            domain.append(('sport_id', '=', sport_id))
+        holds = {}
+        for hold in self.sudo().search_read(domain, ['facility_id', 'date', 'time_from', 'time_to', 'sport_id'],
+                                            order='time_from'):
+            holds.setdefault((hold['facility_id'][0], hold['date']), []).append((
+                hold['time_from'],
+                hold['time_to'],
+                False,
+                hold['sport_id'][0] if hold['sport_id'] else False,
+            ))
+        return holds
+
+    # ============================================================
+    # Public API
+    # ============================================================
+    @api.model
+    def _acquire(self, club_id, facility_id, date, time_from, time_to, sport_id=None, partner_id=None,
+                 ttl_minutes=DEFAULT_HOLD_TTL_MINUTES):
+        """
+        Hold a facility interval for `ttl_minutes`.
+        The slot checks lock the facility day, so two customers can never hold
+        or book overlapping intervals concurrently.
+        """
+        ttl_minutes = int(ttl_minutes or DEFAULT_HOLD_TTL_MINUTES)
+        if not 0 < ttl_minutes <= MAX_HOLD_TTL_MINUTES:
+            raise ValidationError(_("The hold duration must be between 1 and %s minutes.") % MAX_HOLD_TTL_MINUTES)
+
+        vals = {
+            'club_id': club_id,
+            'facility_id': facility_id,
+            'sport_id': sport_id or False,
+            'date': fields.Date.to_date(date),
+            'time_from': float(time_from),
+            'time_to': float(time_to),
+        }
+        if vals['time_from'] >= vals['time_to']:
+            raise ValidationError(_("Start time must be earlier than end time."))
+        conflicts = self.env['sport.club.reservation']._check_slots_batch({0: vals})
+        if conflicts:
+            raise ValidationError(conflicts[0][1])
+
+        # Expired holds still count for the exclusion constraint until they are purged
+        self.flush_model()
+        self.env.cr.execute("""
+            DELETE FROM sport_club_slot_hold
+             WHERE facility_id = %s
+               AND date = %s
+               AND expires_at <= %s
+        """, (facility_id, vals['date'], fields.Datetime.now()))
+        self.invalidate_model()
+        try:
+            with self.env.cr.savepoint():
+                return self.sudo().create(dict(
+                    vals,
+                    partner_id=partner_id or False,
+                    expires_at=fields.Datetime.now() + timedelta(minutes=ttl_minutes),
+                ))
+        except errors.ExclusionViolation:
+            raise ValidationError(_("The selected time is currently held by another customer."))
+
+    @api.model
+    def _find_by_token(self, token):
+        return self.sudo().search([('token', '=', token)], limit=1) if token else self.browse()
+
+    @api.model
+    def _release(self, token):
+        hold = self._find_by_token(token)
+        hold.unlink()
+        return bool(hold)
+
+    # ============================================================
+    # Cron
+    # ============================================================
+    @api.model
+    def _cron_purge_expired_holds(self):
+        """Delete every expired hold with a single statement."""
+        self.env.cr.execute(
+            "DELETE FROM sport_club_slot_hold WHERE expires_at <= %s",
+            (fields.Datetime.now(),),
+        )
+        purged = self.env.cr.rowcount
+        self.invalidate_model()
+        _logger.info("Slot holds: %s expired holds purged.", purged)
+        return purged
@@ -0,0 +1,217 @@
+import json
+import logging
+from odoo import api, fields, models, _
+from .sport_club_availability import ACTIVE_RESERVATION_STATES
+
+_logger = logging.getLogger(__name__)
+
+# Reservation fields that move a booking in or out of the occupancy table
+OCCUPANCY_FIELDS = ('facility_id', 'sport_id', 'date', 'time_from', 'time_to', 'state', 'active')
+
+
+class SportClubSlotOccupancy(models.Model):
+    """
+    Model: Slot Occupancy
+    ---------------------
+    Materialized busy intervals of a facility for one day.
+    Each row holds the active reservations of a (facility, date) pair as a
+    sorted list of [time_from, time_to, reservation_id, sport_id] entries, so
+    availability checks become a single indexed lookup.
+    The table is maintained incrementally by sport.club.reservation and can be
+    rebuilt from scratch at any time.
+    """
+    _name = "sport.club.slot.occupancy"
+    _description = "Facility Slot Occupancy"
+    _order = "date, facility_id"
+
+    facility_id = fields.Many2one(
+        comodel_name="sport.club.facility",
+        string="Facility",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    date = fields.Date(
+        string="Date",
+        required=True,
+        index=True,
+    )
+    intervals = fields.Json(
+        string="Busy Intervals",
+        help="Sorted [time_from, time_to, reservation_id, sport_id] entries of the active reservations."
+    )
+
+    _sql_constraints = [
+        (
+            "unique_facility_date",
+            "unique(facility_id, date)",
+            "Only one occupancy row is allowed per facility and date."
+        ),
+    ]
+
+    # ============================================================
+    # Computation
+    # ============================================================
+    @api.model
+    def _compute_intervals(self, keys):
+        """
+        Build the busy intervals of the given (facility_id, date) keys
+        from sport.club.reservation with a single query.
+        :return: dict {(facility_id, date): [[from, to, reservation_id, sport_id]]}
+        """
+        keys = {key for key in keys if key[0] and key[1]}
+        result = {key: [] for key in keys}
+        if not keys:
+            return result
+        reservations = self.env['sport.club.reservation'].sudo().search_read([
+            ('facility_id', 'in', list({key[0] for key in keys})),
+            ('date', 'in', list({key[1] for key in keys})),
+            ('state', 'in', list(ACTIVE_RESERVATION_STATES)),
+        ], ['facility_id', 'sport_id', 'date', 'time_from', 'time_to'], order='time_from, time_to, id')
+        for res in reservations:
+            key = (res['facility_id'][0], res['date'])
+            if key in result:
+                result[key].append([
+                    res['time_from'],
+                    res['time_to'],
+                    res['id'],
+                    res['sport_id'][0] if res['sport_id'] else False,
+                ])
+        return result
+
+    @api.model
+    def _refresh(self, keys):
+        """
+        Recompute the occupancy rows of the given (facility_id, date) keys.
+        Rows are written with a single upsert, so concurrent first bookings of a
+        facility day cannot collide on the unique constraint. Two transactions
+        booking the same facility day both rewrite its row, even when their slots
+        do not overlap: the second one fails with a serialization error and must
+        be retried as a whole. Odoo does that for RPC calls and cron jobs; the
+        API routes re-raise it (see `reraise_concurrency_error`) so HTTP requests
+        are retried too.
+        """
+        expected = self._compute_intervals(keys)
+        if not expected:
+            return
+        self.flush_model()
+        filled = {key: intervals for key, intervals in expected.items() if intervals}
+        empty = [key for key, intervals in expected.items() if not intervals]
+        if filled:
+            self.env.cr.execute("""
+                INSERT INTO sport_club_slot_occupancy
+                       (facility_id, date, intervals, create_uid, create_date, write_uid, write_date)
+                SELECT facility_id, date, intervals, %(uid)s, %(now)s, %(uid)s, %(now)s
+                  FROM unnest(%(facility_ids)s::int[], %(dates)s::date[], %(intervals)s::jsonb[])
+                       AS v(facility_id, date, intervals)
+                ON CONFLICT (facility_id, date) DO UPDATE
+                   SET intervals = EXCLUDED.intervals,
+                       write_uid = EXCLUDED.write_uid,
+                       write_date = EXCLUDED.write_date
+                 WHERE sport_club_slot_occupancy.intervals IS DISTINCT FROM EXCLUDED.intervals
+            """, {
+                'uid': self.env.uid,
+                'now': fields.Datetime.now(),
+                'facility_ids': [key[0] for key in filled],
+                'dates': [key[1] for key in filled],
+                'intervals': [json.dumps(intervals) for intervals in filled.values()],
+            })
+        if empty:
+            self.env.cr.execute("""
+                DELETE FROM sport_club_slot_occupancy o
+                 USING unnest(%s::int[], %s::date[]) AS v(facility_id, date)
+                 WHERE o.facility_id = v.facility_id
+                   AND o.date = v.date
+            """, ([key[0] for key in empty], [key[1] for key in empty]))
+        self.invalidate_model()
+
+    # ============================================================
+    # Lookup
+    # ============================================================
+    @api.model
+    def _get_stored_intervals(self, facility_ids, date_from, date_to=None):
+        """
+        Stored occupancy of several facilities over a date range, unfiltered.
+        :return: dict {(facility_id, date): [[time_from, time_to, reservation_id, sport_id]]}
+        """
+        rows = self.sudo().search_read([
+            ('facility_id', 'in', list(facility_ids)),
+            ('date', '>=', date_from),
+            ('date', '<=', date_to or date_from),
+        ], ['facility_id', 'date', 'intervals'])
+        return {(row['facility_id'][0], row['date']): row['intervals'] or [] for row in rows}
+
+    @api.model
+    def _get_busy_intervals(self, facility_ids, date_from, date_to=None, sport_id=None, exclude_ids=None):
+        """
+        Busy intervals of several facilities over a date range.
+        :return: dict {(facility_id, date): [(time_from, time_to, reservation_id)]}
+        """
+        exclude_ids = set(exclude_ids or [])
+        return {
+            key: [
+                (interval[0], interval[1], interval[2])
+                for interval in intervals
+                if interval[2] not in exclude_ids and (not sport_id or interval[3] == sport_id)
+            ]
+            for key, intervals in self._get_stored_intervals(facility_ids, date_from, date_to).items()
+        }
+
+    # ============================================================
+    # Rebuild / Consistency
+    # ============================================================
+    @api.model
+    def _expected_keys(self, date_from):
+        groups = self.env['sport.club.reservation'].sudo()._read_group([
+            ('date', '>=', date_from),
+            ('state', 'in', list(ACTIVE_RESERVATION_STATES)),
+        ], ['facility_id', 'date:day'])
+        return {(facility.id, date) for facility, date in groups if facility}
+
+    @api.model
+    def _rebuild_occupancy(self):
+        """Drop every occupancy row and rebuild the table from the upcoming active reservations."""
+        today = fields.Date.context_today(self)
+        self.sudo().search([]).unlink()
+        keys = self._expected_keys(today)
+        self._refresh(keys)
+        _logger.info("Slot occupancy rebuilt for %s facility days.", len(keys))
+        return len(keys)
+
+    @api.model
+    def _verify_occupancy(self):
+        """
+        Compare the stored occupancy of the upcoming days with the reservations.
+        :return: set of the inconsistent (facility_id, date) keys
+        """
+        today = fields.Date.context_today(self)
+        stored = {
+            (row['facility_id'][0], row['date']): row['intervals'] or []
+            for row in self.sudo().search_read([('date', '>=', today)], ['facility_id', 'date', 'intervals'])
+        }
+        keys = self._expected_keys(today) | set(stored)
+        expected = self._compute_intervals(keys)
+        return {key for key in keys if expected.get(key, []) != stored.get(key, [])}
+
+    @api.model
+    def _cron_check_occupancy(self):
+        """Heal inconsistent rows and drop the rows of past days."""
+        today = fields.Date.context_today(self)
+        self.sudo().search([('date', '<', today)]).unlink()
+        mismatches = self._verify_occupancy()
+        if mismatches:
+            _logger.warning("Slot occupancy out of sync for %s facility days, refreshing.", len(mismatches))
+            self._refresh(mismatches)
+        return len(mismatches)
+
+    def action_rebuild_occupancy(self):
+        count = self._rebuild_occupancy()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'type': 'success',
+                'message': _("Slot occupancy rebuilt for %s facility days.") % count,
+                'sticky': False,
+            },
+        }
@@ -0,0 +1,78 @@
+/** @odoo-module **/
+
+import { Component, onWillStart, useState } from "@odoo/owl";
+import { registry } from "@web/core/registry";
+import { useService } from "@web/core/utils/hooks";
+
+/**
+ * Hour-by-day occupancy heatmap of the facilities of a club over a month.
+ * Percentages are computed server side by sport.club.occupancy.heatmap.
+ */
+export class OccupancyHeatmap extends Component {
+    static template = "sporting_club_reservation_service.OccupancyHeatmap";
+    static props = ["*"];
+
+    setup() {
+        this.orm = useService("orm");
+        this.notification = useService("notification");
+        const today = new Date();
+        this.state = useState({
+            clubs: [],
+            clubId: false,
+            month: `${today.getFullYear()}-${String(today.getMonth() + 1).padStart(2, "0")}`,
+            data: null,
+            loading: false,
+        });
+        onWillStart(async () => {
+            this.state.clubs = await this.orm.searchRead("sport.club.model", [], ["name"], { order: "name" });
+            if (this.state.clubs.length) {
+                this.state.clubId = this.state.clubs[0].id;
+                await this.loadHeatmap();
+            }
+        });
+    }
+
+    get dateRange() {
+        const [year, month] = this.state.month.split("-").map(Number);
+        const lastDay = new Date(year, month, 0).getDate();
+        const prefix = `${year}-${String(month).padStart(2, "0")}`;
+        return [`${prefix}-01`, `${prefix}-${String(lastDay).padStart(2, "0")}`];
+    }
+
+    async loadHeatmap() {
+        if (!this.state.clubId || !this.state.month) {
+            this.state.data = null;
+            return;
+        }
+        const [dateFrom, dateTo] = this.dateRange;
+        this.state.loading = true;
+        try {
+            this.state.data = await this.orm.call("sport.club.occupancy.heatmap", "get_heatmap_data", [
+                this.state.clubId,
+                dateFrom,
+                dateTo,
+            ]);
+        } catch (error) {
+            this.state.data = null;
+            this.notification.add(error.data?.message || error.message, { type: "danger" });
+        } finally {
+            this.state.loading = false;
+        }
+    }
+
+    async onClubChange(ev) {
+        this.state.clubId = parseInt(ev.target.value) || false;
+        await this.loadHeatmap();
+    }
+
+    async onMonthChange(ev) {
+        this.state.month = ev.target.value;
+        await this.loadHeatmap();
+    }
+
+    cellStyle(value) {
+        return `background-color: rgba(220, 53, 69, ${(value / 100).toFixed(2)});`;
+    }
+}
+
+registry.category("actions").add("sport_club_occupancy_heatmap", OccupancyHeatmap);
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+from . import test_helpers
+from . import test_availability
+from . import test_reservation_overlap
+from . import test_slot_hold
+from . import test_reservation_job
+from . import test_promotion_coupon
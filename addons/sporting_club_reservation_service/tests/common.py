@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+from odoo import fields
+from odoo.tests.common import TransactionCase
+
+
+def create_club_fixture(env, prefix='Test'):
+    """
+    Club with one facility whose calendar offers 10-11 and 11-12 every day.
+    :return: dict with the club, facility, calendar, sport, owner and a player
+    """
+    country = env.ref('base.eg')
+    governorate = env['res.country.state'].create({
+        'name': '%s Governorate' % prefix,
+        'code': '%s-GV' % prefix[:3].upper(),
+        'country_id': country.id,
+    })
+    city = env['res.country.state.cities'].create({
+        'name_en': '%s City' % prefix,
+        'name_ar': '%s City' % prefix,
+        'state_id': governorate.id,
+    })
+    owner = env['res.users'].create({
+        'name': '%s Club Owner' % prefix,
+        'login': '%s_club_owner' % prefix.lower(),
+        'is_club_owner': True,
+    })
+    sport = env['sport.club.sports'].create({'name': '%s Padel' % prefix})
+    club = env['sport.club.model'].create({
+        'name': '%s Club' % prefix,
+        'owner_id': owner.id,
+        'country_id': country.id,
+        'governorate_id': governorate.id,
+        'city_id': city.id,
+        'street': '%s Street' % prefix,
+        'sport_ids': [(6, 0, sport.ids)],
+    })
+    facility = env['sport.club.facility'].create({
+        'name': '%s Court' % prefix,
+        'facility_type': 'court',
+        'sport_club_id': club.id,
+    })
+    calendar = env['sport.club.calendar'].create({
+        'name': '%s Calendar' % prefix,
+        'club_id': club.id,
+        'facility_id': facility.id,
+        'line_ids': [
+            (0, 0, {'day_of_week': str(day), 'start_time': start, 'end_time': end})
+            for day in range(7) for start, end in ((10.0, 11.0), (11.0, 12.0))
+        ],
+    })
+    return {
+        'governorate': governorate,
+        'city': city,
+        'owner': owner,
+        'sport': sport,
+        'club': club,
+        'facility': facility,
+        'calendar': calendar,
+        'partner': env['res.partner'].create({'name': '%s Player' % prefix}),
+        # Far enough in the future for the "not before now" cut-offs
+        'day': fields.Date.today() + timedelta(days=30),
+    }
+
+
+class SportClubCommon(TransactionCase):
+    """Test case running on the fixture of create_club_fixture()."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Club creation geolocates its address partner; stay offline
+        cls.classPatch(type(cls.env['res.partner']), 'geo_localize', lambda self: True)
+        for name, record in create_club_fixture(cls.env).items():
+            setattr(cls, name, record)
+
+    def _slot_vals(self, time_from, time_to, **kwargs):
+        return dict({
+            'club_id': self.club.id,
+            'facility_id': self.facility.id,
+            'sport_id': self.sport.id,
+            'date': self.day,
+            'time_from': time_from,
+            'time_to': time_to,
+        }, **kwargs)
+
+    def _create_reservation(self, time_from, time_to, **kwargs):
+        return self.env['sport.club.reservation'].create(self._slot_vals(
+            time_from, time_to, player_id=self.partner.id, **kwargs
+        ))
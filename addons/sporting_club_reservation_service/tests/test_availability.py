@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from odoo.tests.common import tagged
+from ..models.sport_club_availability import local_to_utc
+from .common import SportClubCommon
+
+
+@tagged('post_install', '-at_install')
+class TestNextFreeWindows(SportClubCommon):
+
+    def _find_windows(self, duration):
+        return self.env['sport.club.availability']._find_next_free_windows(
+            self.club.id, self.sport.id, duration, date_from=self.day, horizon_days=1, limit=10,
+        )
+
+    def test_windows_fit_one_slot(self):
+        windows = self._find_windows(1.0)
+        self.assertEqual([(window[1], window[3]) for window in windows], [(10.0, 11.0), (11.0, 12.0)])
+
+    def test_windows_never_span_adjacent_slots(self):
+        # 10-12 would need both slots, which the booking checks refuse
+        self.assertFalse(self._find_windows(2.0))
+
+    def test_windows_are_bookable(self):
+        Reservation = self.env['sport.club.reservation']
+        for day, time_from, facility_id, time_to in self._find_windows(0.5):
+            conflicts = Reservation._check_slots_batch({0: self._slot_vals(
+                time_from, time_to, facility_id=facility_id, date=day,
+            )})
+            self.assertFalse(conflicts, "Suggested window %s-%s is refused by the booking checks" % (time_from, time_to))
+
+    def test_booked_slot_is_skipped(self):
+        self._create_reservation(10.0, 11.0, state='confirmed')
+        windows = self._find_windows(1.0)
+        self.assertEqual([(window[1], window[3]) for window in windows], [(11.0, 12.0)])
+
+
+@tagged('post_install', '-at_install')
+class TestClubTimezone(SportClubCommon):
+
+    def test_closures_use_the_club_timezone(self):
+        tz = self.club._get_tz()
+        self.env['sport.club.calendar.exception'].create({
+            'calendar_template_id': self.calendar.id,
+            'date_from': local_to_utc(self.day, 10.0, tz),
+            'date_to': local_to_utc(self.day, 11.0, tz),
+            'is_closed': True,
+        })
+        for user_tz in ('UTC', 'Asia/Tokyo', 'America/New_York'):
+            Availability = self.env['sport.club.availability'].with_context(tz=user_tz)
+            self.assertTrue(Availability._is_closed(self.calendar.id, self.day, 10.0, 11.0))
+            self.assertFalse(Availability._is_closed(self.calendar.id, self.day, 11.0, 12.0))
+
+    def test_interval_bounds_follow_the_club_timezone(self):
+        reservation = self._create_reservation(10.0, 11.0)
+        self.assertEqual(reservation.start_at, local_to_utc(self.day, 10.0, self.club._get_tz()))
+        self.club.tz = 'UTC'
+        self.assertEqual(reservation.start_at.hour, 10)
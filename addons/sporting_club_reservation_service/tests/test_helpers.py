@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from odoo.tests.common import BaseCase, tagged
+from ..models.sport_club_availability import (
+    find_overlap, index_overlaps, merge_intervals, sweep_free_slots, sweep_overlapping_keys,
+)
+from ..models.sport_club_calendar_model import template_day_contains
+from ..models.sport_club_occupancy_heatmap import rasterize_occupancy
+
+
+@tagged('post_install', '-at_install')
+class TestIntervalHelpers(BaseCase):
+
+    def test_merge_intervals(self):
+        self.assertEqual(merge_intervals([]), [])
+        self.assertEqual(
+            merge_intervals([(3, 4), (1, 2), (2, 2.5, 'extra'), (5, 6), (5.5, 7), (5.6, 5.8)]),
+            [(1, 2.5), (3, 4), (5, 7)],
+        )
+
+    def test_sweep_overlapping_keys(self):
+        slots = [(11, 12, 'd'), (8, 9, 'a'), (10, 11, 'c'), (9, 10, 'b')]
+        self.assertEqual(sweep_overlapping_keys(slots, []), set())
+        self.assertEqual(sweep_overlapping_keys(slots, [(9.5, 10.5, 1)]), {'b', 'c'})
+        # Touching intervals do not overlap
+        self.assertEqual(sweep_overlapping_keys(slots, [(7, 8, 1), (12, 13, 2)]), set())
+        self.assertEqual(sweep_overlapping_keys(slots, [(8.5, 8.6, 1), (11.9, 12, 2)]), {'a', 'd'})
+
+    def test_sweep_free_slots(self):
+        slots = [(11, 12, 'd'), (8, 9, 'a'), (10, 11, 'c'), (9, 10, 'b')]
+        self.assertEqual(sweep_free_slots(slots, [(9, 11, 1)]), [(8, 9, 'a'), (11, 12, 'd')])
+
+    def test_find_overlap(self):
+        busy = [(8, 9, 1), (10, 11, 2)]
+        self.assertEqual(find_overlap(busy, 10.5, 12), (10, 11, 2))
+        self.assertIsNone(find_overlap(busy, 9, 10))
+
+    def test_index_overlaps(self):
+        index = ((1, 5), (2, 6))
+        self.assertFalse(index_overlaps(((), ()), 0, 10))
+        self.assertTrue(index_overlaps(index, 1.5, 1.7))
+        self.assertTrue(index_overlaps(index, 0, 1.5))
+        self.assertTrue(index_overlaps(index, 4, 5.5))
+        self.assertFalse(index_overlaps(index, 0, 1))
+        self.assertFalse(index_overlaps(index, 2, 5))
+        self.assertFalse(index_overlaps(index, 6, 7))
+
+    def test_template_day_contains(self):
+        # Slots 8-12, 10-11 and 13-14 compiled as (starts, ends, max_ends, line_ids)
+        day = ((8, 10, 13), (12, 11, 14), (12, 12, 14), (1, 2, 3))
+        self.assertTrue(template_day_contains(day, 8, 12))
+        self.assertTrue(template_day_contains(day, 10.5, 11.5))
+        self.assertTrue(template_day_contains(day, 13, 14))
+        self.assertFalse(template_day_contains(day, 7, 8))
+        self.assertFalse(template_day_contains(day, 11.5, 13.5))
+        self.assertFalse(template_day_contains(day, 12, 13))
+        self.assertFalse(template_day_contains(((), (), (), ()), 8, 9))
+
+
+@tagged('post_install', '-at_install')
+class TestHeatmapRasterizer(BaseCase):
+
+    def _rasterize(self, rows, facility_count=1, day_count=1):
+        facility_idx, day_idx, time_from, time_to = (np.array(column) for column in zip(*rows))
+        return rasterize_occupancy(
+            facility_idx.astype(np.intp), day_idx.astype(np.intp),
+            time_from.astype(float), time_to.astype(float),
+            facility_count, day_count,
+        )
+
+    def test_partial_hours(self):
+        grid = self._rasterize([(0, 0, 10.0, 11.5)])
+        self.assertEqual(grid.shape, (1, 1, 24))
+        self.assertEqual(grid[0, 0, 10], 100.0)
+        self.assertEqual(grid[0, 0, 11], 50.0)
+        self.assertEqual(grid[0, 0, 9], 0.0)
+        self.assertEqual(grid[0, 0, 12], 0.0)
+
+    def test_overlaps_are_not_counted_twice(self):
+        grid = self._rasterize([(0, 0, 10.0, 11.0), (0, 0, 10.5, 11.0)])
+        self.assertEqual(grid[0, 0, 10], 100.0)
+
+    def test_cells_are_independent(self):
+        grid = self._rasterize([(1, 0, 8.0, 9.0), (0, 1, 23.75, 24.0), (0, 0, 12.0, 12.0)],
+                               facility_count=2, day_count=2)
+        self.assertEqual(grid[1, 0, 8], 100.0)
+        self.assertEqual(grid[0, 1, 23], 25.0)
+        self.assertEqual(grid[0, 0].sum(), 0.0)
+        self.assertEqual(grid[1, 1].sum(), 0.0)
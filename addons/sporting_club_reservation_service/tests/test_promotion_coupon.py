@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from odoo.exceptions import ValidationError
+from odoo.tests.common import tagged
+from .common import SportClubCommon
+
+
+@tagged('post_install', '-at_install')
+class TestPromotionCoupon(SportClubCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.promotion = cls.env['sport.club.promotion'].create({
+            'name': 'Test Campaign',
+            'club_id': cls.club.id,
+            'discount_type': 'percent',
+            'discount_value': 10.0,
+        })
+        cls.coupons = cls.promotion._generate_coupons(2)
+
+    def test_redeem_applies_promotion(self):
+        coupon = self.coupons[0]
+        reservation = self._create_reservation(10.0, 11.0, coupon_code=coupon.code)
+        self.assertEqual(reservation.coupon_id, coupon)
+        self.assertEqual(reservation.promotion_id, self.promotion)
+        self.assertEqual(coupon.reservation_id, reservation)
+        self.assertTrue(coupon.used)
+
+    def test_coupon_is_single_use(self):
+        coupon = self.coupons[0]
+        self._create_reservation(10.0, 11.0, coupon_code=coupon.code)
+        with self.assertRaises(ValidationError):
+            self._create_reservation(11.0, 12.0, coupon_code=coupon.code)
+
+    def test_unknown_coupon(self):
+        with self.assertRaises(ValidationError):
+            self._create_reservation(10.0, 11.0, coupon_code='NOPE-NOPE-NOPE')
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from odoo.exceptions import ValidationError
+from odoo.tests.common import tagged
+from ..models.sport_club_reservation_job import JOB_MAX_ATTEMPTS
+from .common import SportClubCommon
+
+
+@tagged('post_install', '-at_install')
+class TestReservationJob(SportClubCommon):
+
+    def test_request_queues_side_effects(self):
+        reservation = self._create_reservation(10.0, 11.0)
+        reservation.action_request()
+        self.assertEqual(reservation.state, 'requested')
+        self.assertEqual(sorted(reservation.job_ids.mapped('step')), ['owner_activity', 'sale_order'])
+        self.assertEqual(reservation.job_state, 'pending')
+
+        reservation.job_ids._process()
+        self.assertEqual(set(reservation.job_ids.mapped('state')), {'done'})
+        self.assertEqual(reservation.job_state, 'done')
+        self.assertTrue(reservation.sale_order_id)
+
+    def test_request_over_usage_limit_is_refused(self):
+        promotion = self.env['sport.club.promotion'].create({
+            'name': 'Test Limited',
+            'club_id': self.club.id,
+            'discount_type': 'percent',
+            'discount_value': 10.0,
+            'usage_limit': 1,
+        })
+        first = self._create_reservation(10.0, 11.0, promotion_id=promotion.id)
+        second = self._create_reservation(11.0, 12.0, promotion_id=promotion.id)
+        first.action_request()
+        self.assertEqual(promotion.usage_count, 1)
+        with self.assertRaises(ValidationError):
+            second.action_request()
+        self.assertEqual(second.state, 'draft')
+        self.assertFalse(second.job_ids)
+
+    def test_failed_invoice_reverts_confirmation(self):
+        reservation = self._create_reservation(10.0, 11.0)
+        reservation.action_request()
+        reservation.action_confirm()
+        # The sale order job has not run, so invoicing fails until the job gives up
+        job = reservation.job_ids.filtered(lambda j: j.step == 'invoice')
+        job.attempts = JOB_MAX_ATTEMPTS - 1
+        job._process()
+        self.assertEqual(job.state, 'failed')
+        self.assertEqual(reservation.job_state, 'failed')
+        self.assertEqual(reservation.state, 'requested')
+
+    def test_failed_job_is_retried_later(self):
+        reservation = self._create_reservation(10.0, 11.0)
+        reservation.action_request()
+        reservation.action_confirm()
+        job = reservation.job_ids.filtered(lambda j: j.step == 'invoice')
+        job._process()
+        self.assertEqual((job.state, job.attempts), ('pending', 1))
+        self.assertTrue(job.last_error)
+        self.assertEqual(reservation.state, 'confirmed')
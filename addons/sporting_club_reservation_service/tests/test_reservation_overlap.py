@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from psycopg2 import errors
+from odoo.exceptions import ValidationError
+from odoo.tests.common import tagged
+from odoo.tools import mute_logger
+from .common import SportClubCommon
+
+
+@tagged('post_install', '-at_install')
+class TestReservationOverlap(SportClubCommon):
+
+    def test_overlapping_reservation_is_rejected(self):
+        self._create_reservation(10.0, 11.0, state='confirmed')
+        with self.assertRaises(ValidationError):
+            self._create_reservation(10.5, 11.0, state='requested')
+
+    def test_adjacent_and_cancelled_reservations_are_accepted(self):
+        self._create_reservation(10.0, 11.0, state='cancelled')
+        self._create_reservation(10.0, 11.0, state='confirmed')
+        self.assertTrue(self._create_reservation(11.0, 12.0, state='confirmed'))
+
+    def test_overlap_inside_a_batch_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            self.env['sport.club.reservation'].create([
+                self._slot_vals(10.0, 11.0, state='confirmed'),
+                self._slot_vals(10.5, 12.0, state='confirmed'),
+            ])
+
+    def test_exclusion_constraint(self):
+        self._create_reservation(10.0, 11.0, state='confirmed')
+        other = self._create_reservation(11.0, 12.0, state='confirmed')
+        other.flush_recordset()
+        # Bypass the ORM checks: the database itself must refuse the overlap
+        with mute_logger('odoo.sql_db'), self.assertRaises(errors.ExclusionViolation), self.env.cr.savepoint():
+            self.env.cr.execute("UPDATE sport_club_reservation SET time_from = 10.5 WHERE id = %s", (other.id,))
+        other.invalidate_recordset()
+        other.state = 'cancelled'
+        other.flush_recordset()
+        self.env.cr.execute("UPDATE sport_club_reservation SET time_from = 10.5 WHERE id = %s", (other.id,))
+
+    def test_exclusion_constraint_without_sport(self):
+        self._create_reservation(10.0, 11.0, state='confirmed', sport_id=False)
+        other = self._create_reservation(11.0, 12.0, state='confirmed', sport_id=False)
+        other.flush_recordset()
+        with mute_logger('odoo.sql_db'), self.assertRaises(errors.ExclusionViolation), self.env.cr.savepoint():
+            self.env.cr.execute("UPDATE sport_club_reservation SET time_from = 10.5 WHERE id = %s", (other.id,))
+
+
+@tagged('post_install', '-at_install')
+class TestCheckSlotsBatch(SportClubCommon):
+
+    def _check(self, *vals_list, **kwargs):
+        conflicts = self.env['sport.club.reservation']._check_slots_batch(dict(enumerate(vals_list)), **kwargs)
+        return {index: conflict[0] for index, conflict in conflicts.items()}
+
+    def test_items_are_checked_against_the_calendar(self):
+        self.assertEqual(self._check(self._slot_vals(9.0, 10.0), self._slot_vals(10.5, 11.5)),
+                         {0: 'slot', 1: 'slot'})
+
+    def test_items_are_checked_against_each_other(self):
+        self.assertEqual(self._check(self._slot_vals(10.0, 11.0), self._slot_vals(10.0, 10.5),
+                                     self._slot_vals(11.0, 12.0)),
+                         {1: 'batch'})
+
+    def test_items_are_checked_against_stored_reservations(self):
+        reservation = self._create_reservation(10.0, 11.0, state='confirmed')
+        conflicts = self.env['sport.club.reservation']._check_slots_batch({0: self._slot_vals(10.0, 11.0)})
+        self.assertEqual(conflicts[0][0], 'booked')
+        self.assertEqual(conflicts[0][2], reservation.id)
+        self.assertFalse(self._check(self._slot_vals(11.0, 12.0)))
+
+    def test_closed_days_are_refused(self):
+        self.env['sport.club.calendar.exception'].create({
+            'calendar_template_id': self.calendar.id,
+            'date_from': self.env['sport.club.availability']._to_utc(self.day, 0.0, self.club._get_tz()),
+            'date_to': self.env['sport.club.availability']._to_utc(self.day, 24.0, self.club._get_tz()),
+            'is_closed': True,
+        })
+        self.assertEqual(self._check(self._slot_vals(10.0, 11.0)), {0: 'closed'})
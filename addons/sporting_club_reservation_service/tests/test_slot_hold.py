@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import patch
+from odoo import api, SUPERUSER_ID
+from odoo.exceptions import ValidationError
+from odoo.modules.registry import Registry
+from odoo.tests.common import BaseCase, get_db_name, tagged
+from .common import SportClubCommon, create_club_fixture
+
+
+@tagged('post_install', '-at_install')
+class TestSlotHold(SportClubCommon):
+
+    def _acquire(self, time_from, time_to, **kwargs):
+        return self.env['sport.club.slot.hold']._acquire(
+            self.club.id, self.facility.id, self.day, time_from, time_to, sport_id=self.sport.id, **kwargs
+        )
+
+    def test_hold_blocks_overlapping_hold(self):
+        self._acquire(10.0, 11.0)
+        with self.assertRaises(ValidationError):
+            self._acquire(10.0, 11.0)
+
+    def test_holds_only_block_their_sport(self):
+        self._acquire(10.0, 11.0)
+        # A hold without a sport does not collide with the sport's hold
+        self.assertTrue(self.env['sport.club.slot.hold']._acquire(
+            self.club.id, self.facility.id, self.day, 10.0, 11.0
+        ))
+        conflicts = self.env['sport.club.reservation']._check_slots_batch({
+            0: self._slot_vals(10.0, 11.0),
+            1: dict(self._slot_vals(10.0, 11.0), sport_id=False),
+        })
+        self.assertEqual(conflicts[0][0], 'held')
+        self.assertEqual(conflicts[1][0], 'held')
+
+    def test_hold_blocks_booking_until_released(self):
+        hold = self._acquire(10.0, 11.0)
+        Reservation = self.env['sport.club.reservation']
+        conflicts = Reservation._check_slots_batch({0: self._slot_vals(10.0, 11.0)})
+        self.assertEqual(conflicts[0][0], 'held')
+        self.assertFalse(Reservation._check_slots_batch({0: self._slot_vals(10.0, 11.0)}, [hold.token]))
+        self.env['sport.club.slot.hold']._release(hold.token)
+        self.assertFalse(Reservation._check_slots_batch({0: self._slot_vals(10.0, 11.0)}))
+
+    def test_expired_hold_does_not_block(self):
+        hold = self._acquire(10.0, 11.0)
+        hold.expires_at = hold.create_date
+        self.assertTrue(self._acquire(10.0, 11.0))
+        self.assertFalse(hold.exists())
+
+
+@tagged('post_install', '-at_install')
+class TestSlotHoldConcurrency(BaseCase):
+    """Two transactions whose snapshots predate each other's hold, as in concurrent API requests."""
+
+    def setUp(self):
+        super().setUp()
+        self.registry = Registry(get_db_name())
+        patcher = patch.object(self.registry['res.partner'], 'geo_localize', lambda self: True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        with self.registry.cursor() as cr:
+            fixture = create_club_fixture(api.Environment(cr, SUPERUSER_ID, {}), prefix='Concurrency')
+            self.fixture_ids = {name: record.id for name, record in fixture.items() if name != 'day'}
+            self.day = fixture['day']
+        self.addCleanup(self._drop_fixture)
+
+    def _drop_fixture(self):
+        with self.registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            env['sport.club.model'].browse(self.fixture_ids['club']).partner_address_id.unlink()
+            for name, model in (('club', 'sport.club.model'), ('sport', 'sport.club.sports'),
+                                ('partner', 'res.partner'), ('owner', 'res.users'),
+                                ('city', 'res.country.state.cities'), ('governorate', 'res.country.state')):
+                env[model].browse(self.fixture_ids[name]).unlink()
+
+    def _acquire(self, env, time_from, time_to):
+        return env['sport.club.slot.hold']._acquire(
+            self.fixture_ids['club'], self.fixture_ids['facility'], self.day, time_from, time_to, sport_id=self.fixture_ids['sport'],
+        )
+
+    def test_concurrent_overlapping_holds(self):
+        with self.registry.cursor() as cr1, self.registry.cursor() as cr2:
+            env1 = api.Environment(cr1, SUPERUSER_ID, {})
+            env2 = api.Environment(cr2, SUPERUSER_ID, {})
+            # Fix both snapshots before any lock is taken, like the API key lookup does
+            for cr in (cr1, cr2):
+                cr.execute("SELECT count(*) FROM sport_club_slot_hold")
+
+            self._acquire(env1, 10.0, 11.0)
+            cr1.commit()
+
+            # The second transaction does not see the first hold in its snapshot
+            self.assertFalse(env2['sport.club.slot.hold'].search_count([('facility_id', '=', self.fixture_ids['facility'])]))
+            with self.assertRaises(ValidationError):
+                self._acquire(env2, 10.5, 11.0)
+            cr2.rollback()
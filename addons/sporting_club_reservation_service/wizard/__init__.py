@@ -1,4 +1,5 @@
 from . import generate_calendar_times
+from . import promotion_coupon_generator
 from . import base_report_wizard
 from . import reservation_revenue_wizard
 from . import sport_club_reports
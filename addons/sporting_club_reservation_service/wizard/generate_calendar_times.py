@@ -1,6 +1,9 @@
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 
+# Decimal places kept on generated slot boundaries (well below one second)
+SLOT_PRECISION = 6
+
 
 class SportClubCalendarAvailableTimesGenerator(models.TransientModel):
     _name = 'sport.club.calendar.times.generator'
@@ -56,10 +59,30 @@ class SportClubCalendarAvailableTimesGenerator(models.TransientModel):
     # ============================================================
     # Core Logic
     # ============================================================
-    def _generate_available_times(self, day_code):
+    def _get_target_slots(self):
+        """
+        Split the start_time–end_time range into (start, end) slots of
+        split_time_period hours. Boundaries are computed from the slot index and
+        rounded, so repeated generations produce identical float values.
+        """
+        self.ensure_one()
+        slots = []
+        index = 0
+        current_time = self.start_time
+        while current_time < self.end_time:
+            next_time = round(self.start_time + (index + 1) * self.split_time_period, SLOT_PRECISION)
+            if next_time > self.end_time:
+                next_time = self.end_time  # Trim to end time if last slot is shorter
+            slots.append((round(current_time, SLOT_PRECISION), round(next_time, SLOT_PRECISION)))
+            current_time = next_time
+            index += 1
+        return slots
+
+    def _generate_available_times(self, day_codes):
         """
-        Generate availability slots for a single day.
-        It splits the start_time–end_time range into slots based on split_time_period.
+        Generate availability slots for the given days.
+        The target slots are diffed against the existing lines: unchanged lines keep
+        their ids, obsolete ones are removed and missing ones are created in one batch.
         """
         self.ensure_one()
 
@@ -70,27 +93,45 @@ class SportClubCalendarAvailableTimesGenerator(models.TransientModel):
         if self.split_time_period <= 0:
             raise ValidationError(_("Time Slot Duration must be greater than 0."))
 
-        # Remove existing slots for that day to avoid duplicates
-        existing_lines = self.env['sport.club.calendar.line'].search([
+        target_slots = self._get_target_slots()
+        target = {(day_code, start, end) for day_code in day_codes for start, end in target_slots}
+
+        Line = self.env['sport.club.calendar.line'].with_context(
+            tracking_disable=True,
+            mail_create_nolog=True,
+            mail_notrack=True,
+            defer_calendar_cache_clear=True,
+        )
+        existing_lines = Line.search([
             ('calendar_template_id', '=', self.calendar_id.id),
-            ('day_of_week', '=', day_code),
+            ('day_of_week', 'in', list(day_codes)),
         ])
-        existing_lines.unlink()
 
-        # Generate new slots
-        current_time = self.start_time
-        while current_time < self.end_time:
-            next_time = current_time + self.split_time_period
-            if next_time > self.end_time:
-                next_time = self.end_time  # Trim to end time if last slot is shorter
-
-            self.env['sport.club.calendar.line'].create({
+        to_unlink = Line.browse()
+        for line in existing_lines:
+            key = (
+                line.day_of_week,
+                round(line.start_time, SLOT_PRECISION),
+                round(line.end_time, SLOT_PRECISION),
+            )
+            if key in target:
+                target.discard(key)
+            else:
+                to_unlink |= line
+
+        # Unlink first so recreated slots never hit the unique constraint
+        to_unlink.unlink()
+        Line.create([
+            {
                 'calendar_template_id': self.calendar_id.id,
                 'day_of_week': day_code,
-                'start_time': current_time,
-                'end_time': next_time,
-            })
-            current_time = next_time
+                'start_time': start,
+                'end_time': end,
+            }
+            for day_code, start, end in sorted(target)
+        ])
+        if to_unlink or target:
+            self.env['sport.club.calendar']._clear_calendar_caches()
 
     # ============================================================
     # Confirmation
@@ -102,12 +143,11 @@ class SportClubCalendarAvailableTimesGenerator(models.TransientModel):
         """
         self.ensure_one()
         if self.for_all_days:
-            for day_code in [str(i) for i in range(7)]:
-                self._generate_available_times(day_code)
+            self._generate_available_times([str(i) for i in range(7)])
         else:
             if not self.week_days:
                 raise ValidationError(_("Please select a day of the week or enable 'Apply to All Days'."))
-            self._generate_available_times(self.week_days)
+            self._generate_available_times([self.week_days])
 
         return {
             'effect': {
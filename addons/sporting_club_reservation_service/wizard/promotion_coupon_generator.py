@@ -0,0 +1,40 @@
+from odoo import api, fields, models, _
+from odoo.exceptions import ValidationError
+
+MAX_COUPONS_PER_RUN = 100000
+
+
+class SportClubPromotionCouponGenerator(models.TransientModel):
+    _name = 'sport.club.promotion.coupon.generator'
+    _description = 'Generate Promotion Coupons Wizard'
+
+    # ============================================================
+    # Fields
+    # ============================================================
+    promotion_id = fields.Many2one(
+        comodel_name='sport.club.promotion',
+        string='Promotion',
+        required=True,
+        help='The promotion the generated coupons belong to.'
+    )
+
+    quantity = fields.Integer(
+        string='Number of Coupons',
+        required=True,
+        default=100,
+        help='How many single-use coupon codes to generate (e.g., 10000 for a campaign).'
+    )
+
+    # ============================================================
+    # Confirmation
+    # ============================================================
+    def confirm(self):
+        """Generate the coupons in one batch and open them."""
+        self.ensure_one()
+        if self.quantity <= 0:
+            raise ValidationError(_("The number of coupons must be greater than 0."))
+        if self.quantity > MAX_COUPONS_PER_RUN:
+            raise ValidationError(_("At most %s coupons can be generated at once.") % MAX_COUPONS_PER_RUN)
+
+        self.promotion_id._generate_coupons(self.quantity)
+        return self.promotion_id.action_view_coupons()
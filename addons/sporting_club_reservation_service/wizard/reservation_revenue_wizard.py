@@ -25,6 +25,15 @@ class ReservationRevenueWizard(models.TransientModel):
         comodel_name='sport.club.model',
         string="Club"
     )
+    payment_state = fields.Selection(
+        selection=[
+            ("unpaid", "Unpaid"),
+            ("partial", "Partially Paid"),
+            ("paid", "Paid"),
+            ("refunded", "Refunded"),
+        ],
+        string="Payment Status",
+    )
 
     # ---------------------------------------------------------------------
     # Domain Preparation
@@ -42,6 +51,8 @@ class ReservationRevenueWizard(models.TransientModel):
             domain.append(('club_id', '=', self.club_id.id))
         if self.sport_id:
             domain.append(('sport_id', '=', self.sport_id.id))
+        if self.payment_state:
+            domain.append(('payment_state', '=', self.payment_state))
         return domain
 
     def _prepare_all_data_based_on_domain(self, domain):